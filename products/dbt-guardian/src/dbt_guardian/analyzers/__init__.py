@@ -1,5 +1,14 @@
 """Gap detection and impact analysis."""
 
-from .coverage import ColumnGap, CoverageReport, TestCoverageAnalyzer, TestType
+from .coverage import ColumnGap, CoverageReport, CoverageStream, TestCoverageAnalyzer, TestType
+from .incremental import CoverageState, IncrementalCoverageAnalyzer
 
-__all__ = ["TestCoverageAnalyzer", "CoverageReport", "ColumnGap", "TestType"]
+__all__ = [
+    "TestCoverageAnalyzer",
+    "CoverageReport",
+    "CoverageStream",
+    "ColumnGap",
+    "TestType",
+    "IncrementalCoverageAnalyzer",
+    "CoverageState",
+]
@@ -4,12 +4,14 @@ Identifies columns that lack tests (not_null, unique, etc.) and prioritizes them
 based on column type, position, and model importance.
 """
 
-from dataclasses import dataclass
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from ..parsers.catalog import CatalogColumn, DbtCatalog
-from ..parsers.manifest import DbtColumn, DbtManifest, DbtModel
+from ..parsers.catalog import CatalogColumn, CatalogTable, DbtCatalog
+from ..parsers.manifest import DbtColumn, DbtManifest, DbtTest
 
 
 class TestType(str, Enum):
@@ -50,6 +52,208 @@ class CoverageReport:
         """Return gaps with priority 1-2."""
         return [g for g in self.gaps if g.priority <= 2]
 
+    def summary(self) -> Dict[str, Any]:
+        """JSON-serializable totals, without the gaps."""
+        return {
+            "total_models": self.total_models,
+            "total_columns": self.total_columns,
+            "tested_columns": self.tested_columns,
+            "coverage_percentage": self.coverage_percentage,
+            "total_gaps": len(self.gaps),
+            "high_priority_gaps": len(self.high_priority_gaps),
+        }
+
+    def to_dict(self, priority: int = 5) -> Dict[str, Any]:
+        """JSON-serializable summary with the gaps at or above ``priority``."""
+        return {
+            **self.summary(),
+            "gaps": [
+                {**asdict(gap), "suggested_tests": [t.value for t in gap.suggested_tests]}
+                for gap in self.gaps
+                if gap.priority <= priority
+            ],
+        }
+
+
+# (gaps, total columns, tested columns) for a model or a shard of models
+PartialCoverage = Tuple[List[ColumnGap], int, int]
+
+
+class CoverageStream:
+    """Gaps yielded model by model, with totals accumulated as they are produced.
+
+    Unlike ``CoverageReport`` the gaps are never held together, so memory stays
+    flat however many gaps a project has. Gaps come in manifest model order
+    (not sorted by priority) whatever ``jobs`` is; the totals are complete once
+    iteration finishes.
+    """
+
+    def __init__(
+        self,
+        analyzer: "TestCoverageAnalyzer",
+        manifest: DbtManifest,
+        catalog: Optional[DbtCatalog] = None,
+        jobs: int = 1,
+    ) -> None:
+        self._analyzer = analyzer
+        self._manifest = manifest
+        self._catalog = catalog
+        self._jobs = jobs
+        self.total_models = len(manifest.models)
+        self.total_columns = 0
+        self.tested_columns = 0
+        self.total_gaps = 0
+        self.high_priority_gaps = 0
+
+    def __iter__(self) -> Iterator[ColumnGap]:
+        for gaps, total, tested in self._partials():
+            self.total_columns += total
+            self.tested_columns += tested
+            self.total_gaps += len(gaps)
+            self.high_priority_gaps += sum(1 for g in gaps if g.priority <= 2)
+            yield from gaps
+
+    def _partials(self) -> Iterator[PartialCoverage]:
+        """Per-model results, or per-shard results from a process pool."""
+        manifest, catalog = self._manifest, self._catalog
+        if self._jobs > 1 and len(manifest.models) > 1:
+            yield from self._analyzer._iter_parallel(manifest, catalog, self._jobs)
+            return
+        for model_id in manifest.models:
+            catalog_table = catalog.tables.get(model_id) if catalog else None
+            yield self._analyzer.analyze_model(manifest, model_id, catalog_table)
+
+    @property
+    def coverage_percentage(self) -> float:
+        total = self.total_columns
+        return self.tested_columns / total * 100 if total > 0 else 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals in the shape of ``CoverageReport.summary``."""
+        return {
+            "total_models": self.total_models,
+            "total_columns": self.total_columns,
+            "tested_columns": self.tested_columns,
+            "coverage_percentage": self.coverage_percentage,
+            "total_gaps": self.total_gaps,
+            "high_priority_gaps": self.high_priority_gaps,
+        }
+
+
+class ColumnCategory(str, Enum):
+    """Name-based column categories, in the order they are checked."""
+
+    FOREIGN_KEY = "foreign_key"
+    PRIMARY_KEY = "primary_key"
+    TIMESTAMP = "timestamp"
+    STATUS = "status"
+    OTHER = "other"
+
+
+@dataclass(frozen=True)
+class ColumnTraits:
+    """Everything gap detection needs to know about a column's name."""
+
+    category: ColumnCategory
+    priority: int  # 1 (high) to 5 (low)
+    is_exact_key: bool  # "id" or "uuid"
+    ends_with_id: bool
+    has_timestamp: bool  # Matches a timestamp pattern
+    has_status: bool  # Matches a status/type pattern
+
+
+class ColumnClassifier:
+    """Classify column names with a single precompiled regex.
+
+    One match per column reports which of the ID, timestamp and status pattern
+    families occur anywhere in the name, replacing three substring sweeps.
+    """
+
+    EXACT_KEYS = {"id", "uuid"}
+    CRITICAL_TIMESTAMPS = {"created_at", "updated_at"}
+
+    def __init__(
+        self,
+        id_patterns: Set[str],
+        timestamp_patterns: Set[str],
+        status_patterns: Set[str],
+    ) -> None:
+        def lookahead(group: str, patterns: Set[str]) -> str:
+            alternation = "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+            return f"(?=(?P<{group}>.*?(?:{alternation})))?"
+
+        self._pattern = re.compile(
+            "^"
+            + lookahead("id", id_patterns)
+            + lookahead("timestamp", timestamp_patterns)
+            + lookahead("status", status_patterns),
+            re.DOTALL,
+        )
+
+    def classify(self, col_name: str, model_name: str) -> ColumnTraits:
+        """Classify a column of a model.
+
+        Args:
+            col_name: Column name
+            model_name: Name of the model the column belongs to
+
+        Returns:
+            Column traits
+        """
+        col_lower = col_name.lower()
+        model_lower = model_name.lower()
+        match = self._pattern.match(col_lower)
+        assert match is not None  # Every group is optional
+        has_id = match.group("id") is not None
+        has_timestamp = match.group("timestamp") is not None
+        has_status = match.group("status") is not None
+
+        # Foreign key patterns: ends with _id but prefix doesn't match model name
+        # (e.g., user_id in orders table is FK, but order_id in orders table is PK)
+        # Handle both singular and plural model names (orders/order, users/user)
+        ends_with_id = col_lower.endswith("_id")
+        col_prefix = col_lower[:-3] if ends_with_id else ""
+        is_own_key = bool(col_prefix) and (
+            col_prefix == model_lower  # exact match
+            or col_prefix == model_lower.rstrip("s")  # orders -> order
+            or col_prefix + "s" == model_lower  # user -> users
+        )
+        is_exact_key = col_lower in self.EXACT_KEYS
+
+        if ends_with_id and not is_own_key:
+            category = ColumnCategory.FOREIGN_KEY
+        elif has_id:
+            category = ColumnCategory.PRIMARY_KEY
+        elif has_timestamp:
+            category = ColumnCategory.TIMESTAMP
+        elif has_status:
+            category = ColumnCategory.STATUS
+        else:
+            category = ColumnCategory.OTHER
+
+        # Priority 1: primary keys (id, uuid, order_id in orders)
+        # Priority 2: foreign keys and critical timestamps
+        # Priority 3: status/type columns; 4: other timestamps; 5: everything else
+        if is_exact_key or is_own_key:
+            priority = 1
+        elif ends_with_id or col_lower in self.CRITICAL_TIMESTAMPS:
+            priority = 2
+        elif has_status:
+            priority = 3
+        elif has_timestamp:
+            priority = 4
+        else:
+            priority = 5
+
+        return ColumnTraits(
+            category=category,
+            priority=priority,
+            is_exact_key=is_exact_key,
+            ends_with_id=ends_with_id,
+            has_timestamp=has_timestamp,
+            has_status=has_status,
+        )
+
 
 class TestCoverageAnalyzer:
     """Analyze test coverage gaps in dbt projects."""
@@ -64,69 +268,80 @@ class TestCoverageAnalyzer:
     NULLABLE_TYPES = {"string", "text", "varchar", "timestamp", "date", "number", "float"}
     ID_TYPES = {"int", "integer", "bigint", "uuid"}
 
+    # Shards per worker process in parallel mode
+    SHARDS_PER_JOB = 4
+
+    # Manifest node fields read by analysis (incremental mode also hashes the
+    # checksum); pass as ManifestParser.parse(fields=...) to skip the rest
+    MANIFEST_FIELDS = frozenset({"name", "columns", "checksum"})
+
+    def __init__(self) -> None:
+        self._classifier = ColumnClassifier(
+            self.ID_PATTERNS, self.TIMESTAMP_PATTERNS, self.STATUS_PATTERNS
+        )
+        self._traits_cache: Dict[Tuple[str, str], ColumnTraits] = {}
+
     def analyze(
-        self, manifest: DbtManifest, catalog: Optional[DbtCatalog] = None
+        self,
+        manifest: DbtManifest,
+        catalog: Optional[DbtCatalog] = None,
+        jobs: int = 1,
     ) -> CoverageReport:
         """Analyze test coverage for a dbt project.
 
         Args:
             manifest: Parsed dbt manifest
             catalog: Optional parsed catalog (for warehouse column types)
+            jobs: Number of worker processes; models are sharded across workers
+                when > 1. The report is identical to a serial run.
 
         Returns:
             Coverage report with gaps and suggestions
         """
+        if jobs > 1 and len(manifest.models) > 1:
+            partials = list(self._iter_parallel(manifest, catalog, jobs))
+        else:
+            partials = [self._analyze_shard(manifest, catalog)]
+
+        return self.build_report(partials, total_models=len(manifest.models))
+
+    def stream(
+        self, manifest: DbtManifest, catalog: Optional[DbtCatalog] = None, jobs: int = 1
+    ) -> CoverageStream:
+        """Analyze lazily, yielding gaps as each model (or shard) is analyzed.
+
+        Args:
+            manifest: Parsed dbt manifest
+            catalog: Optional parsed catalog (for warehouse column types)
+            jobs: Number of worker processes; the gaps are identical to jobs=1
+
+        Returns:
+            An iterable of gaps in model order that accumulates the report totals
+        """
+        return CoverageStream(self, manifest, catalog, jobs)
+
+    def build_report(
+        self, partials: Iterable[PartialCoverage], total_models: int
+    ) -> CoverageReport:
+        """Combine per-model or per-shard results into a coverage report.
+
+        Partials must be given in manifest model order; the stable priority sort
+        then breaks ties exactly as a single serial pass would.
+
+        Args:
+            partials: (gaps, total columns, tested columns) tuples in model order
+            total_models: Number of models analyzed
+
+        Returns:
+            Coverage report with gaps sorted by priority
+        """
         gaps: List[ColumnGap] = []
         total_columns = 0
         tested_columns = 0
-
-        for model_id, model in manifest.models.items():
-            # Get catalog data if available
-            catalog_table = None
-            if catalog:
-                catalog_table = catalog.tables.get(model_id)
-
-            # Analyze each column
-            for col_name, column in model.columns.items():
-                total_columns += 1
-
-                # Get actual column type from catalog
-                col_type = column.data_type
-                if catalog_table and col_name in catalog_table.columns:
-                    col_type = catalog_table.columns[col_name].type
-
-                # Check if column has tests
-                existing_tests = column.tests
-                if existing_tests:
-                    tested_columns += 1
-
-                # Identify test gaps
-                suggested_tests = self._suggest_tests(
-                    col_name, col_type, existing_tests, model
-                )
-
-                if suggested_tests:
-                    # Infer parent table for relationship tests
-                    inferred_parent = None
-                    if TestType.RELATIONSHIPS in suggested_tests:
-                        inferred_parent = self.infer_parent_table(col_name)
-
-                    gaps.append(
-                        ColumnGap(
-                            model_name=model.name,
-                            column_name=col_name,
-                            column_type=col_type,
-                            existing_tests=existing_tests,
-                            suggested_tests=suggested_tests,
-                            priority=self._calculate_priority(
-                                col_name, col_type, suggested_tests, model
-                            ),
-                            rationale=self._build_rationale(
-                                col_name, col_type, suggested_tests
-                            ),
-                            inferred_parent_table=inferred_parent,
-                        )
-                    )
+        for partial_gaps, partial_total, partial_tested in partials:
+            gaps.extend(partial_gaps)
+            total_columns += partial_total
+            tested_columns += partial_tested
 
         # Calculate coverage
         coverage_pct = (tested_columns / total_columns * 100) if total_columns > 0 else 0
@@ -135,52 +350,202 @@ class TestCoverageAnalyzer:
         gaps.sort(key=lambda g: (g.priority, g.model_name, g.column_name))
 
         return CoverageReport(
-            total_models=len(manifest.models),
+            total_models=total_models,
             total_columns=total_columns,
             tested_columns=tested_columns,
             coverage_percentage=coverage_pct,
             gaps=gaps,
         )
 
-    def _suggest_tests(
+    def _iter_parallel(
+        self, manifest: DbtManifest, catalog: Optional[DbtCatalog], jobs: int
+    ) -> Iterator[PartialCoverage]:
+        """Analyze contiguous shards of models in a process pool.
+
+        Each worker receives only its models plus their test nodes and catalog
+        tables, not the whole project. Shard results are yielded in model order.
+        """
+        model_ids = list(manifest.models)
+        # Several shards per worker keeps the pool busy when model sizes vary
+        shard_size = max(1, -(-len(model_ids) // (jobs * self.SHARDS_PER_JOB)))
+
+        tests_by_model: Dict[str, Dict[str, DbtTest]] = {}
+        for test_id, test in manifest.tests.items():
+            tests_by_model.setdefault(test.model, {})[test_id] = test
+
+        shard_manifests = []
+        shard_catalogs = []
+        for start in range(0, len(model_ids), shard_size):
+            shard_ids = model_ids[start : start + shard_size]
+            shard_tests: Dict[str, DbtTest] = {}
+            for model_id in shard_ids:
+                shard_tests.update(tests_by_model.get(model_id, {}))
+            shard_manifests.append(
+                DbtManifest(
+                    models={model_id: manifest.models[model_id] for model_id in shard_ids},
+                    tests=shard_tests,
+                )
+            )
+            shard_catalogs.append(
+                DbtCatalog(
+                    tables={
+                        model_id: catalog.tables[model_id]
+                        for model_id in shard_ids
+                        if model_id in catalog.tables
+                    }
+                )
+                if catalog
+                else None
+            )
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map() yields results in submission order regardless of completion order
+            yield from executor.map(self._analyze_shard, shard_manifests, shard_catalogs)
+
+    def _analyze_shard(
+        self, manifest: DbtManifest, catalog: Optional[DbtCatalog]
+    ) -> PartialCoverage:
+        """Find gaps for every model in ``manifest``.
+
+        Args:
+            manifest: Parsed dbt manifest (or a shard of one)
+            catalog: Optional parsed catalog (for warehouse column types)
+
+        Returns:
+            Unsorted gaps in model order, total columns, tested columns
+        """
+        gaps: List[ColumnGap] = []
+        total_columns = 0
+        tested_columns = 0
+
+        for model_id in manifest.models:
+            # Get catalog data if available
+            catalog_table = catalog.tables.get(model_id) if catalog else None
+            model_gaps, model_total, model_tested = self.analyze_model(
+                manifest, model_id, catalog_table
+            )
+            gaps.extend(model_gaps)
+            total_columns += model_total
+            tested_columns += model_tested
+
+        return gaps, total_columns, tested_columns
+
+    def analyze_model(
         self,
-        col_name: str,
-        col_type: Optional[str],
-        existing_tests: List[str],
-        model: DbtModel,
-    ) -> List[TestType]:
-        """Suggest tests for a column based on name and type.
+        manifest: DbtManifest,
+        model_id: str,
+        catalog_table: Optional[CatalogTable] = None,
+    ) -> PartialCoverage:
+        """Find gaps for a single model.
+
+        Args:
+            manifest: Parsed dbt manifest containing the model and its test nodes
+            model_id: Unique ID of the model to analyze
+            catalog_table: Optional catalog entry (for warehouse column types)
+
+        Returns:
+            Unsorted gaps in column order, total columns, tested columns
+        """
+        model = manifest.models[model_id]
+        gaps: List[ColumnGap] = []
+        tested_columns = 0
+
+        # Analyze each column
+        for col_name, column in model.columns.items():
+            # Get actual column type from catalog
+            col_type = column.data_type
+            if catalog_table and col_name in catalog_table.columns:
+                col_type = catalog_table.columns[col_name].type
+
+            # Check if column has tests, inline or as separate test nodes
+            existing_tests = self._existing_tests(manifest, model_id, column)
+            if existing_tests:
+                tested_columns += 1
+
+            # Identify test gaps
+            traits = self.classify_column(col_name, model.name)
+            suggested_tests = self._suggest_tests(traits, existing_tests)
+
+            if suggested_tests:
+                # Infer parent table for relationship tests
+                inferred_parent = None
+                if TestType.RELATIONSHIPS in suggested_tests:
+                    inferred_parent = self.infer_parent_table(col_name)
+
+                gaps.append(
+                    ColumnGap(
+                        model_name=model.name,
+                        column_name=col_name,
+                        column_type=col_type,
+                        existing_tests=existing_tests,
+                        suggested_tests=suggested_tests,
+                        priority=self._calculate_priority(traits),
+                        rationale=self._build_rationale(traits, suggested_tests),
+                        inferred_parent_table=inferred_parent,
+                    )
+                )
+
+        return gaps, len(model.columns), tested_columns
+
+    def _existing_tests(
+        self, manifest: DbtManifest, model_id: str, column: DbtColumn
+    ) -> List[str]:
+        """Collect the test types already covering a column.
+
+        Combines tests declared on the column itself with test nodes attached to
+        it, using the manifest's prebuilt column index (O(1) per column).
+
+        Args:
+            manifest: Parsed dbt manifest
+            model_id: Unique ID of the column's model
+            column: The column to look up
+
+        Returns:
+            Distinct test type names, inline tests first
+        """
+        test_nodes = manifest.tests_for_column(model_id, column.name)
+        if not test_nodes:
+            return column.tests
+
+        existing = list(column.tests)
+        for test in test_nodes:
+            if test.test_type not in existing:
+                existing.append(test.test_type)
+        return existing
+
+    def classify_column(self, col_name: str, model_name: str) -> ColumnTraits:
+        """Classify a column by name, memoized per (column, model).
 
         Args:
             col_name: Column name
-            col_type: Column data type (from catalog or manifest)
+            model_name: Name of the model the column belongs to
+
+        Returns:
+            Column traits shared by test suggestion, priority and rationale
+        """
+        key = (col_name, model_name)
+        traits = self._traits_cache.get(key)
+        if traits is None:
+            traits = self._classifier.classify(col_name, model_name)
+            self._traits_cache[key] = traits
+        return traits
+
+    def _suggest_tests(
+        self, traits: ColumnTraits, existing_tests: List[str]
+    ) -> List[TestType]:
+        """Suggest tests for a column based on its classification.
+
+        Args:
+            traits: Column classification
             existing_tests: Tests already defined
-            model: The model this column belongs to
 
         Returns:
             List of suggested test types
         """
         suggestions: Set[TestType] = set()
-        col_lower = col_name.lower()
-        type_lower = (col_type or "").lower()
-        model_lower = model.name.lower()
-
-        # Foreign key patterns: ends with _id but prefix doesn't match model name
-        # (e.g., user_id in orders table is FK, but order_id in orders table is PK)
-        # Extract prefix before _id (e.g., "user" from "user_id")
-        col_prefix = col_lower[:-3] if col_lower.endswith("_id") else ""
-
-        # Check if this is a foreign key (prefix doesn't match model name)
-        # Handle both singular and plural model names (orders/order, users/user)
-        is_foreign_key = (
-            col_lower.endswith("_id")
-            and col_lower != "id"
-            and col_prefix != model_lower  # exact match
-            and col_prefix != model_lower.rstrip('s')  # orders -> order
-            and col_prefix + 's' != model_lower  # user -> users
-        )
+        category = traits.category
 
-        if is_foreign_key:
+        if category == ColumnCategory.FOREIGN_KEY:
             if TestType.NOT_NULL.value not in existing_tests:
                 suggestions.add(TestType.NOT_NULL)
             # Relationships test is more complex - needs target model
@@ -190,30 +555,29 @@ class TestCoverageAnalyzer:
 
         # ID columns should be unique and not null (primary keys)
         # This catches "id", "order_id" in orders table, "uuid", "_key" suffix
-        elif any(pattern in col_lower for pattern in self.ID_PATTERNS):
+        elif category == ColumnCategory.PRIMARY_KEY:
             if TestType.NOT_NULL.value not in existing_tests:
                 suggestions.add(TestType.NOT_NULL)
             if TestType.UNIQUE.value not in existing_tests:
                 suggestions.add(TestType.UNIQUE)
 
         # Timestamp columns should typically be not null
-        elif any(pattern in col_lower for pattern in self.TIMESTAMP_PATTERNS):
+        elif category == ColumnCategory.TIMESTAMP:
             if TestType.NOT_NULL.value not in existing_tests:
                 suggestions.add(TestType.NOT_NULL)
 
         # Status/type columns are good candidates for accepted_values
-        elif any(pattern in col_lower for pattern in self.STATUS_PATTERNS):
+        elif category == ColumnCategory.STATUS:
             if TestType.NOT_NULL.value not in existing_tests:
                 suggestions.add(TestType.NOT_NULL)
             if TestType.ACCEPTED_VALUES.value not in existing_tests:
                 suggestions.add(TestType.ACCEPTED_VALUES)
 
-        # Generic nullability check for important types
-        elif any(t in type_lower for t in self.NULLABLE_TYPES):
-            # Don't suggest not_null for every column - only high-value ones
-            pass
+        # Other columns: don't suggest not_null for every column - only high-value ones
 
-        return list(suggestions)
+        # Declaration order keeps output stable across processes (set order
+        # depends on the per-process string hash seed)
+        return [test_type for test_type in TestType if test_type in suggestions]
 
     def infer_parent_table(self, col_name: str) -> Optional[str]:
         """Infer parent table name from foreign key column name.
@@ -238,81 +602,45 @@ class TestCoverageAnalyzer:
         # Special cases could be added later (person->people, etc.)
         return f"{prefix}s"
 
-    def _calculate_priority(
-        self,
-        col_name: str,
-        col_type: Optional[str],
-        suggested_tests: List[TestType],
-        model: DbtModel,
-    ) -> int:
+    def _calculate_priority(self, traits: ColumnTraits) -> int:
         """Calculate priority score (1=high, 5=low).
 
         Args:
-            col_name: Column name
-            col_type: Column data type
-            suggested_tests: Suggested test types
-            model: The model this column belongs to
+            traits: Column classification
 
         Returns:
             Priority score
         """
-        col_lower = col_name.lower()
-        model_lower = model.name.lower()
-
-        # Priority 1: Primary keys (id, uuid) - high priority even if just missing one test
-        if col_lower in {"id", "uuid"}:
-            return 1
-
-        # Also priority 1: table_id in its own table (e.g., order_id in orders)
-        col_prefix = col_lower[:-3] if col_lower.endswith("_id") else ""
-        if col_prefix and (col_prefix == model_lower or col_prefix == model_lower.rstrip('s') or col_prefix + 's' == model_lower):
-            return 1
-
-        # Priority 2: Foreign keys and critical timestamps
-        if col_lower.endswith("_id") or col_lower in {"created_at", "updated_at"}:
-            return 2
-
-        # Priority 3: Status/type columns
-        if any(pattern in col_lower for pattern in self.STATUS_PATTERNS):
-            return 3
-
-        # Priority 4: Other timestamp columns
-        if any(pattern in col_lower for pattern in self.TIMESTAMP_PATTERNS):
-            return 4
-
-        # Priority 5: Everything else
-        return 5
+        return traits.priority
 
     def _build_rationale(
-        self, col_name: str, col_type: Optional[str], suggested_tests: List[TestType]
+        self, traits: ColumnTraits, suggested_tests: List[TestType]
     ) -> str:
         """Build human-readable rationale for test suggestions.
 
         Args:
-            col_name: Column name
-            col_type: Column data type
+            traits: Column classification
             suggested_tests: Suggested test types
 
         Returns:
             Rationale string
         """
-        col_lower = col_name.lower()
         reasons = []
 
         if TestType.UNIQUE in suggested_tests:
-            if col_lower in {"id", "uuid"}:
+            if traits.is_exact_key:
                 reasons.append("Primary key should be unique")
             else:
                 reasons.append("ID column should be unique")
 
         if TestType.NOT_NULL in suggested_tests:
-            if col_lower in {"id", "uuid"}:
+            if traits.is_exact_key:
                 reasons.append("Primary key cannot be null")
-            elif col_lower.endswith("_id"):
+            elif traits.ends_with_id:
                 reasons.append("Foreign key should not be null")
-            elif any(p in col_lower for p in self.TIMESTAMP_PATTERNS):
+            elif traits.has_timestamp:
                 reasons.append("Timestamp columns are typically required")
-            elif any(p in col_lower for p in self.STATUS_PATTERNS):
+            elif traits.has_status:
                 reasons.append("Status column should have a value")
 
         if TestType.ACCEPTED_VALUES in suggested_tests:
@@ -0,0 +1,215 @@
+"""Incremental coverage analysis driven by manifest diffs.
+
+On a typical PR only a handful of models change. The incremental analyzer
+fingerprints every model, compares against the state stored by the previous
+run, re-analyzes only added or changed models and reuses stored gaps for the
+rest. The resulting report is identical to a full analysis.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..parsers.catalog import CatalogTable, DbtCatalog
+from ..parsers.manifest import DbtManifest
+from ..utils.atomic import write_atomic
+from .coverage import (
+    ColumnGap,
+    CoverageReport,
+    PartialCoverage,
+    TestCoverageAnalyzer,
+    TestType,
+)
+
+# Bump when gap detection changes in a way stored results no longer reflect
+STATE_VERSION = 1
+
+
+@dataclass
+class ModelCoverage:
+    """Stored analysis result for one model."""
+
+    fingerprint: str
+    total_columns: int
+    tested_columns: int
+    gaps: List[ColumnGap]
+
+
+@dataclass
+class CoverageState:
+    """Per-model analysis results persisted between runs."""
+
+    analyzer_key: str
+    models: Dict[str, ModelCoverage] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, state_path: Path) -> Optional["CoverageState"]:
+        """Load state from disk.
+
+        Args:
+            state_path: Path to a state file written by ``save``
+
+        Returns:
+            The stored state, or None if the file is missing or unreadable
+        """
+        try:
+            with open(state_path, "r") as f:
+                raw = json.load(f)
+            return cls(
+                analyzer_key=raw["analyzer_key"],
+                models={
+                    model_id: ModelCoverage(
+                        fingerprint=entry["fingerprint"],
+                        total_columns=entry["total_columns"],
+                        tested_columns=entry["tested_columns"],
+                        gaps=[_gap_from_dict(gap) for gap in entry["gaps"]],
+                    )
+                    for model_id, entry in raw["models"].items()
+                },
+            )
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, state_path: Path) -> None:
+        """Write state to disk atomically.
+
+        Args:
+            state_path: Destination path (parent directories are created)
+        """
+        write_atomic(state_path, lambda f: json.dump(asdict(self), f))
+
+
+@dataclass
+class IncrementalResult:
+    """Outcome of an incremental analysis run."""
+
+    report: CoverageReport
+    state: CoverageState
+    analyzed_models: List[str]  # Added or changed since the previous state
+    reused_models: int
+    removed_models: int
+
+    def model_order_gaps(self) -> Iterator[ColumnGap]:
+        """Gaps in manifest model order, as ``TestCoverageAnalyzer.stream`` yields them."""
+        for model in self.state.models.values():
+            yield from model.gaps
+
+
+class IncrementalCoverageAnalyzer:
+    """Re-analyze only models whose inputs changed since the stored state."""
+
+    def __init__(self, analyzer: Optional[TestCoverageAnalyzer] = None) -> None:
+        """Wrap a coverage analyzer.
+
+        Args:
+            analyzer: Analyzer used for changed models (default: TestCoverageAnalyzer)
+        """
+        self.analyzer = analyzer or TestCoverageAnalyzer()
+
+    def analyze(
+        self,
+        manifest: DbtManifest,
+        catalog: Optional[DbtCatalog] = None,
+        previous: Optional[CoverageState] = None,
+    ) -> IncrementalResult:
+        """Analyze test coverage, reusing unchanged models from ``previous``.
+
+        Args:
+            manifest: Parsed dbt manifest
+            catalog: Optional parsed catalog (for warehouse column types)
+            previous: State from the last run (None analyzes every model)
+
+        Returns:
+            Report identical to a full analysis, plus the state to store
+        """
+        analyzer_key = self._analyzer_key()
+        if previous is not None and previous.analyzer_key != analyzer_key:
+            previous = None  # Stored gaps came from different detection rules
+
+        state = CoverageState(analyzer_key=analyzer_key)
+        analyzed: List[str] = []
+        partials: List[PartialCoverage] = []
+
+        for model_id in manifest.models:
+            catalog_table = catalog.tables.get(model_id) if catalog else None
+            fingerprint = self.fingerprint(manifest, model_id, catalog_table)
+
+            stored = previous.models.get(model_id) if previous else None
+            if stored is None or stored.fingerprint != fingerprint:
+                gaps, total_columns, tested_columns = self.analyzer.analyze_model(
+                    manifest, model_id, catalog_table
+                )
+                stored = ModelCoverage(fingerprint, total_columns, tested_columns, gaps)
+                analyzed.append(model_id)
+
+            state.models[model_id] = stored
+            partials.append((stored.gaps, stored.total_columns, stored.tested_columns))
+
+        removed = len(set(previous.models) - set(manifest.models)) if previous else 0
+        return IncrementalResult(
+            report=self.analyzer.build_report(partials, total_models=len(manifest.models)),
+            state=state,
+            analyzed_models=analyzed,
+            reused_models=len(manifest.models) - len(analyzed),
+            removed_models=removed,
+        )
+
+    def fingerprint(
+        self,
+        manifest: DbtManifest,
+        model_id: str,
+        catalog_table: Optional[CatalogTable] = None,
+    ) -> str:
+        """Hash everything gap detection reads for a model.
+
+        dbt's node checksum only covers the model's SQL file, while columns and
+        tests come from schema YAML and column types from the catalog, so those
+        inputs are hashed alongside it.
+
+        Args:
+            manifest: Parsed dbt manifest
+            model_id: Unique ID of the model
+            catalog_table: Optional catalog entry for the model
+
+        Returns:
+            Hex digest that changes whenever the model's analysis could change
+        """
+        model = manifest.models[model_id]
+        columns = [
+            (
+                col_name,
+                column.name,
+                column.data_type,
+                column.tests,
+                [t.test_type for t in manifest.tests_for_column(model_id, column.name)],
+                catalog_table.columns[col_name].type
+                if catalog_table and col_name in catalog_table.columns
+                else None,
+            )
+            for col_name, column in model.columns.items()
+        ]
+        material = json.dumps([model.checksum, model.name, columns], separators=(",", ":"))
+        return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+    def _analyzer_key(self) -> str:
+        """Identify the detection rules, so state from other rules is discarded."""
+        analyzer = self.analyzer
+        material = json.dumps(
+            [
+                STATE_VERSION,
+                type(analyzer).__qualname__,
+                sorted(analyzer.ID_PATTERNS),
+                sorted(analyzer.TIMESTAMP_PATTERNS),
+                sorted(analyzer.STATUS_PATTERNS),
+            ]
+        )
+        return hashlib.blake2b(material.encode(), digest_size=8).hexdigest()
+
+
+def _gap_from_dict(data: Dict[str, Any]) -> ColumnGap:
+    """Rebuild a ColumnGap stored as JSON."""
+    data = dict(data)
+    data["suggested_tests"] = [TestType(t) for t in data["suggested_tests"]]
+    return ColumnGap(**data)
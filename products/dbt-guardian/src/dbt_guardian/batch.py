@@ -0,0 +1,234 @@
+"""Analyze many dbt projects (e.g. every project in a monorepo) in one run.
+
+Projects are analyzed concurrently in a process pool, one project per task.
+A project that fails (missing or corrupt manifest, a crashed worker) is
+recorded in the combined report instead of aborting the batch.
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .analyzers import CoverageReport, TestCoverageAnalyzer
+from .parsers import load_artifacts
+
+PROJECT_FILE = "dbt_project.yml"
+
+
+@dataclass
+class ProjectResult:
+    """Outcome of analyzing one project."""
+
+    project_path: Path
+    seconds: float
+    report: Optional[CoverageReport] = None
+    error: Optional[str] = None  # Set instead of ``report`` when analysis failed
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the project was analyzed."""
+        return self.report is not None
+
+
+@dataclass
+class BatchReport:
+    """Per-project results and aggregate coverage across a batch."""
+
+    results: List[ProjectResult]
+    seconds: float
+
+    @property
+    def succeeded(self) -> List[ProjectResult]:
+        """Return the results of projects that were analyzed."""
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[ProjectResult]:
+        """Return the results of projects that could not be analyzed."""
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def total_models(self) -> int:
+        return sum(r.report.total_models for r in self.succeeded if r.report)
+
+    @property
+    def total_columns(self) -> int:
+        return sum(r.report.total_columns for r in self.succeeded if r.report)
+
+    @property
+    def tested_columns(self) -> int:
+        return sum(r.report.tested_columns for r in self.succeeded if r.report)
+
+    @property
+    def total_gaps(self) -> int:
+        return sum(len(r.report.gaps) for r in self.succeeded if r.report)
+
+    @property
+    def high_priority_gaps(self) -> int:
+        return sum(len(r.report.high_priority_gaps) for r in self.succeeded if r.report)
+
+    @property
+    def coverage_percentage(self) -> float:
+        """Column-weighted coverage across all analyzed projects."""
+        total = self.total_columns
+        return self.tested_columns / total * 100 if total > 0 else 0.0
+
+    def to_dict(self, priority: int = 5) -> Dict[str, Any]:
+        """JSON-serializable combined report with gaps at or above ``priority``."""
+        return {
+            "aggregate": {
+                "projects": len(self.results),
+                "succeeded": len(self.succeeded),
+                "failed": len(self.failed),
+                "total_models": self.total_models,
+                "total_columns": self.total_columns,
+                "tested_columns": self.tested_columns,
+                "coverage_percentage": self.coverage_percentage,
+                "total_gaps": self.total_gaps,
+                "high_priority_gaps": self.high_priority_gaps,
+                "seconds": self.seconds,
+            },
+            "projects": [
+                {
+                    "project_path": str(r.project_path),
+                    "seconds": r.seconds,
+                    "error": r.error,
+                    "report": r.report.to_dict(priority) if r.report else None,
+                }
+                for r in self.results
+            ],
+        }
+
+
+def expand_project_paths(patterns: Iterable[str]) -> List[Path]:
+    """Resolve project roots and glob patterns to project directories.
+
+    A literal path is kept as given (a missing or invalid project is reported
+    as a failure later). A glob pattern (``*``, ``?``, ``[``; ``**`` recurses)
+    keeps only the directories that contain a ``dbt_project.yml``.
+
+    Args:
+        patterns: Project roots and/or glob patterns
+
+    Returns:
+        Unique project paths in the order first matched
+    """
+    paths: Dict[Path, None] = {}
+    for pattern in patterns:
+        if not glob.has_magic(pattern):
+            paths.setdefault(Path(pattern), None)
+            continue
+        for match in sorted(glob.glob(pattern, recursive=True)):
+            path = Path(match)
+            if (path / PROJECT_FILE).is_file():
+                paths.setdefault(path, None)
+    return list(paths)
+
+
+def analyze_project(
+    project_path: Path,
+    cache: bool = True,
+    json_backend: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+) -> ProjectResult:
+    """Analyze one project, capturing any error in the result.
+
+    Args:
+        project_path: dbt project root
+        cache: Reuse parsed artifacts from the project's on-disk cache
+        json_backend: JSON decoder for artifacts (see ``utils.json_backend``)
+        cache_dir: Cache directory (default: the project's
+            ``target/.dbt_guardian_cache``)
+
+    Returns:
+        The project's report, or its error message
+    """
+    start = time.perf_counter()
+    try:
+        if not (project_path / "target" / "manifest.json").is_file():
+            raise FileNotFoundError(
+                "manifest.json not found. Run 'dbt compile' or 'dbt run' first."
+            )
+        manifest, catalog = load_artifacts(
+            project_path,
+            cache=cache,
+            cache_dir=cache_dir,
+            fields=TestCoverageAnalyzer.MANIFEST_FIELDS,
+            json_backend=json_backend,
+        )
+        report = TestCoverageAnalyzer().analyze(manifest, catalog)
+    except Exception as e:
+        return ProjectResult(project_path, time.perf_counter() - start, error=_describe(e))
+    return ProjectResult(project_path, time.perf_counter() - start, report=report)
+
+
+class BatchAnalyzer:
+    """Analyze projects concurrently, one worker process per project."""
+
+    def __init__(
+        self,
+        jobs: Optional[int] = None,
+        cache: bool = True,
+        json_backend: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """Configure the batch.
+
+        Args:
+            jobs: Worker processes (default: CPU count); 1 analyzes in this process
+            cache: Reuse parsed artifacts from each project's on-disk cache
+            json_backend: JSON decoder for artifacts (see ``utils.json_backend``)
+            cache_dir: One cache directory shared by every project (entries are
+                keyed by artifact content); default: each project's own
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache = cache
+        self.json_backend = json_backend
+        self.cache_dir = cache_dir
+
+    def analyze(self, project_paths: List[Path]) -> BatchReport:
+        """Analyze every project and combine the results.
+
+        Args:
+            project_paths: dbt project roots
+
+        Returns:
+            Results in the order of ``project_paths``, failures included
+        """
+        start = time.perf_counter()
+        options = (self.cache, self.json_backend, self.cache_dir)
+        workers = min(self.jobs, len(project_paths))
+
+        if workers <= 1:
+            results = [analyze_project(path, *options) for path in project_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(analyze_project, path, *options) for path in project_paths
+                ]
+                results = [
+                    self._collect(path, future)
+                    for path, future in zip(project_paths, futures, strict=True)
+                ]
+
+        return BatchReport(results=results, seconds=time.perf_counter() - start)
+
+    @staticmethod
+    def _collect(project_path: Path, future: "Future[ProjectResult]") -> ProjectResult:
+        """Return a worker's result, or a failure if the worker itself died."""
+        # analyze_project catches analysis errors, so this only sees pool
+        # failures such as a worker killed by the OOM killer
+        try:
+            return future.result()
+        except Exception as e:
+            return ProjectResult(project_path, 0.0, error=_describe(e))
+
+
+def _describe(error: BaseException) -> str:
+    """One-line error message for the report."""
+    message = str(error)
+    return f"{type(error).__name__}: {message}" if message else type(error).__name__
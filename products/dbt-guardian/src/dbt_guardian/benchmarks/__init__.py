@@ -0,0 +1,6 @@
+"""Performance benchmarks on synthetic dbt projects."""
+
+from .runner import BenchmarkRunner
+from .synthetic import SyntheticProjectGenerator, SyntheticProjectSpec
+
+__all__ = ["BenchmarkRunner", "SyntheticProjectGenerator", "SyntheticProjectSpec"]
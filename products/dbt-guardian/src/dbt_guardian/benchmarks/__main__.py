@@ -0,0 +1,116 @@
+"""Command-line entrypoint: ``python -m dbt_guardian.benchmarks``."""
+
+from dataclasses import asdict
+from pathlib import Path
+from typing import Tuple
+
+import click
+
+from .runner import BenchmarkRunner, write_results
+from .synthetic import SyntheticProjectSpec
+
+
+@click.command()
+@click.option(
+    "--models",
+    "-m",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=(1000,),
+    show_default=True,
+    help="Project size(s) in models; repeat for several sizes",
+)
+@click.option("--min-columns", type=click.IntRange(min=2), default=5, show_default=True)
+@click.option("--max-columns", type=click.IntRange(min=2), default=40, show_default=True)
+@click.option(
+    "--test-density",
+    type=click.FloatRange(0, 1),
+    default=0.3,
+    show_default=True,
+    help="Fraction of columns with test nodes",
+)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option("--memory/--no-memory", default=True, help="Measure peak allocations per stage")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--merge-width",
+    "merge_widths",
+    type=click.IntRange(min=2),
+    multiple=True,
+    help="Also time the schema.yml merge on models this many columns wide; repeat for several",
+)
+@click.option(
+    "--yaml-files",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Also load and dump this many schema.yml files with each YAML backend",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("benchmark-results.json"),
+    show_default=True,
+)
+def main(
+    models: Tuple[int, ...],
+    min_columns: int,
+    max_columns: int,
+    test_density: float,
+    repeat: int,
+    memory: bool,
+    seed: int,
+    merge_widths: Tuple[int, ...],
+    yaml_files: int,
+    output: Path,
+) -> None:
+    """Benchmark each pipeline stage on synthetic projects and write JSON results."""
+    specs = [
+        SyntheticProjectSpec(
+            models=count,
+            min_columns=min_columns,
+            max_columns=max_columns,
+            test_density=test_density,
+            seed=seed,
+        )
+        for count in models
+    ]
+    runner = BenchmarkRunner(repeat=repeat, measure_memory=memory)
+    results = runner.run(specs)
+    merge_results = runner.run_merge_scaling(list(merge_widths)) if merge_widths else []
+    if merge_results:
+        results["merge_scaling"] = [
+            {**asdict(merge), "microseconds_per_gap": merge.microseconds_per_gap}
+            for merge in merge_results
+        ]
+    yaml_result = runner.run_yaml_backends(yaml_files, seed=seed) if yaml_files else None
+    if yaml_result:
+        results["yaml_backends"] = asdict(yaml_result)
+    write_results(results, output)
+
+    for size in results["results"]:
+        click.echo(
+            f"{size['models']} models, {size['columns']} columns, "
+            f"{size['manifest_bytes'] / 1e6:.1f} MB manifest"
+        )
+        for stage in size["stages"]:
+            peak = stage["peak_alloc_bytes"]
+            peak_text = f"  peak {peak / 1e6:8.1f} MB" if peak is not None else ""
+            click.echo(f"  {stage['name']:<24}{stage['wall_seconds']:9.3f}s{peak_text}")
+    for merge in merge_results:
+        click.echo(
+            f"merge: {merge.models} models x {merge.columns_per_model} columns, "
+            f"{merge.gaps} gaps{merge.wall_seconds:9.3f}s "
+            f"({merge.microseconds_per_gap:.2f} us/gap)"
+        )
+    if yaml_result:
+        click.echo(
+            f"yaml: {yaml_result.files} schema files, {yaml_result.total_bytes / 1e6:.1f} MB"
+        )
+        for stage in yaml_result.stages:
+            click.echo(f"  {stage.name:<24}{stage.wall_seconds:9.3f}s")
+    click.echo(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
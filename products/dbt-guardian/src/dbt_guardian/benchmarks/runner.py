@@ -0,0 +1,288 @@
+"""Time and memory-profile each stage of the dbt Guardian pipeline.
+
+Each project size is generated synthetically, then every pipeline stage
+(JSON decoding with each installed backend, manifest parse, catalog parse,
+dependency graph, analysis, YAML generation) is timed over a few repeats.
+Peak Python allocations are measured in a separate tracemalloc pass so
+tracing overhead does not distort the timings.
+
+``run_merge_scaling`` separately times the schema.yml merge on increasingly
+wide models, to check that it stays linear in the number of gaps.
+``run_yaml_backends`` loads and dumps a corpus of schema.yml files with each
+installed YAML backend.
+"""
+
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .. import __version__
+from ..analyzers import ColumnGap, TestCoverageAnalyzer, TestType
+from ..generators import SchemaYamlGenerator
+from ..graph import DependencyGraph
+from ..parsers import CatalogParser, ManifestParser
+from ..utils import yaml_io
+from ..utils.json_backend import available_backends, load_json
+from ..utils.profiling import peak_rss_bytes
+from .synthetic import SyntheticProjectGenerator, SyntheticProjectSpec
+
+
+@dataclass
+class StageResult:
+    """Measurements for one pipeline stage."""
+
+    name: str
+    wall_seconds: float  # Best of the timed repeats
+    cpu_seconds: float  # CPU time of the best repeat
+    peak_alloc_bytes: Optional[int] = None  # tracemalloc peak (None if not measured)
+
+
+@dataclass
+class SizeResult:
+    """Measurements for one synthetic project size."""
+
+    models: int
+    columns: int
+    tests: int
+    manifest_bytes: int
+    catalog_bytes: int
+    stages: List[StageResult] = field(default_factory=list)
+
+
+@dataclass
+class MergeResult:
+    """Merge timing for one model width."""
+
+    models: int
+    columns_per_model: int
+    gaps: int
+    wall_seconds: float  # Best of the timed repeats
+
+    @property
+    def microseconds_per_gap(self) -> float:
+        return self.wall_seconds / self.gaps * 1e6
+
+
+@dataclass
+class YamlCorpusResult:
+    """YAML load/dump timings over a corpus of schema.yml files."""
+
+    files: int
+    total_bytes: int
+    stages: List[StageResult] = field(default_factory=list)
+
+
+class BenchmarkRunner:
+    """Run the pipeline benchmark over a range of project sizes."""
+
+    def __init__(self, repeat: int = 3, measure_memory: bool = True) -> None:
+        """Configure the runner.
+
+        Args:
+            repeat: Timed repetitions per stage (the fastest is reported)
+            measure_memory: Also run each stage once under tracemalloc
+        """
+        self.repeat = repeat
+        self.measure_memory = measure_memory
+
+    def run(self, specs: List[SyntheticProjectSpec]) -> Dict[str, Any]:
+        """Benchmark every spec.
+
+        Args:
+            specs: Synthetic project shapes to benchmark
+
+        Returns:
+            JSON-serializable results including environment details
+        """
+        results = []
+        for spec in specs:
+            with tempfile.TemporaryDirectory(prefix="dbt-guardian-bench-") as tmp:
+                results.append(self.run_size(spec, Path(tmp)))
+
+        return {
+            "dbt_guardian_version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "repeat": self.repeat,
+            "max_rss_bytes": peak_rss_bytes(),
+            "results": [asdict(result) for result in results],
+        }
+
+    def run_size(self, spec: SyntheticProjectSpec, workdir: Path) -> SizeResult:
+        """Generate one project in ``workdir`` and benchmark each stage."""
+        manifest_path, catalog_path = SyntheticProjectGenerator(spec).write(workdir)
+
+        manifest_parser = ManifestParser()
+        catalog_parser = CatalogParser()
+        manifest = manifest_parser.parse(manifest_path)
+        catalog = catalog_parser.parse(catalog_path)
+        report = TestCoverageAnalyzer().analyze(manifest, catalog)
+
+        result = SizeResult(
+            models=len(manifest.models),
+            columns=sum(len(m.columns) for m in manifest.models.values()),
+            tests=len(manifest.tests),
+            manifest_bytes=manifest_path.stat().st_size,
+            catalog_bytes=catalog_path.stat().st_size,
+        )
+
+        stages: Dict[str, Callable[[], Any]] = {
+            # Decode alone with each installed JSON backend
+            **{
+                f"manifest.decode.{backend}": partial(load_json, manifest_path, backend)
+                for backend in available_backends()
+            },
+            "manifest.parse": lambda: manifest_parser.parse(manifest_path),
+            "manifest.parse_stream": lambda: manifest_parser.parse(manifest_path, stream=True),
+            "catalog.parse": lambda: catalog_parser.parse(catalog_path),
+            "graph": lambda: DependencyGraph.from_manifest(manifest).topological_order(),
+            # A fresh analyzer each time so memoized classifications don't carry over
+            "analyze": lambda: TestCoverageAnalyzer().analyze(manifest, catalog),
+            "generate": lambda: SchemaYamlGenerator().write_file(
+                report, workdir / "schema_suggestions.yml"
+            ),
+        }
+        for name, stage in stages.items():
+            result.stages.append(self.measure(name, stage))
+        return result
+
+    def run_merge_scaling(self, widths: List[int], models: int = 10) -> List[MergeResult]:
+        """Time ``SchemaYamlGenerator.merge_gaps`` as models get wider.
+
+        Every column of every model has a gap; half the columns already exist in
+        the schema (with a test), half are new. Gap count grows with width, so
+        a per-gap time that stays flat across widths means the merge is linear.
+
+        Args:
+            widths: Columns per model to benchmark
+            models: Number of models
+
+        Returns:
+            One result per width
+        """
+        generator = SchemaYamlGenerator()
+        results = []
+        for width in widths:
+            gaps = [
+                ColumnGap(
+                    model_name=f"m{m}",
+                    column_name=f"c{c}_id",
+                    column_type="integer",
+                    existing_tests=[],
+                    suggested_tests=[TestType.NOT_NULL, TestType.UNIQUE],
+                    priority=1,
+                    rationale="benchmark",
+                )
+                for c in range(width)
+                for m in range(models)  # Interleaved, as after the priority sort
+            ]
+
+            def schema(width: int) -> Dict[str, Any]:
+                return {
+                    "version": 2,
+                    "models": [
+                        {
+                            "name": f"m{m}",
+                            "columns": [
+                                {"name": f"c{c}_id", "tests": ["not_null"]}
+                                for c in range(0, width, 2)
+                            ],
+                        }
+                        for m in range(models)
+                    ],
+                }
+
+            best = float("inf")
+            for _ in range(self.repeat):
+                existing = schema(width)
+                start = time.perf_counter()
+                generator.merge_gaps(existing, gaps)
+                best = min(best, time.perf_counter() - start)
+            results.append(MergeResult(models, width, len(gaps), best))
+        return results
+
+    def run_yaml_backends(self, files: int = 2000, seed: int = 0) -> YamlCorpusResult:
+        """Time loading and dumping a schema.yml corpus with each YAML backend.
+
+        Args:
+            files: Number of schema files (one model each)
+            seed: Random seed for the synthetic project
+
+        Returns:
+            ``yaml.load.<backend>`` and ``yaml.dump.<backend>`` stages
+        """
+        spec = SyntheticProjectSpec(models=files, seed=seed)
+        with tempfile.TemporaryDirectory(prefix="dbt-guardian-bench-") as tmp:
+            paths = SyntheticProjectGenerator(spec).write_schema_files(Path(tmp))
+            texts = [path.read_text() for path in paths]
+            documents = [yaml_io.safe_load(text) for text in texts]
+
+        def load(backend: str) -> None:
+            for text in texts:
+                yaml_io.safe_load(text, backend)
+
+        def dump(backend: str) -> None:
+            for document in documents:
+                yaml_io.dump(document, backend=backend)
+
+        result = YamlCorpusResult(
+            files=len(paths), total_bytes=sum(len(text.encode()) for text in texts)
+        )
+        for backend in yaml_io.available_backends():
+            result.stages.append(self.measure(f"yaml.load.{backend}", partial(load, backend)))
+            result.stages.append(self.measure(f"yaml.dump.{backend}", partial(dump, backend)))
+        return result
+
+    def measure(self, name: str, stage: Callable[[], Any]) -> StageResult:
+        """Time ``stage`` and optionally record its peak allocations.
+
+        Args:
+            name: Stage name used in the results
+            stage: Zero-argument callable running the stage
+
+        Returns:
+            Stage measurements
+        """
+        best_wall = float("inf")
+        best_cpu = 0.0
+        for _ in range(self.repeat):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            stage()
+            wall = time.perf_counter() - wall_start
+            if wall < best_wall:
+                best_wall = wall
+                best_cpu = time.process_time() - cpu_start
+
+        peak = None
+        if self.measure_memory:
+            tracemalloc.start()
+            try:
+                stage()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        return StageResult(name, best_wall, best_cpu, peak)
+
+
+def write_results(results: Dict[str, Any], output_path: Path) -> None:
+    """Write benchmark results as JSON.
+
+    Args:
+        results: Output of ``BenchmarkRunner.run``
+        output_path: Destination file (parent directories are created)
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
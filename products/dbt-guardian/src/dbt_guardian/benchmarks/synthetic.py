@@ -0,0 +1,341 @@
+"""Generate synthetic dbt artifacts for benchmarking.
+
+Produces manifest.json/catalog.json pairs shaped like real dbt output (models
+with typed columns, generic test nodes, sources, a layered DAG, compiled SQL)
+at any size, deterministically from a seed, plus a matching corpus of one
+schema.yml per model.
+"""
+
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..utils import yaml_io
+
+PROJECT_NAME = "synthetic"
+
+ENTITIES = [
+    "customer",
+    "order",
+    "payment",
+    "product",
+    "user",
+    "account",
+    "invoice",
+    "session",
+    "event",
+    "shipment",
+    "subscription",
+    "campaign",
+    "store",
+    "employee",
+]
+
+# (column name template, warehouse type); "{entity}" is filled per column
+COLUMN_TEMPLATES: List[Tuple[str, str]] = [
+    ("{entity}_id", "integer"),
+    ("{entity}_name", "varchar"),
+    ("{entity}_status", "varchar"),
+    ("{entity}_type", "varchar"),
+    ("{entity}_amount", "numeric"),
+    ("{entity}_count", "bigint"),
+    ("{entity}_key", "varchar"),
+    ("is_{entity}_active", "boolean"),
+    ("{entity}_created_at", "timestamp"),
+    ("{entity}_updated_at", "timestamp"),
+    ("{entity}_date", "date"),
+    ("{entity}_description", "text"),
+]
+
+FIXED_COLUMNS: List[Tuple[str, str]] = [
+    ("created_at", "timestamp"),
+    ("updated_at", "timestamp"),
+    ("status", "varchar"),
+]
+
+GENERIC_TESTS = ["not_null", "unique", "accepted_values", "relationships"]
+
+
+@dataclass
+class SyntheticProjectSpec:
+    """Shape of a synthetic dbt project.
+
+    Attributes:
+        models: Number of models
+        min_columns: Fewest columns per model
+        max_columns: Most columns per model
+        test_density: Fraction of columns that get at least one test node
+        sources: Number of source tables (default: one per 10 models)
+        max_parents: Most upstream dependencies per model
+        sql_bytes: Approximate compiled SQL size per model
+        seed: Random seed; equal specs produce identical artifacts
+    """
+
+    models: int = 1000
+    min_columns: int = 5
+    max_columns: int = 40
+    test_density: float = 0.3
+    sources: int = -1
+    max_parents: int = 3
+    sql_bytes: int = 2000
+    seed: int = 0
+
+    @property
+    def source_count(self) -> int:
+        return self.sources if self.sources >= 0 else max(1, self.models // 10)
+
+
+class SyntheticProjectGenerator:
+    """Build manifest.json and catalog.json documents from a spec."""
+
+    def __init__(self, spec: SyntheticProjectSpec) -> None:
+        self.spec = spec
+        self._columns = self._plan_columns()
+
+    def manifest(self) -> Dict[str, Any]:
+        """Build the manifest.json document."""
+        spec = self.spec
+        rng = random.Random(spec.seed + 1)
+        nodes: Dict[str, Any] = {}
+        sources = {self._source_id(i): self._source_node(i) for i in range(spec.source_count)}
+
+        for i in range(spec.models):
+            model_id = self._model_id(i)
+            nodes[model_id] = self._model_node(i, rng)
+
+            for column_name, _ in self._columns[i]:
+                if rng.random() >= spec.test_density:
+                    continue
+                for test_name in rng.sample(GENERIC_TESTS, rng.randint(1, 2)):
+                    test_id = f"test.{PROJECT_NAME}.{test_name}_m{i}_{column_name}"
+                    nodes[test_id] = self._test_node(test_name, model_id, column_name)
+
+        return {
+            "metadata": {
+                "dbt_version": "1.7.0",
+                "generated_at": "2024-01-01T00:00:00Z",
+                "project_name": PROJECT_NAME,
+            },
+            "nodes": nodes,
+            "sources": sources,
+            "exposures": {},
+        }
+
+    def catalog(self) -> Dict[str, Any]:
+        """Build the catalog.json document."""
+        rng = random.Random(self.spec.seed + 2)
+        nodes = {}
+        for i in range(self.spec.models):
+            nodes[self._model_id(i)] = {
+                "metadata": {
+                    "type": "BASE TABLE",
+                    "schema": "analytics",
+                    "name": f"m{i}",
+                    "database": "warehouse",
+                },
+                "columns": {
+                    name: {"type": col_type.upper(), "index": index + 1, "name": name}
+                    for index, (name, col_type) in enumerate(self._columns[i])
+                },
+                "stats": {
+                    "row_count": {
+                        "id": "row_count",
+                        "label": "Row Count",
+                        "value": rng.randint(0, 10_000_000),
+                        "include": True,
+                    }
+                },
+                "unique_id": self._model_id(i),
+            }
+        sources = {
+            self._source_id(i): {
+                "metadata": {"schema": "raw", "name": f"raw_table_{i}", "database": "warehouse"},
+                "columns": {
+                    "id": {"type": "INTEGER", "index": 1, "name": "id"},
+                    "_loaded_at": {"type": "TIMESTAMP", "index": 2, "name": "_loaded_at"},
+                },
+                "stats": {},
+                "unique_id": self._source_id(i),
+            }
+            for i in range(self.spec.source_count)
+        }
+        return {"metadata": {"dbt_version": "1.7.0"}, "nodes": nodes, "sources": sources}
+
+    def write(self, project_root: Path) -> Tuple[Path, Path]:
+        """Write dbt_project.yml and target/{manifest,catalog}.json.
+
+        Args:
+            project_root: Directory to create the project in
+
+        Returns:
+            Paths to the written manifest and catalog
+        """
+        target = project_root / "target"
+        target.mkdir(parents=True, exist_ok=True)
+        (project_root / "dbt_project.yml").write_text(
+            f"name: {PROJECT_NAME}\nversion: '1.0.0'\nprofile: {PROJECT_NAME}\n"
+        )
+
+        manifest_path = target / "manifest.json"
+        catalog_path = target / "catalog.json"
+        with open(manifest_path, "w") as f:
+            json.dump(self.manifest(), f)
+        with open(catalog_path, "w") as f:
+            json.dump(self.catalog(), f)
+        return manifest_path, catalog_path
+
+    def schema_file(self, i: int) -> Dict[str, Any]:
+        """Build the schema.yml document describing model ``i``."""
+        rng = random.Random(self.spec.seed * 1_000_003 + i)
+        columns = []
+        for name, col_type in self._columns[i]:
+            column: Dict[str, Any] = {
+                "name": name,
+                "description": f"The {name.replace('_', ' ')} of m{i}",
+                "data_type": col_type,
+            }
+            if rng.random() < self.spec.test_density:
+                column["tests"] = [
+                    {"accepted_values": {"values": ["a", "b", "c"]}}
+                    if test_name == "accepted_values"
+                    else {"relationships": {"to": "ref('m0')", "field": "id"}}
+                    if test_name == "relationships"
+                    else test_name
+                    for test_name in rng.sample(GENERIC_TESTS, rng.randint(1, 2))
+                ]
+            columns.append(column)
+        return {
+            "version": 2,
+            "models": [
+                {
+                    "name": f"m{i}",
+                    "description": f"Synthetic model {i}",
+                    "config": {"materialized": "table" if i % 3 == 0 else "view"},
+                    "columns": columns,
+                }
+            ],
+        }
+
+    def write_schema_files(self, project_root: Path) -> List[Path]:
+        """Write models/layer_N/mI.yml for every model.
+
+        Args:
+            project_root: Directory to create the files in
+
+        Returns:
+            Paths to the written files, in model order
+        """
+        paths = []
+        for i in range(self.spec.models):
+            path = project_root / "models" / f"layer_{i % 5}" / f"m{i}.yml"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                yaml_io.dump(self.schema_file(i), f)
+            paths.append(path)
+        return paths
+
+    def _plan_columns(self) -> List[List[Tuple[str, str]]]:
+        """Choose each model's columns up front so manifest and catalog agree."""
+        spec = self.spec
+        rng = random.Random(spec.seed)
+        plans = []
+        for i in range(spec.models):
+            entity = ENTITIES[i % len(ENTITIES)]
+            columns = [("id", "integer"), (f"{entity}_id", "integer")]
+            width = rng.randint(spec.min_columns, max(spec.min_columns, spec.max_columns))
+            seen = {name for name, _ in columns}
+            while len(columns) < width:
+                if rng.random() < 0.1:
+                    name, col_type = rng.choice(FIXED_COLUMNS)
+                else:
+                    template, col_type = rng.choice(COLUMN_TEMPLATES)
+                    name = template.format(entity=rng.choice(ENTITIES))
+                if name in seen:
+                    name = f"{name}_{len(columns)}"
+                seen.add(name)
+                columns.append((name, col_type))
+            plans.append(columns[:width])
+        return plans
+
+    def _model_node(self, i: int, rng: random.Random) -> Dict[str, Any]:
+        # Models only depend on earlier models or sources, keeping the graph acyclic
+        parents = [
+            (
+                self._model_id(rng.randrange(i))
+                if i and rng.random() < 0.8
+                else self._source_id(rng.randrange(self.spec.source_count))
+            )
+            for _ in range(rng.randint(1, self.spec.max_parents))
+        ]
+        select = ",\n    ".join(name for name, _ in self._columns[i])
+        sql = f"select\n    {select}\nfrom {{{{ ref('m{max(i - 1, 0)}') }}}}\n"
+        sql += "-- padding\n" * max(0, (self.spec.sql_bytes - len(sql)) // 11)
+        return {
+            "resource_type": "model",
+            "name": f"m{i}",
+            "unique_id": self._model_id(i),
+            "package_name": PROJECT_NAME,
+            "schema": "analytics",
+            "database": "warehouse",
+            "alias": f"m{i}",
+            "description": f"Synthetic model {i}",
+            "original_file_path": f"models/layer_{i % 5}/m{i}.sql",
+            "path": f"layer_{i % 5}/m{i}.sql",
+            "checksum": {"name": "sha256", "checksum": f"{self.spec.seed:08x}{i:056x}"},
+            "columns": {
+                name: {
+                    "name": name,
+                    "description": "",
+                    "data_type": col_type,
+                    "tags": [],
+                    "meta": {},
+                }
+                for name, col_type in self._columns[i]
+            },
+            "depends_on": {"macros": [], "nodes": sorted(set(parents))},
+            "tags": ["synthetic"],
+            "config": {"materialized": "table" if i % 3 == 0 else "view", "enabled": True},
+            "raw_code": sql,
+            "compiled_code": sql,
+            "compiled_sql": sql,
+        }
+
+    def _test_node(self, test_name: str, model_id: str, column_name: str) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"column_name": column_name}
+        if test_name == "accepted_values":
+            kwargs["values"] = ["a", "b", "c"]
+        elif test_name == "relationships":
+            kwargs.update({"to": "ref('m0')", "field": "id"})
+        return {
+            "resource_type": "test",
+            "name": f"{test_name}_{model_id.rsplit('.', 1)[-1]}_{column_name}",
+            "column_name": column_name,
+            "attached_node": model_id,
+            "test_metadata": {"name": test_name, "kwargs": kwargs, "namespace": None},
+            "depends_on": {"macros": [f"macro.dbt.test_{test_name}"], "nodes": [model_id]},
+            "config": {"severity": "ERROR", "enabled": True},
+        }
+
+    def _source_node(self, i: int) -> Dict[str, Any]:
+        return {
+            "resource_type": "source",
+            "name": f"raw_table_{i}",
+            "source_name": "raw",
+            "unique_id": self._source_id(i),
+            "schema": "raw",
+            "database": "warehouse",
+            "identifier": f"raw_table_{i}",
+            "loaded_at_field": "_loaded_at",
+            "columns": {},
+            "tags": [],
+        }
+
+    @staticmethod
+    def _model_id(i: int) -> str:
+        return f"model.{PROJECT_NAME}.m{i}"
+
+    @staticmethod
+    def _source_id(i: int) -> str:
+        return f"source.{PROJECT_NAME}.raw.raw_table_{i}"
@@ -1,16 +1,260 @@
-"""CLI entrypoint for dbt Guardian."""
-
+"""CLI entrypoint for dbt Guardian.
+
+Startup time matters because hooks and editors invoke the CLI many times a
+minute, so only click and standard-library-only helpers are imported at module
+load. rich, pydantic, yaml and the parsers/analyzers/generators are imported
+inside the commands that use them (``tests/unit/test_cli_startup.py`` enforces
+this).
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from .analyzers import TestCoverageAnalyzer
-from .generators import SchemaYamlGenerator
-from .parsers import CatalogParser, ManifestParser, ProjectParser
+from .client import SOCKET_ENV_VAR, default_socket_path
+from .export import FORMATS, SummaryFn, write_gaps
+from .utils.json_backend import BACKEND_ENV_VAR, BACKEND_NAMES
+from .utils.profiling import Profiler, profiling, stage
+
+if TYPE_CHECKING:
+    from rich.console import Console, Group, RenderableType
+
+    from .analyzers import ColumnGap, CoverageReport
+    from .batch import BatchReport
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Shared rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _jobs_option(func):  # type: ignore[no-untyped-def]
+    """Shared --jobs option for commands that run coverage analysis."""
+    return click.option(
+        "--jobs",
+        "-j",
+        type=click.IntRange(min=1),
+        default=1,
+        help="Analyze models in N worker processes (output is identical to -j 1)",
+    )(func)
+
+
+def _cache_options(func):  # type: ignore[no-untyped-def]
+    """Shared --cache/--cache-dir/--json-backend options for commands that parse artifacts."""
+    func = click.option(
+        "--json-backend",
+        type=click.Choice(BACKEND_NAMES, case_sensitive=False),
+        envvar=BACKEND_ENV_VAR,
+        help="JSON decoder for artifacts (default: auto, the fastest installed)",
+    )(func)
+    func = click.option(
+        "--cache-dir",
+        type=click.Path(file_okay=False, path_type=Path),
+        envvar="DBT_GUARDIAN_CACHE_DIR",
+        help="Parsed-artifact cache directory (default: target/.dbt_guardian_cache)",
+    )(func)
+    func = click.option(
+        "--cache/--no-cache",
+        default=True,
+        help="Reuse parsed manifest/catalog while the files are unchanged",
+    )(func)
+    return func
+
+
+def _profile_options(func):  # type: ignore[no-untyped-def]
+    """Shared --profile/--profile-trace options."""
+    func = click.option(
+        "--profile-trace",
+        type=click.Path(dir_okay=False, path_type=Path),
+        help="Write per-stage timings as Chrome trace-event JSON (implies --profile)",
+    )(func)
+    func = click.option(
+        "--profile",
+        is_flag=True,
+        default=False,
+        help="Print wall time, CPU time, peak RSS and object counts per stage",
+    )(func)
+    return func
+
+
+@contextmanager
+def _profiled(enabled: bool, trace_path: Optional[Path]) -> Iterator[None]:
+    """Record the enclosed stages and report them once the block completes."""
+    if not enabled and trace_path is None:
+        yield
+        return
+
+    profiler = Profiler()
+    with profiling(profiler):
+        yield
+
+    _print_profile(profiler)
+    if trace_path is not None:
+        profiler.write_chrome_trace(trace_path)
+        _console().print(f"[dim]Profile trace written to {trace_path}[/dim]")
+
+
+def _print_profile(profiler: Profiler) -> None:
+    """Display a per-stage breakdown table."""
+    from rich.table import Table
+
+    table = Table(title="Profile")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Wall (s)", justify="right", style="green")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("Objects", justify="right", style="dim")
+
+    for record in profiler.ordered_records():
+        objects = f"{record.object_delta:+,}" if record.object_delta is not None else "-"
+        table.add_row(
+            "  " * record.depth + record.name,
+            f"{record.wall_seconds:.3f}",
+            f"{record.cpu_seconds:.3f}",
+            f"{record.peak_rss_bytes / 1e6:.1f}",
+            objects,
+        )
+
+    _console().print(table)
+
+
+def _print_analysis(report: "CoverageReport", priority: int) -> None:
+    """Display the coverage summary and the top gaps."""
+    for renderable in _analysis_renderables(report, priority):
+        _console().print(renderable)
+
+
+def _analysis_renderables(report: "CoverageReport", priority: int) -> List["RenderableType"]:
+    """Build the coverage summary and top-gaps tables."""
+    from rich.table import Table
+
+    renderables: List["RenderableType"] = []
+
+    # Display summary
+    summary_table = Table(title="Coverage Summary")
+    summary_table.add_column("Metric", style="cyan")
+    summary_table.add_column("Value", style="green")
+
+    summary_table.add_row("Models", str(report.total_models))
+    summary_table.add_row("Columns", str(report.total_columns))
+    summary_table.add_row("Tested Columns", str(report.tested_columns))
+    summary_table.add_row("Coverage", f"{report.coverage_percentage:.1f}%")
+    summary_table.add_row("Gaps Found", str(len(report.gaps)))
+    summary_table.add_row("High Priority Gaps", str(len(report.high_priority_gaps)))
+
+    renderables.append(summary_table)
+
+    # Display top gaps
+    filtered_gaps = [g for g in report.gaps if g.priority <= priority]
+    if filtered_gaps:
+        renderables.append(f"\n[bold]Top Gaps (priority <= {priority}):[/bold]")
+        gaps_table = Table()
+        gaps_table.add_column("Priority", style="yellow")
+        gaps_table.add_column("Model", style="cyan")
+        gaps_table.add_column("Column", style="blue")
+        gaps_table.add_column("Suggested Tests", style="green")
+        gaps_table.add_column("Rationale", style="dim")
+
+        for gap in filtered_gaps[:20]:  # Show top 20
+            tests = ", ".join(t.value for t in gap.suggested_tests)
+            gaps_table.add_row(
+                str(gap.priority),
+                gap.model_name,
+                gap.column_name,
+                tests,
+                gap.rationale,
+            )
+
+        renderables.append(gaps_table)
+
+        if len(filtered_gaps) > 20:
+            renderables.append(f"\n[dim]... and {len(filtered_gaps) - 20} more gaps[/dim]")
+
+    return renderables
+
+
+def _export_gaps(
+    gaps: Iterable["ColumnGap"],
+    summary: SummaryFn,
+    output_format: str,
+    priority: int,
+    output: Optional[Path],
+) -> None:
+    """Write gaps with priority <= ``priority`` to ``output`` (default: stdout)."""
+    selected = (gap for gap in gaps if gap.priority <= priority)
+    if output is None:
+        write_gaps(selected, output_format, sys.stdout, summary)
+        return
+    with open(output, "w", encoding="utf-8", newline="") as f:
+        write_gaps(selected, output_format, f, summary)
+
+
+# Files whose changes --watch re-analyzes; other watched files (schema YAML)
+# only reach the analysis through the manifest dbt writes from them
+_WATCH_ARTIFACTS = ("manifest.json", "catalog.json")
+
+# analyze options that have no effect under --watch
+_WATCH_IGNORED_OPTIONS = (
+    "stream",
+    "cache",
+    "cache_dir",
+    "jobs",
+    "profile",
+    "profile_trace",
+    "incremental",
+    "state_path",
+)
 
-console = Console()
+
+def _watch_analysis(project_path: Path, priority: int, json_backend: Optional[str]) -> None:
+    """Re-analyze whenever artifacts change, refreshing the summary in place.
+
+    Parsed state lives in one ProjectStore for the whole session, so each change
+    re-parses only the artifacts (manifest.json, catalog.json) that changed and
+    re-analyzes only the models whose fingerprints changed. Coverage is computed
+    from the artifacts, so an edit to schema YAML shows up once dbt rewrites
+    manifest.json (e.g. on the next ``dbt parse``).
+    """
+    from rich.console import Group
+    from rich.live import Live
+
+    from .server import ProjectStore
+    from .watch import ArtifactWatcher
+
+    store = ProjectStore(json_backend)
+    watcher = ArtifactWatcher(project_path)
+    report: Optional["CoverageReport"] = None
+
+    def refresh(status: str) -> "Group":
+        nonlocal report
+        try:
+            report = store.get(project_path).report
+        except Exception as e:  # e.g. manifest.json caught mid-write; keep the last report
+            status = f"[red]Error:[/red] {e}"
+        body = _analysis_renderables(report, priority) if report else []
+        footer = f"\n[dim]{time.strftime('%H:%M:%S')}[/dim] {status} [dim](Ctrl-C to stop)[/dim]"
+        return Group(*body, footer)
+
+    with Live(refresh("Watching for changes…"), console=_console(), auto_refresh=False) as live:
+        try:
+            while True:
+                changed = watcher.wait_for_change() or []
+                names = ", ".join(path.name for path in changed)
+                if any(path.name in _WATCH_ARTIFACTS for path in changed):
+                    status = f"Re-analyzed after changes to {names}"
+                else:
+                    status = f"{names} changed; coverage updates after the next dbt parse"
+                live.update(refresh(status), refresh=True)
+        except KeyboardInterrupt:
+            pass
 
 
 @click.group()
@@ -28,92 +272,160 @@ def cli() -> None:
     default=3,
     help="Show gaps with priority <= N (1=critical, 5=low)",
 )
-def analyze(project_path: Path, priority: int) -> None:
+@click.option(
+    "--stream/--no-stream",
+    default=False,
+    help="Decode manifest.json node by node to bound memory on large projects",
+)
+@_cache_options
+@_jobs_option
+@_profile_options
+@click.option(
+    "--incremental/--full",
+    default=False,
+    help="Re-analyze only models changed since the stored state",
+)
+@click.option(
+    "--state",
+    "state_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Incremental state file (default: target/dbt_guardian_state.json)",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running and re-analyze when target/ artifacts or schema YAML change",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(("table",) + FORMATS),
+    default="table",
+    help="table (default), or stream every gap as json, ndjson, csv or columnar batches",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write --format output to this file instead of stdout",
+)
+def analyze(
+    project_path: Path,
+    priority: int,
+    stream: bool,
+    cache: bool,
+    cache_dir: Path | None,
+    json_backend: str | None,
+    jobs: int,
+    incremental: bool,
+    state_path: Path | None,
+    profile: bool,
+    profile_trace: Path | None,
+    watch: bool,
+    output_format: str,
+    output: Path | None,
+) -> None:
     """Analyze a dbt project for test coverage gaps.
 
     PROJECT_PATH: Path to dbt project root directory
     """
-    console.print(f"[bold]Analyzing dbt project:[/bold] {project_path}")
+    from .analyzers import CoverageState, IncrementalCoverageAnalyzer, TestCoverageAnalyzer
+    from .parsers import load_artifacts
+
+    # Machine-readable formats write nothing but the records
+    machine = output_format != "table"
+    if machine and watch:
+        raise click.UsageError("--watch only supports --format table")
+    if watch:
+        ctx = click.get_current_context()
+        ignored = [
+            param.opts[0]
+            for param in ctx.command.params
+            if param.name in _WATCH_IGNORED_OPTIONS
+            and ctx.get_parameter_source(param.name) == click.core.ParameterSource.COMMANDLINE
+        ]
+        if ignored:
+            raise click.UsageError(f"--watch cannot be combined with {', '.join(ignored)}")
+
+    if not machine:
+        _console().print(f"[bold]Analyzing dbt project:[/bold] {project_path}")
 
     # Find manifest and catalog
     manifest_path = project_path / "target" / "manifest.json"
-    catalog_path = project_path / "target" / "catalog.json"
 
     if not manifest_path.exists():
-        console.print(
+        _console().print(
             "[red]Error:[/red] manifest.json not found. "
             "Run 'dbt compile' or 'dbt run' first.",
             style="red",
         )
         raise click.Abort()
 
+    if watch:
+        _watch_analysis(project_path, priority, json_backend)
+        return
+
     # Parse files
     try:
-        manifest_parser = ManifestParser()
-        manifest = manifest_parser.parse(manifest_path)
-
-        # Parse catalog if available
-        catalog = None
-        if catalog_path.exists():
-            catalog_parser = CatalogParser()
-            catalog = catalog_parser.parse(catalog_path)
-            console.print("[dim]Found catalog.json — using warehouse metadata[/dim]")
-
-        # Analyze coverage
-        analyzer = TestCoverageAnalyzer()
-        report = analyzer.analyze(manifest, catalog)
-
-        # Display summary
-        summary_table = Table(title="Coverage Summary")
-        summary_table.add_column("Metric", style="cyan")
-        summary_table.add_column("Value", style="green")
-
-        summary_table.add_row("Models", str(report.total_models))
-        summary_table.add_row("Columns", str(report.total_columns))
-        summary_table.add_row("Tested Columns", str(report.tested_columns))
-        summary_table.add_row("Coverage", f"{report.coverage_percentage:.1f}%")
-        summary_table.add_row("Gaps Found", str(len(report.gaps)))
-        summary_table.add_row("High Priority Gaps", str(len(report.high_priority_gaps)))
-
-        console.print(summary_table)
-
-        # Display top gaps
-        filtered_gaps = [g for g in report.gaps if g.priority <= priority]
-        if filtered_gaps:
-            console.print(
-                f"\n[bold]Top Gaps (priority <= {priority}):[/bold]"
+        with _profiled(profile, profile_trace):
+            manifest, catalog = load_artifacts(
+                project_path,
+                stream,
+                cache,
+                cache_dir,
+                TestCoverageAnalyzer.MANIFEST_FIELDS,
+                json_backend,
+            )
+            if catalog is not None and not machine:
+                _console().print("[dim]Found catalog.json — using warehouse metadata[/dim]")
+
+            # Machine-readable output lists gaps in model order on every path, so
+            # -j N and --incremental write exactly what -j 1 writes
+            if machine and not incremental:
+                # Gaps are analyzed as they are written, never held together
+                with stage("analyze+export"):
+                    coverage = TestCoverageAnalyzer().stream(manifest, catalog, jobs=jobs)
+                    _export_gaps(coverage, coverage.summary, output_format, priority, output)
+                return
+
+            # Analyze coverage
+            with stage("analyze"):
+                if incremental:
+                    state_path = (
+                        state_path or project_path / "target" / "dbt_guardian_state.json"
+                    )
+                    result = IncrementalCoverageAnalyzer().analyze(
+                        manifest, catalog, CoverageState.load(state_path)
+                    )
+                    result.state.save(state_path)
+                    report = result.report
+                else:
+                    analyzer = TestCoverageAnalyzer()
+                    report = analyzer.analyze(manifest, catalog, jobs=jobs)
+
+            if machine:
+                with stage("export"):
+                    _export_gaps(
+                        result.model_order_gaps(), report.summary, output_format, priority, output
+                    )
+                return
+
+            with stage("render"):
+                if incremental:
+                    _console().print(
+                        f"[dim]Incremental: re-analyzed {len(result.analyzed_models)} of "
+                        f"{report.total_models} models ({result.reused_models} reused)[/dim]"
+                    )
+                _print_analysis(report, priority)
+
+            _console().print(
+                "\n[green]✓[/green] Analysis complete! "
+                "Run 'dbt-guardian generate-tests' to create schema.yml"
             )
-            gaps_table = Table()
-            gaps_table.add_column("Priority", style="yellow")
-            gaps_table.add_column("Model", style="cyan")
-            gaps_table.add_column("Column", style="blue")
-            gaps_table.add_column("Suggested Tests", style="green")
-            gaps_table.add_column("Rationale", style="dim")
-
-            for gap in filtered_gaps[:20]:  # Show top 20
-                tests = ", ".join(t.value for t in gap.suggested_tests)
-                gaps_table.add_row(
-                    str(gap.priority),
-                    gap.model_name,
-                    gap.column_name,
-                    tests,
-                    gap.rationale,
-                )
-
-            console.print(gaps_table)
-
-            if len(filtered_gaps) > 20:
-                console.print(
-                    f"\n[dim]... and {len(filtered_gaps) - 20} more gaps[/dim]"
-                )
-
-        console.print(
-            "\n[green]✓[/green] Analysis complete! "
-            "Run 'dbt-guardian generate-tests' to create schema.yml"
-        )
 
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}", style="red")
+        _console().print(f"[red]Error:[/red] {e}", style="red")
         raise click.Abort()
 
 
@@ -141,86 +453,372 @@ def analyze(project_path: Path, priority: int) -> None:
     type=click.Path(exists=True, path_type=Path),
     help="Path to existing schema.yml (required if --merge)",
 )
+@click.option(
+    "--shard",
+    is_flag=True,
+    default=False,
+    help="Write one schema_suggestions.yml per model directory instead of one file",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=False,
+    help="Decode manifest.json node by node to bound memory on large projects",
+)
+@_cache_options
+@_jobs_option
+@_profile_options
 def generate_tests(
     project_path: Path,
     output: Path | None,
     priority: int,
     merge: bool,
     existing_schema: Path | None,
+    shard: bool,
+    stream: bool,
+    cache: bool,
+    cache_dir: Path | None,
+    json_backend: str | None,
+    jobs: int,
+    profile: bool,
+    profile_trace: Path | None,
 ) -> None:
     """Generate schema.yml with test suggestions.
 
     PROJECT_PATH: Path to dbt project root directory
+
+    With --shard, suggestions go next to the models they cover (grouped by the
+    directory of each model's original_file_path) and the files written are
+    listed in target/dbt_guardian_shards.json.
     """
-    console.print(f"[bold]Generating test suggestions:[/bold] {project_path}")
+    from .analyzers import TestCoverageAnalyzer
+    from .generators import SchemaYamlGenerator, ShardedSchemaWriter
+    from .parsers import load_artifacts
+
+    if shard and (merge or output):
+        raise click.UsageError("--shard cannot be combined with --merge or --output")
+
+    _console().print(f"[bold]Generating test suggestions:[/bold] {project_path}")
 
     # Find manifest and catalog
     manifest_path = project_path / "target" / "manifest.json"
-    catalog_path = project_path / "target" / "catalog.json"
 
     if not manifest_path.exists():
-        console.print(
+        _console().print(
             "[red]Error:[/red] manifest.json not found. "
             "Run 'dbt compile' or 'dbt run' first.",
             style="red",
         )
         raise click.Abort()
 
+    # Sharding also needs each model's file path
+    fields = TestCoverageAnalyzer.MANIFEST_FIELDS
+    if shard:
+        fields = fields | {"original_file_path"}
+
     # Parse files
     try:
-        manifest_parser = ManifestParser()
-        manifest = manifest_parser.parse(manifest_path)
-
-        catalog = None
-        if catalog_path.exists():
-            catalog_parser = CatalogParser()
-            catalog = catalog_parser.parse(catalog_path)
-
-        # Analyze coverage
-        analyzer = TestCoverageAnalyzer()
-        report = analyzer.analyze(manifest, catalog)
-
-        # Generate YAML
-        generator = SchemaYamlGenerator()
-        output_path = output or (project_path / "schema_suggestions.yml")
-
-        if merge:
-            if not existing_schema:
-                console.print(
-                    "[red]Error:[/red] --existing-schema required when using --merge",
-                    style="red",
-                )
-                raise click.Abort()
+        with _profiled(profile, profile_trace):
+            manifest, catalog = load_artifacts(
+                project_path, stream, cache, cache_dir, fields, json_backend
+            )
 
-            yaml_content = generator.generate_incremental(
-                report, existing_schema, output_path, priority
+            # Analyze coverage
+            with stage("analyze"):
+                analyzer = TestCoverageAnalyzer()
+                report = analyzer.analyze(manifest, catalog, jobs=jobs)
+
+            # Generate YAML
+            generator = SchemaYamlGenerator()
+            output_path = output or (project_path / "schema_suggestions.yml")
+
+            if shard:
+                with stage("generate"):
+                    files = ShardedSchemaWriter(jobs=jobs).write(
+                        report, manifest, project_path, priority
+                    )
+                _console().print(
+                    f"[green]✓[/green] Generated {len(files)} suggestion files "
+                    "(listed in target/dbt_guardian_shards.json)"
+                )
+                for shard_file in files:
+                    _console().print(f"  {shard_file.path} [dim]({shard_file.gaps} gaps)[/dim]")
+            elif merge:
+                if not existing_schema:
+                    _console().print(
+                        "[red]Error:[/red] --existing-schema required when using --merge",
+                        style="red",
+                    )
+                    raise click.Abort()
+
+                with stage("generate"):
+                    generator.generate_incremental(
+                        report, existing_schema, output_path, priority
+                    )
+                _console().print(f"[green]✓[/green] Merged suggestions into: {output_path}")
+            else:
+                with stage("generate"):
+                    generator.write_file(report, output_path, priority)
+                _console().print(f"[green]✓[/green] Generated: {output_path}")
+
+            # Show summary
+            filtered_gaps = [g for g in report.gaps if g.priority <= priority]
+            _console().print(
+                f"\n[cyan]Coverage:[/cyan] {report.coverage_percentage:.1f}%"
+            )
+            _console().print(
+                f"[cyan]Suggestions:[/cyan] {len(filtered_gaps)} tests "
+                f"(priority <= {priority})"
+            )
+            _console().print(
+                "\n[yellow]Next steps:[/yellow]\n"
+                "1. Review schema_suggestions.yml\n"
+                "2. Customize accepted_values and relationships tests\n"
+                "3. Remove [AUTO] prefixes from descriptions\n"
+                "4. Copy relevant tests to your models/ directory\n"
+                "5. Run 'dbt test' to validate"
             )
-            console.print(f"[green]✓[/green] Merged suggestions into: {output_path}")
-        else:
-            yaml_content = generator.generate(report, output_path, priority)
-            console.print(f"[green]✓[/green] Generated: {output_path}")
-
-        # Show summary
-        filtered_gaps = [g for g in report.gaps if g.priority <= priority]
-        console.print(
-            f"\n[cyan]Coverage:[/cyan] {report.coverage_percentage:.1f}%"
+
+    except Exception as e:
+        _console().print(f"[red]Error:[/red] {e}", style="red")
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument("projects", nargs=-1, required=True)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Analyze N projects at a time in worker processes (default: CPU count)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the combined report as JSON",
+)
+@click.option(
+    "--priority",
+    type=int,
+    default=3,
+    help="Include gaps with priority <= N in the JSON report (1=critical, 5=low)",
+)
+@_cache_options
+def batch(
+    projects: Tuple[str, ...],
+    jobs: int | None,
+    output: Path | None,
+    priority: int,
+    cache: bool,
+    cache_dir: Path | None,
+    json_backend: str | None,
+) -> None:
+    """Analyze many dbt projects concurrently and combine their coverage.
+
+    PROJECTS: Project roots or glob patterns (quote them), e.g. 'projects/*'
+    or 'repo/**'. Globs match directories containing dbt_project.yml.
+    A failing project is reported without stopping the others; the exit
+    status is 1 if any project failed.
+    """
+    import json
+
+    from .batch import BatchAnalyzer, expand_project_paths
+
+    project_paths = expand_project_paths(projects)
+    if not project_paths:
+        _console().print("[red]Error:[/red] No dbt projects matched", style="red")
+        raise click.Abort()
+
+    _console().print(f"[bold]Analyzing {len(project_paths)} dbt projects[/bold]")
+    report = BatchAnalyzer(
+        jobs=jobs, cache=cache, json_backend=json_backend, cache_dir=cache_dir
+    ).analyze(project_paths)
+    _print_batch(report)
+
+    if output is not None:
+        output.write_text(json.dumps(report.to_dict(priority), indent=2) + "\n")
+        _console().print(f"[dim]Combined report written to {output}[/dim]")
+
+    if report.failed:
+        raise SystemExit(1)
+
+
+def _print_batch(report: "BatchReport") -> None:
+    """Display per-project coverage, the aggregate row and any failures."""
+    from rich.table import Table
+
+    table = Table(title="Batch Coverage")
+    table.add_column("Project", style="cyan")
+    table.add_column("Models", justify="right")
+    table.add_column("Columns", justify="right")
+    table.add_column("Tested", justify="right")
+    table.add_column("Coverage", justify="right", style="green")
+    table.add_column("Gaps", justify="right")
+    table.add_column("High Priority", justify="right", style="red")
+    table.add_column("Time (s)", justify="right", style="dim")
+
+    for result in report.results:
+        if result.report is None:
+            # The error is printed below the table; the Time column carries the status
+            table.add_row(str(result.project_path), *["-"] * 6, "[red]failed[/red]")
+            continue
+        project = result.report
+        table.add_row(
+            str(result.project_path),
+            str(project.total_models),
+            str(project.total_columns),
+            str(project.tested_columns),
+            f"{project.coverage_percentage:.1f}%",
+            str(len(project.gaps)),
+            str(len(project.high_priority_gaps)),
+            f"{result.seconds:.2f}",
         )
-        console.print(
-            f"[cyan]Suggestions:[/cyan] {len(filtered_gaps)} tests "
-            f"(priority <= {priority})"
+
+    table.add_section()
+    table.add_row(
+        f"[bold]Total ({len(report.succeeded)}/{len(report.results)} projects)[/bold]",
+        str(report.total_models),
+        str(report.total_columns),
+        str(report.tested_columns),
+        f"{report.coverage_percentage:.1f}%",
+        str(report.total_gaps),
+        str(report.high_priority_gaps),
+        f"{report.seconds:.2f}",
+    )
+    _console().print(table)
+
+    for result in report.failed:
+        _console().print(f"[red]✗[/red] {result.project_path}: {result.error}")
+
+
+@cli.command()
+@click.argument("project_path", type=click.Path(exists=True, path_type=Path))
+@click.argument("model", required=False)
+@click.option(
+    "--direction",
+    type=click.Choice(["upstream", "downstream", "both"]),
+    default="both",
+    show_default=True,
+    help="Which side of MODEL to list",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Without MODEL, list the N nodes with the most direct dependents",
+)
+@_cache_options
+def lineage(
+    project_path: Path,
+    model: str | None,
+    direction: str,
+    top: int,
+    cache: bool,
+    cache_dir: Path | None,
+    json_backend: str | None,
+) -> None:
+    """Show the dependency graph of a dbt project.
+
+    PROJECT_PATH: Path to dbt project root directory
+
+    MODEL: Model name or unique_id whose ancestors and descendants to list;
+    without it, print graph totals and the nodes with the highest fan-out.
+    """
+    from rich.table import Table
+
+    from .graph import DependencyGraph
+    from .parsers import load_artifacts
+
+    try:
+        manifest, _ = load_artifacts(
+            project_path,
+            cache=cache,
+            cache_dir=cache_dir,
+            fields=DependencyGraph.MANIFEST_FIELDS,
+            json_backend=json_backend,
         )
-        console.print(
-            "\n[yellow]Next steps:[/yellow]\n"
-            "1. Review schema_suggestions.yml\n"
-            "2. Customize accepted_values and relationships tests\n"
-            "3. Remove [AUTO] prefixes from descriptions\n"
-            "4. Copy relevant tests to your models/ directory\n"
-            "5. Run 'dbt test' to validate"
+        graph = DependencyGraph.from_manifest(manifest)
+        order = graph.topological_order()
+    except Exception as e:
+        _console().print(f"[red]Error:[/red] {e}", style="red")
+        raise click.Abort() from e
+
+    if model is None:
+        _console().print(
+            f"[bold]Dependency graph:[/bold] {len(graph)} nodes, {graph.edge_count} edges"
         )
+        fan_out = graph.fan_out_counts()
+        table = Table(title=f"Highest fan-out (top {top})")
+        table.add_column("Node", style="cyan")
+        table.add_column("Direct dependents", justify="right")
+        table.add_column("All dependents", justify="right")
+        # Ties resolved by topological position, so upstream nodes come first
+        position = {unique_id: i for i, unique_id in enumerate(order)}
+        ranked = sorted(fan_out, key=lambda unique_id: (-fan_out[unique_id], position[unique_id]))
+        for unique_id in ranked[:top]:
+            if not fan_out[unique_id]:
+                break
+            table.add_row(
+                unique_id, str(fan_out[unique_id]), str(len(graph.descendants(unique_id)))
+            )
+        _console().print(table)
+        return
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}", style="red")
-        raise click.Abort()
+    unique_id = model
+    if unique_id not in graph:
+        matches = [uid for uid, node in manifest.models.items() if node.name == model]
+        if len(matches) != 1:
+            problem = "is ambiguous" if matches else "not found"
+            raise click.BadParameter(f"Model '{model}' {problem}", param_hint="MODEL")
+        unique_id = matches[0]
+
+    sides = ["upstream", "downstream"] if direction == "both" else [direction]
+    for side in sides:
+        nodes = graph.ancestors(unique_id) if side == "upstream" else graph.descendants(unique_id)
+        _console().print(f"[bold]{side.capitalize()} of {unique_id}:[/bold] {len(nodes)}")
+        for node in nodes:
+            _console().print(f"  {node}")
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar=SOCKET_ENV_VAR,
+    help="Unix socket to listen on (default: $XDG_RUNTIME_DIR/dbt-guardian-<uid>.sock)",
+)
+@click.option(
+    "--json-backend",
+    type=click.Choice(BACKEND_NAMES, case_sensitive=False),
+    envvar=BACKEND_ENV_VAR,
+    help="JSON decoder for artifacts (default: auto, the fastest installed)",
+)
+def serve(socket_path: Path | None, json_backend: str | None) -> None:
+    """Keep analyzed projects in memory and answer requests over a Unix socket.
+
+    Use 'dbt-guardian-client analyze PROJECT_PATH' to query the server.
+    Projects are re-parsed only when their artifacts change.
+    """
+    from .server import GuardianServer, ProjectStore
+
+    socket_path = socket_path or default_socket_path()
+    try:
+        server = GuardianServer(socket_path, ProjectStore(json_backend))
+    except RuntimeError as e:
+        _console().print(f"[red]Error:[/red] {e}", style="red")
+        raise click.Abort() from e
+
+    _console().print(f"[bold]dbt Guardian server listening on[/bold] {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    _console().print("[dim]Server stopped[/dim]")
 
 
 @cli.command()
@@ -230,12 +828,14 @@ def info(project_path: Path) -> None:
 
     PROJECT_PATH: Path to dbt project root directory
     """
-    console.print(f"[bold]dbt Project Info:[/bold] {project_path}")
+    from .parsers import ProjectParser
+
+    _console().print(f"[bold]dbt Project Info:[/bold] {project_path}")
 
     # Parse project file
     project_file = project_path / "dbt_project.yml"
     if not project_file.exists():
-        console.print(
+        _console().print(
             "[red]Error:[/red] dbt_project.yml not found. "
             "Is this a dbt project?",
             style="red",
@@ -246,14 +846,16 @@ def info(project_path: Path) -> None:
         parser = ProjectParser()
         project = parser.parse_project(project_file)
 
-        console.print(f"\n[cyan]Name:[/cyan] {project.name}")
-        console.print(f"[cyan]Version:[/cyan] {project.version}")
-        console.print(f"[cyan]Profile:[/cyan] {project.profile}")
-        console.print(f"[cyan]Model paths:[/cyan] {', '.join(project.model_paths)}")
-        console.print(f"[cyan]Test paths:[/cyan] {', '.join(project.test_paths)}")
+        _console().print(f"\n[cyan]Name:[/cyan] {project.name}")
+        _console().print(f"[cyan]Version:[/cyan] {project.version}")
+        _console().print(f"[cyan]Profile:[/cyan] {project.profile}")
+        _console().print(f"[cyan]Model paths:[/cyan] {', '.join(project.model_paths)}")
+        _console().print(f"[cyan]Test paths:[/cyan] {', '.join(project.test_paths)}")
+        schema_files = parser.find_schema_files(project_path, project.model_paths)
+        _console().print(f"[cyan]Schema files:[/cyan] {len(schema_files)}")
 
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}", style="red")
+        _console().print(f"[red]Error:[/red] {e}", style="red")
         raise click.Abort()
 
 
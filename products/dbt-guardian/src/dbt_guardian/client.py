@@ -0,0 +1,143 @@
+"""Thin client for a running ``dbt-guardian serve`` process.
+
+Deliberately imports nothing beyond the standard library, so a request costs
+interpreter startup plus one round trip instead of importing rich, pydantic and
+yaml and re-parsing artifacts.
+
+Protocol: one JSON object per line over a Unix stream socket. Requests carry a
+``command`` (``ping``, ``analyze``, ``generate-tests``, ``shutdown``) and its
+arguments; responses are ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": "..."}``.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SOCKET_ENV_VAR = "DBT_GUARDIAN_SOCKET"
+DEFAULT_TIMEOUT = 300.0  # Seconds; a cold analysis of a large project can be slow
+
+
+class ServerError(RuntimeError):
+    """The server could not be reached or reported an error."""
+
+
+def default_socket_path() -> Path:
+    """Socket path from ``DBT_GUARDIAN_SOCKET``, else a per-user runtime location."""
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"dbt-guardian-{os.getuid()}.sock"
+
+
+def send_request(
+    request: Dict[str, Any],
+    socket_path: Optional[Path] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Any:
+    """Send one request to the server and return its result.
+
+    Args:
+        request: Request object with a ``command`` key
+        socket_path: Server socket (default: ``default_socket_path()``)
+        timeout: Seconds to wait for the response
+
+    Returns:
+        The response's ``result`` value
+
+    Raises:
+        ServerError: If no server is listening or the request failed
+    """
+    path = socket_path or default_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise ServerError(f"No dbt-guardian server at {path} (start one with 'serve')") from e
+    except OSError as e:
+        raise ServerError(f"Server request failed: {e}") from e
+
+    if not line:
+        raise ServerError("Server closed the connection without responding")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise ServerError(response.get("error", "unknown server error"))
+    return response.get("result")
+
+
+def _print_analysis(result: Dict[str, Any], limit: int) -> None:
+    """Plain-text summary matching the fields of ``dbt-guardian analyze``."""
+    print(f"Models:             {result['total_models']}")
+    print(f"Columns:            {result['total_columns']}")
+    print(f"Tested Columns:     {result['tested_columns']}")
+    print(f"Coverage:           {result['coverage_percentage']:.1f}%")
+    print(f"Gaps Found:         {result['total_gaps']}")
+    print(f"High Priority Gaps: {result['high_priority_gaps']}")
+    gaps = result["gaps"]
+    for gap in gaps[:limit]:
+        tests = ", ".join(gap["suggested_tests"])
+        print(f"  [{gap['priority']}] {gap['model_name']}.{gap['column_name']}: {tests}")
+    if len(gaps) > limit:
+        print(f"  ... and {len(gaps) - limit} more gaps")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for ``dbt-guardian-client``."""
+    import argparse  # Only the command-line client needs it, not importers of this module
+
+    parser = argparse.ArgumentParser(
+        prog="dbt-guardian-client",
+        description="Send requests to a running 'dbt-guardian serve' process.",
+    )
+    parser.add_argument("--socket", type=Path, help="Server socket path")
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON result")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    analyze = commands.add_parser("analyze", help="Analyze a project for coverage gaps")
+    analyze.add_argument("project_path", type=Path)
+    analyze.add_argument("--priority", type=int, default=3)
+
+    generate = commands.add_parser("generate-tests", help="Write schema.yml suggestions")
+    generate.add_argument("project_path", type=Path)
+    generate.add_argument("--priority", type=int, default=3)
+    generate.add_argument("--output", "-o", type=Path)
+
+    commands.add_parser("ping", help="Check that the server is running")
+    commands.add_parser("shutdown", help="Stop the server")
+
+    args = parser.parse_args(argv)
+    request: Dict[str, Any] = {"command": args.command}
+    if args.command in ("analyze", "generate-tests"):
+        request["project_path"] = str(args.project_path.resolve())
+        request["priority"] = args.priority
+    if args.command == "generate-tests" and args.output:
+        request["output"] = str(args.output.resolve())
+
+    try:
+        result = send_request(request, args.socket)
+    except ServerError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json or args.command not in ("analyze", "generate-tests"):
+        print(json.dumps(result, indent=2))
+    elif args.command == "analyze":
+        _print_analysis(result, limit=20)
+    else:
+        print(f"Generated: {result['output']}")
+        print(f"Coverage: {result['coverage_percentage']:.1f}%")
+        print(f"Suggestions: {result['suggestions']} tests (priority <= {args.priority})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
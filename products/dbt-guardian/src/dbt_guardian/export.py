@@ -0,0 +1,156 @@
+"""Machine-readable coverage output, written gap by gap.
+
+Each writer consumes an iterable of ``ColumnGap`` and writes every record as
+soon as it arrives, so piping hundreds of thousands of gaps into a loader
+needs no more memory than one record (or one batch, for ``columnar``).
+
+Formats:
+    json: ``{"gaps": [...], "summary": {...}}``; the summary comes last
+        because totals are only known once every gap has been produced
+    ndjson: one gap object per line
+    csv: header row, then one row per gap; list fields are ``;``-joined
+    columnar: one JSON object per line per batch of up to
+        ``COLUMNAR_BATCH_ROWS`` gaps, mapping each field to its column of
+        values (the row-group layout of Parquet/Arrow, without the dependency)
+
+Standard library only: the CLI imports this module at startup.
+"""
+
+import csv
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+if TYPE_CHECKING:
+    from .analyzers import ColumnGap
+
+FORMATS = ("json", "ndjson", "csv", "columnar")
+
+GAP_FIELDS = (
+    "model_name",
+    "column_name",
+    "column_type",
+    "existing_tests",
+    "suggested_tests",
+    "priority",
+    "rationale",
+    "inferred_parent_table",
+)
+
+COLUMNAR_BATCH_ROWS = 10_000
+
+CSV_LIST_SEPARATOR = ";"
+
+# Totals to append after the gaps (called once iteration has finished)
+SummaryFn = Callable[[], Dict[str, Any]]
+
+
+def gap_record(gap: "ColumnGap") -> Dict[str, Any]:
+    """JSON-serializable record of a gap, keyed by ``GAP_FIELDS``."""
+    return {
+        "model_name": gap.model_name,
+        "column_name": gap.column_name,
+        "column_type": gap.column_type,
+        "existing_tests": list(gap.existing_tests),
+        "suggested_tests": [t.value for t in gap.suggested_tests],
+        "priority": gap.priority,
+        "rationale": gap.rationale,
+        "inferred_parent_table": gap.inferred_parent_table,
+    }
+
+
+def write_gaps(
+    gaps: Iterable["ColumnGap"],
+    fmt: str,
+    out: TextIO,
+    summary: Optional[SummaryFn] = None,
+) -> int:
+    """Write gaps to ``out`` in ``fmt`` as they are produced.
+
+    Args:
+        gaps: Gaps to write; consumed lazily
+        fmt: One of ``FORMATS``
+        out: Text stream (open files for CSV with ``newline=""``)
+        summary: Totals to include where the format has room for them (json)
+
+    Returns:
+        Number of gaps written
+
+    Raises:
+        ValueError: If ``fmt`` is not a known format
+    """
+    writer = _WRITERS.get(fmt)
+    if writer is None:
+        raise ValueError(f"Unknown format {fmt!r} (expected one of: {', '.join(FORMATS)})")
+    return writer(gaps, out, summary)
+
+
+def _write_json(gaps: Iterable["ColumnGap"], out: TextIO, summary: Optional[SummaryFn]) -> int:
+    count = 0
+    out.write('{"gaps": [')
+    for gap in gaps:
+        out.write(",\n  " if count else "\n  ")
+        out.write(json.dumps(gap_record(gap)))
+        count += 1
+    out.write("\n]" if count else "]")
+    if summary is not None:
+        out.write(', "summary": ' + json.dumps(summary()))
+    out.write("}\n")
+    return count
+
+
+def _write_ndjson(gaps: Iterable["ColumnGap"], out: TextIO, summary: Optional[SummaryFn]) -> int:
+    count = 0
+    for gap in gaps:
+        out.write(json.dumps(gap_record(gap)) + "\n")
+        count += 1
+    return count
+
+
+def _write_csv(gaps: Iterable["ColumnGap"], out: TextIO, summary: Optional[SummaryFn]) -> int:
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(GAP_FIELDS)
+    count = 0
+    for gap in gaps:
+        writer.writerow(
+            (
+                gap.model_name,
+                gap.column_name,
+                gap.column_type or "",
+                CSV_LIST_SEPARATOR.join(gap.existing_tests),
+                CSV_LIST_SEPARATOR.join(t.value for t in gap.suggested_tests),
+                gap.priority,
+                gap.rationale,
+                gap.inferred_parent_table or "",
+            )
+        )
+        count += 1
+    return count
+
+
+def _write_columnar(
+    gaps: Iterable["ColumnGap"], out: TextIO, summary: Optional[SummaryFn]
+) -> int:
+    count = 0
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        columns = {name: [record[name] for record in batch] for name in GAP_FIELDS}
+        out.write(json.dumps({"rows": len(batch), "columns": columns}) + "\n")
+        batch.clear()
+
+    for gap in gaps:
+        batch.append(gap_record(gap))
+        count += 1
+        if len(batch) >= COLUMNAR_BATCH_ROWS:
+            flush()
+    if batch:
+        flush()
+    return count
+
+
+_WRITERS = {
+    "json": _write_json,
+    "ndjson": _write_ndjson,
+    "csv": _write_csv,
+    "columnar": _write_columnar,
+}
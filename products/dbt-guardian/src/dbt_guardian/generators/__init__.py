@@ -1,5 +1,6 @@
 """Test generation and PR creation."""
 
 from .schema_yaml import SchemaYamlGenerator
+from .sharded import ShardedSchemaWriter, ShardFile
 
-__all__ = ["SchemaYamlGenerator"]
+__all__ = ["SchemaYamlGenerator", "ShardedSchemaWriter", "ShardFile"]
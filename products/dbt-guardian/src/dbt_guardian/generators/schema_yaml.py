@@ -3,17 +3,26 @@
 Converts test coverage gaps into PR-ready dbt schema.yml format.
 """
 
+import io
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import yaml
+from typing import Dict, List, Optional, TextIO
 
 from ..analyzers.coverage import ColumnGap, CoverageReport, TestType
+from ..utils import yaml_io
 
 
 class SchemaYamlGenerator:
     """Generate dbt schema.yml files from test suggestions."""
 
+    def __init__(self, yaml_backend: Optional[str] = None) -> None:
+        """Create a generator.
+
+        Args:
+            yaml_backend: YAML loader/dumper to use (see ``utils.yaml_io``); the
+                output is identical with every backend
+        """
+        self.yaml_backend = yaml_backend
+
     def generate(
         self,
         report: CoverageReport,
@@ -22,6 +31,9 @@ class SchemaYamlGenerator:
     ) -> str:
         """Generate schema.yml content from coverage report.
 
+        Holds the whole document in memory; use ``write_file`` to stream a
+        large report straight to disk.
+
         Args:
             report: Coverage analysis report
             output_path: Optional path to write YAML file
@@ -30,21 +42,59 @@ class SchemaYamlGenerator:
         Returns:
             Generated YAML content as string
         """
-        # Filter gaps by priority
-        gaps = [g for g in report.gaps if g.priority <= priority_threshold]
+        buffer = io.StringIO()
+        self.write(report, buffer, priority_threshold)
+        full_content = buffer.getvalue()
+
+        # Write to file if path provided
+        if output_path:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w") as f:
+                f.write(full_content)
+
+        return full_content
+
+    def write_file(
+        self, report: CoverageReport, output_path: Path, priority_threshold: int = 5
+    ) -> None:
+        """Stream schema.yml to ``output_path`` (see ``write``).
+
+        Args:
+            report: Coverage analysis report
+            output_path: YAML file to write (parent directories are created)
+            priority_threshold: Only include gaps with priority <= threshold (1-5)
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w") as f:
+            self.write(report, f, priority_threshold)
 
+    def write(self, report: CoverageReport, out: TextIO, priority_threshold: int = 5) -> None:
+        """Write schema.yml to ``out`` one model block at a time.
+
+        The header and each model's YAML are written as soon as they are built,
+        so memory holds one model's block rather than the whole document. The
+        bytes match a single ``yaml.dump`` of ``{"version": 2, "models": [...]}``:
+        top-level sequence items are not indented, so dumping each model as a
+        one-item list yields exactly its slice of the full document.
+
+        Args:
+            report: Coverage analysis report
+            out: Text stream to write to
+            priority_threshold: Only include gaps with priority <= threshold (1-5)
+        """
         # Group gaps by model
         gaps_by_model: Dict[str, List[ColumnGap]] = {}
-        for gap in gaps:
-            if gap.model_name not in gaps_by_model:
-                gaps_by_model[gap.model_name] = []
-            gaps_by_model[gap.model_name].append(gap)
+        for gap in report.gaps:
+            if gap.priority <= priority_threshold:
+                gaps_by_model.setdefault(gap.model_name, []).append(gap)
+
+        out.write(self._generate_header(report, priority_threshold) + "\n")
+        out.write(yaml_io.dump({"version": 2}, backend=self.yaml_backend))
 
-        # Build schema structure
-        models = []
-        for model_name, model_gaps in sorted(gaps_by_model.items()):
+        wrote_model = False
+        for model_name in sorted(gaps_by_model):
             columns = []
-            for gap in sorted(model_gaps, key=lambda g: g.column_name):
+            for gap in sorted(gaps_by_model[model_name], key=lambda g: g.column_name):
                 tests = self._generate_tests_for_column(gap)
                 if tests:
                     columns.append(
@@ -56,30 +106,14 @@ class SchemaYamlGenerator:
                     )
 
             if columns:
-                models.append({"name": model_name, "columns": columns})
-
-        schema = {"version": 2, "models": models}
-
-        # Convert to YAML with nice formatting
-        yaml_content = yaml.dump(
-            schema,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-            width=100,
-        )
-
-        # Add header comment
-        header = self._generate_header(report, priority_threshold)
-        full_content = f"{header}\n{yaml_content}"
+                if not wrote_model:
+                    out.write("models:\n")
+                    wrote_model = True
+                block = [{"name": model_name, "columns": columns}]
+                out.write(yaml_io.dump(block, backend=self.yaml_backend))
 
-        # Write to file if path provided
-        if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(full_content)
-
-        return full_content
+        if not wrote_model:
+            out.write(yaml_io.dump({"models": []}, backend=self.yaml_backend))
 
     def _generate_tests_for_column(self, gap: ColumnGap) -> List[Dict]:
         """Generate test configurations for a column.
@@ -180,80 +214,96 @@ class SchemaYamlGenerator:
             raise FileNotFoundError(f"Schema not found: {existing_schema_path}")
 
         with open(existing_schema_path, "r") as f:
-            existing = yaml.safe_load(f)
+            existing = yaml_io.safe_load(f, self.yaml_backend)
 
         if not existing or "models" not in existing:
             # If empty or invalid, generate from scratch
             return self.generate(report, output_path, priority_threshold)
 
-        # Build index of existing models and columns
-        existing_models = {m["name"]: m for m in existing.get("models", [])}
-
         # Filter gaps by priority
         gaps = [g for g in report.gaps if g.priority <= priority_threshold]
+        self.merge_gaps(existing, gaps)
+
+        # Convert to YAML
+        yaml_content = yaml_io.dump(existing, backend=self.yaml_backend)
+
+        # Add header
+        header = self._generate_header(report, priority_threshold)
+        full_content = f"{header}\n{yaml_content}"
+
+        # Write to file if path provided
+        if output_path:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w") as f:
+                f.write(full_content)
 
-        # Merge suggestions
+        return full_content
+
+    def merge_gaps(self, schema: Dict, gaps: List[ColumnGap]) -> Dict:
+        """Merge gap suggestions into a parsed schema.yml in place.
+
+        Gaps are grouped by model, and each model's column index is built once
+        and then used for all of that model's gaps, so the merge is linear in
+        gaps plus existing columns. New models and columns are appended in the
+        order of their first gap; existing tests are kept and duplicates skipped.
+
+        Args:
+            schema: Parsed schema.yml with a ``models`` list
+            gaps: Gaps to merge, in the order suggestions should be appended
+
+        Returns:
+            ``schema``, with its ``models`` list updated
+        """
+        # Build index of existing models
+        existing_models = {m["name"]: m for m in schema.get("models", [])}
+
+        gaps_by_model: Dict[str, List[ColumnGap]] = {}
         for gap in gaps:
-            if gap.model_name not in existing_models:
-                # Add new model
-                existing_models[gap.model_name] = {
-                    "name": gap.model_name,
-                    "columns": [],
-                }
+            gaps_by_model.setdefault(gap.model_name, []).append(gap)
 
-            model = existing_models[gap.model_name]
-            if "columns" not in model:
+        for model_name, model_gaps in gaps_by_model.items():
+            model = existing_models.get(model_name)
+            if model is None:
+                # Add new model
+                model = existing_models[model_name] = {"name": model_name, "columns": []}
+            if model.get("columns") is None:
                 model["columns"] = []
 
-            # Find or create column
-            existing_cols = {c["name"]: c for c in model["columns"]}
-            if gap.column_name not in existing_cols:
-                # Add new column
+            # Column index and test names, built once per model
+            columns = {c["name"]: c for c in model["columns"]}
+            test_names: Dict[str, set] = {}
+
+            for gap in model_gaps:
                 tests = self._generate_tests_for_column(gap)
-                model["columns"].append(
-                    {
+                column = columns.get(gap.column_name)
+                if column is None:
+                    # Add new column
+                    column = {
                         "name": gap.column_name,
                         "description": f"[AUTO] {gap.rationale}",
                         "tests": tests,
                     }
-                )
-            else:
+                    model["columns"].append(column)
+                    columns[gap.column_name] = column
+                    continue
+
                 # Append tests to existing column
-                column = existing_cols[gap.column_name]
                 if "tests" not in column:
                     column["tests"] = []
-
-                existing_test_names = self._extract_test_names(column["tests"])
-                new_tests = self._generate_tests_for_column(gap)
-
-                for test in new_tests:
-                    test_name = test if isinstance(test, str) else list(test.keys())[0]
-                    if test_name not in existing_test_names:
+                names = test_names.get(gap.column_name)
+                if names is None:
+                    names = test_names[gap.column_name] = self._extract_test_names(
+                        column["tests"]
+                    )
+                for test in tests:
+                    test_name = test if isinstance(test, str) else next(iter(test))
+                    if test_name not in names:
                         column["tests"].append(test)
+                        names.add(test_name)
 
         # Rebuild models list
-        existing["models"] = list(existing_models.values())
-
-        # Convert to YAML
-        yaml_content = yaml.dump(
-            existing,
-            default_flow_style=False,
-            sort_keys=False,
-            allow_unicode=True,
-            width=100,
-        )
-
-        # Add header
-        header = self._generate_header(report, priority_threshold)
-        full_content = f"{header}\n{yaml_content}"
-
-        # Write to file if path provided
-        if output_path:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(full_content)
-
-        return full_content
+        schema["models"] = list(existing_models.values())
+        return schema
 
     def _extract_test_names(self, tests: List) -> set:
         """Extract test names from test definitions.
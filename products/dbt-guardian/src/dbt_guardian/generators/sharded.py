@@ -0,0 +1,175 @@
+"""Write schema suggestions as one file per model directory.
+
+A single project-wide schema_suggestions.yml gets slow for dbt to load and for
+people to review. Sharded output groups gaps by the directory of each model's
+``original_file_path`` and writes a suggestions file next to the models it
+covers (e.g. models/staging/schema_suggestions.yml). Shards are written in
+parallel, each atomically (temp file then rename), and the files written are
+recorded in a JSON shard manifest. The next run uses that manifest to remove
+shards that no longer have any suggestions.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set
+
+from ..analyzers.coverage import ColumnGap, CoverageReport
+from ..parsers.manifest import DbtManifest
+from ..utils.atomic import write_atomic
+from .schema_yaml import SchemaYamlGenerator
+
+DEFAULT_SHARD_FILENAME = "schema_suggestions.yml"
+DEFAULT_SHARD_MANIFEST = Path("target") / "dbt_guardian_shards.json"
+
+SHARD_MANIFEST_VERSION = 1
+
+
+@dataclass
+class ShardFile:
+    """One suggestions file written by a sharded run."""
+
+    path: str  # Relative to the project root, with forward slashes
+    models: List[str]
+    gaps: int
+
+
+class ShardedSchemaWriter:
+    """Write per-directory schema suggestion files for a dbt project."""
+
+    def __init__(self, filename: str = DEFAULT_SHARD_FILENAME, jobs: int = 1) -> None:
+        """Configure the writer.
+
+        Args:
+            filename: Name of the suggestions file in each model directory
+            jobs: Write shards in N worker processes
+        """
+        self.filename = filename
+        self.jobs = jobs
+
+    def shard(
+        self, report: CoverageReport, manifest: DbtManifest, priority_threshold: int = 5
+    ) -> Dict[str, List[ColumnGap]]:
+        """Group gaps by the shard file they belong in.
+
+        Models without an ``original_file_path`` go to the project root.
+
+        Args:
+            report: Coverage analysis report
+            manifest: Manifest parsed with ``original_file_path``
+            priority_threshold: Only include gaps with priority <= threshold
+
+        Returns:
+            Gaps keyed by shard path relative to the project root, sorted by path
+        """
+        # Root-project models first, so a package model of the same name
+        # never moves a root model's shard (sorted() is stable)
+        root_prefix = f"model.{manifest.metadata.get('project_name')}."
+        models = sorted(
+            manifest.models.values(), key=lambda m: not m.unique_id.startswith(root_prefix)
+        )
+        directories: Dict[str, PurePosixPath] = {}
+        for model in models:
+            if model.original_file_path:
+                directories.setdefault(
+                    model.name, PurePosixPath(model.original_file_path).parent
+                )
+
+        shards: Dict[str, List[ColumnGap]] = {}
+        for gap in report.gaps:
+            if gap.priority <= priority_threshold:
+                directory = directories.get(gap.model_name, PurePosixPath("."))
+                shards.setdefault(str(directory / self.filename), []).append(gap)
+        return dict(sorted(shards.items()))
+
+    def write(
+        self,
+        report: CoverageReport,
+        manifest: DbtManifest,
+        project_path: Path,
+        priority_threshold: int = 5,
+        manifest_path: Optional[Path] = None,
+    ) -> List[ShardFile]:
+        """Write every shard and the shard manifest.
+
+        Args:
+            report: Coverage analysis report
+            manifest: Manifest parsed with ``original_file_path``
+            project_path: dbt project root the shard paths are relative to
+            priority_threshold: Only include gaps with priority <= threshold
+            manifest_path: Shard manifest location
+                (default: ``target/dbt_guardian_shards.json``)
+
+        Returns:
+            The files written, sorted by path
+        """
+        manifest_path = manifest_path or project_path / DEFAULT_SHARD_MANIFEST
+        shards = self.shard(report, manifest, priority_threshold)
+
+        # Each shard's header reports project-wide coverage
+        tasks = [
+            (
+                project_path / shard_path,
+                CoverageReport(
+                    total_models=report.total_models,
+                    total_columns=report.total_columns,
+                    tested_columns=report.tested_columns,
+                    coverage_percentage=report.coverage_percentage,
+                    gaps=gaps,
+                ),
+                priority_threshold,
+            )
+            for shard_path, gaps in shards.items()
+        ]
+        if self.jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(tasks))) as executor:
+                list(executor.map(_write_shard, *zip(*tasks, strict=True)))
+        else:
+            for task in tasks:
+                _write_shard(*task)
+
+        files = [
+            ShardFile(
+                path=shard_path,
+                models=sorted({gap.model_name for gap in gaps}),
+                gaps=len(gaps),
+            )
+            for shard_path, gaps in shards.items()
+        ]
+        self._remove_stale(project_path, manifest_path, {f.path for f in files})
+        shard_manifest = {
+            "version": SHARD_MANIFEST_VERSION,
+            "filename": self.filename,
+            "priority_threshold": priority_threshold,
+            "files": [asdict(f) for f in files],
+        }
+        text = json.dumps(shard_manifest, indent=2) + "\n"
+        write_atomic(manifest_path, lambda f: f.write(text), mode=0o644)
+        return files
+
+    @staticmethod
+    def _remove_stale(project_path: Path, manifest_path: Path, current: Set[str]) -> None:
+        """Delete shards listed by the previous run that this run did not write."""
+        try:
+            with open(manifest_path, "r") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            return
+        filename = previous.get("filename")
+        for entry in previous.get("files", []):
+            path = entry.get("path")
+            # Only ever delete suggestion files this writer created
+            if (
+                isinstance(path, str)
+                and path not in current
+                and PurePosixPath(path).name == filename
+            ):
+                (project_path / path).unlink(missing_ok=True)
+
+
+def _write_shard(path: Path, report: CoverageReport, priority_threshold: int) -> None:
+    """Render one shard and write it atomically (worker entry point)."""
+    generator = SchemaYamlGenerator()
+    # mkstemp creates 0600; these are ordinary project files
+    write_atomic(path, lambda f: generator.write(report, f, priority_threshold), mode=0o644)
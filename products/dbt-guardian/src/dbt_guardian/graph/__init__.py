@@ -0,0 +1,5 @@
+"""Dependency graphs built from manifest ``depends_on`` edges."""
+
+from .dag import DependencyGraph
+
+__all__ = ["DependencyGraph"]
@@ -1,7 +1,34 @@
-"""dbt project parsing — manifest, catalog, YAML."""
+"""dbt project parsing — manifest, catalog, YAML.
 
-from .manifest import ManifestParser
-from .catalog import CatalogParser
-from .project import ProjectParser
+Parsers are imported on first access, so a command that only reads
+dbt_project.yml does not pay for defining the manifest and catalog models.
+"""
 
-__all__ = ["ManifestParser", "CatalogParser", "ProjectParser"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import ArtifactCache
+    from .catalog import CatalogParser
+    from .loader import load_artifacts
+    from .manifest import ManifestParser
+    from .project import ProjectParser
+
+_EXPORTS = {
+    "ManifestParser": ".manifest",
+    "CatalogParser": ".catalog",
+    "ProjectParser": ".project",
+    "ArtifactCache": ".cache",
+    "load_artifacts": ".loader",
+}
+
+__all__ = ["ManifestParser", "CatalogParser", "ProjectParser", "ArtifactCache", "load_artifacts"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
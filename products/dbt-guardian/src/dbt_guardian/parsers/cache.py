@@ -0,0 +1,185 @@
+"""On-disk cache of parsed dbt artifacts.
+
+Parsing manifest.json/catalog.json dominates run time on large projects, and CI
+steps often re-parse the same unchanged artifacts. The cache stores the parsed
+``DbtManifest``/``DbtCatalog`` as pickles keyed by the artifact's content hash,
+so a warm run skips JSON decoding and pydantic validation entirely.
+
+File size and mtime are recorded next to each content hash so an unchanged
+artifact is not re-hashed on every run.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import pydantic
+
+from .. import __version__
+from ..utils.atomic import write_atomic
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_DIRNAME = ".dbt_guardian_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the pickled shape of parsed artifacts changes
+CACHE_FORMAT_VERSION = 6
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+class ArtifactCache:
+    """Size-bounded, content-addressed cache of parsed artifacts.
+
+    Entries are pickles written by this package; only point the cache at a
+    directory you control.
+    """
+
+    INDEX_FILE = "index.json"
+    ENTRY_SUFFIX = ".pkl"
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Create a cache rooted at ``cache_dir``.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_bytes: Evict least recently used entries beyond this total size
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_project(
+        cls, project_path: Path, cache_dir: Optional[Path] = None
+    ) -> "ArtifactCache":
+        """Create the cache for a dbt project (default: ``target/.dbt_guardian_cache``)."""
+        return cls(cache_dir or project_path / "target" / DEFAULT_CACHE_DIRNAME)
+
+    def get_or_parse(
+        self, artifact_path: Path, parse: Callable[[Path], T], variant: str = ""
+    ) -> T:
+        """Return the cached parse of ``artifact_path``, parsing and storing on a miss.
+
+        Args:
+            artifact_path: Path to the artifact (manifest.json, catalog.json)
+            parse: Parser callable used on a cache miss
+            variant: Distinguishes parses of the same file with different options
+
+        Returns:
+            The parsed artifact
+        """
+        key = self.key(artifact_path, variant)
+        cached = self.load(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+
+        value = parse(artifact_path)
+        self.store(key, value)
+        return value
+
+    def key(self, artifact_path: Path, variant: str = "") -> str:
+        """Build the cache key for an artifact.
+
+        The key covers the artifact's size and content hash plus the package,
+        cache format and pydantic versions, so upgrades never read stale pickles.
+        """
+        size, digest = self._fingerprint(artifact_path)
+        material = "|".join(
+            [
+                __version__,
+                str(CACHE_FORMAT_VERSION),
+                pydantic.VERSION,
+                artifact_path.name,
+                variant,
+                str(size),
+                digest,
+            ]
+        )
+        return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+    def load(self, key: str) -> Optional[Any]:
+        """Load an entry, or return None on a miss or unreadable entry."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or incompatible entry: drop it and treat as a miss
+            entry.unlink(missing_ok=True)
+            return None
+
+        os.utime(entry)  # Mark as recently used for eviction
+        return value
+
+    def store(self, key: str, value: Any) -> None:
+        """Write an entry atomically, then evict down to ``max_bytes``."""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        write_atomic(self._entry_path(key), lambda f: f.write(data), binary=True)
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all cache entries and the fingerprint index."""
+        if not self.cache_dir.exists():
+            return
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+        (self.cache_dir / self.INDEX_FILE).unlink(missing_ok=True)
+
+    def _fingerprint(self, artifact_path: Path) -> Tuple[int, str]:
+        """Return (size, content hash), reusing the stored hash if size and mtime match."""
+        stat = artifact_path.stat()
+        index = self._read_index()
+        record_key = str(artifact_path.resolve())
+        record = index.get(record_key)
+        if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+            return stat.st_size, record["digest"]
+
+        hasher = hashlib.blake2b()
+        with open(artifact_path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+
+        index[record_key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        text = json.dumps(index)
+        write_atomic(self.cache_dir / self.INDEX_FILE, lambda f: f.write(text))
+        return stat.st_size, digest
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the fingerprint index, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.cache_dir / self.INDEX_FILE, "r") as f:
+                index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.ENTRY_SUFFIX}"
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
@@ -4,15 +4,23 @@ The catalog contains warehouse metadata: actual columns, types, row counts, fres
 This complements the manifest with real data warehouse state.
 """
 
-import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Type, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from ..utils.json_backend import load_json
+from ..utils.profiling import stage
 
-class CatalogColumn(BaseModel):
-    """A column from the data warehouse catalog."""
+
+@dataclass(slots=True)
+class CatalogColumn:
+    """A column from the data warehouse catalog.
+
+    A slotted dataclass for the same reason as ``DbtColumn``; strict parsing
+    validates it through ``CATALOG_COLUMN_ADAPTER``.
+    """
 
     name: str
     type: str
@@ -20,6 +28,11 @@ class CatalogColumn(BaseModel):
     comment: Optional[str] = None
 
 
+CATALOG_COLUMN_ADAPTER = TypeAdapter(CatalogColumn)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
 class CatalogTable(BaseModel):
     """A table from the data warehouse catalog."""
 
@@ -32,15 +45,78 @@ class CatalogTable(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class LazyCatalogTables(Mapping[str, CatalogTable]):
+    """Catalog tables built on first access.
+
+    Warehouse catalogs often list far more relations than the dbt project
+    manages, and analysis only looks up the project's models. Raw catalog
+    entries are indexed by unique_id and a ``CatalogTable`` is built (once)
+    only when that entry is read. Iterating ``keys()`` or testing membership
+    builds nothing; ``values()`` and ``items()`` build every table.
+    """
+
+    def __init__(
+        self,
+        entries: Dict[str, Dict[str, Any]],
+        build: Callable[[str, Dict[str, Any]], CatalogTable],
+    ) -> None:
+        """Index raw entries.
+
+        Args:
+            entries: Raw catalog entries keyed by unique_id
+            build: Builds a table from (unique_id, raw entry)
+        """
+        self._entries = entries
+        self._build = build
+        self._tables: Dict[str, CatalogTable] = {}
+
+    def __getitem__(self, unique_id: str) -> CatalogTable:
+        table = self._tables.get(unique_id)
+        if table is None:
+            table = self._build(unique_id, self._entries[unique_id])
+            self._tables[unique_id] = table
+        return table
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def materialized(self) -> int:
+        """Number of tables built so far."""
+        return len(self._tables)
+
+
 class DbtCatalog(BaseModel):
     """Parsed dbt catalog.json."""
 
-    tables: Dict[str, CatalogTable] = Field(default_factory=dict)
+    # A LazyCatalogTables when parsed without strict validation
+    tables: Mapping[str, CatalogTable] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class CatalogParser:
-    """Parse dbt catalog.json files."""
+    """Parse dbt catalog.json files.
+
+    Like ``ManifestParser``, objects are built without validation unless
+    ``strict=True``.
+    """
+
+    def __init__(self, strict: bool = False, json_backend: Optional[str] = None) -> None:
+        """Initialize parser.
+
+        Args:
+            strict: Validate every parsed object with pydantic
+            json_backend: JSON decoder to use (see ``utils.json_backend``);
+                None uses ``DBT_GUARDIAN_JSON_BACKEND`` or the fastest installed
+        """
+        self.strict = strict
+        self.json_backend = json_backend
 
     def parse(self, catalog_path: Path) -> DbtCatalog:
         """Parse a catalog.json file.
@@ -54,38 +130,49 @@ class CatalogParser:
         Raises:
             FileNotFoundError: If catalog doesn't exist
             json.JSONDecodeError: If catalog is invalid JSON
+            pydantic.ValidationError: In strict mode, if an entry has unexpected field types
         """
         if not catalog_path.exists():
             raise FileNotFoundError(f"Catalog not found: {catalog_path}")
 
-        with open(catalog_path, "r") as f:
-            raw = json.load(f)
+        with stage("catalog.decode"):
+            raw = load_json(catalog_path, self.json_backend)
 
-        return DbtCatalog(
-            tables=self._parse_tables(raw.get("nodes", {}), raw.get("sources", {})),
-            metadata=raw.get("metadata", {}),
-        )
+        with stage("catalog.build"):
+            return self._build(
+                DbtCatalog,
+                tables=self._parse_tables(raw.get("nodes", {}), raw.get("sources", {})),
+                metadata=raw.get("metadata", {}),
+            )
+
+    def _build(self, model_cls: Type[ModelT], **fields: Any) -> ModelT:
+        """Instantiate a parsed model, validating it only in strict mode."""
+        if self.strict:
+            return model_cls(**fields)
+        return model_cls.model_construct(**fields)
 
     def _parse_tables(
         self, nodes: Dict[str, Any], sources: Dict[str, Any]
-    ) -> Dict[str, CatalogTable]:
-        """Extract tables from catalog nodes and sources."""
-        tables = {}
+    ) -> Mapping[str, CatalogTable]:
+        """Index tables from catalog nodes and sources.
 
-        # Parse model tables
-        for unique_id, node in nodes.items():
-            tables[unique_id] = self._parse_table(unique_id, node)
-
-        # Parse source tables
-        for unique_id, source in sources.items():
-            tables[unique_id] = self._parse_table(unique_id, source)
-
-        return tables
+        Tables are built lazily on lookup, except in strict mode where every
+        entry is validated up front.
+        """
+        # Sources follow nodes, so a source entry wins on a unique_id clash
+        entries = {**nodes, **sources}
+        if not self.strict:
+            return LazyCatalogTables(entries, self._parse_table)
+        return {
+            unique_id: self._parse_table(unique_id, entry)
+            for unique_id, entry in entries.items()
+        }
 
     def _parse_table(self, unique_id: str, data: Dict[str, Any]) -> CatalogTable:
         """Parse a single table from catalog data."""
         metadata = data.get("metadata", {})
-        return CatalogTable(
+        return self._build(
+            CatalogTable,
             unique_id=unique_id,
             name=metadata.get("name", ""),
             schema=metadata.get("schema", ""),
@@ -99,10 +186,15 @@ class CatalogParser:
         """Extract columns from catalog table."""
         parsed = {}
         for col_name, col_data in columns.items():
-            parsed[col_name] = CatalogColumn(
-                name=col_data.get("name", col_name),
-                type=col_data.get("type", "unknown"),
-                index=col_data.get("index", 0),
-                comment=col_data.get("comment"),
+            fields = {
+                "name": col_data.get("name", col_name),
+                "type": col_data.get("type", "unknown"),
+                "index": col_data.get("index", 0),
+                "comment": col_data.get("comment"),
+            }
+            parsed[col_name] = (
+                CATALOG_COLUMN_ADAPTER.validate_python(fields)
+                if self.strict
+                else CatalogColumn(**fields)
             )
         return parsed
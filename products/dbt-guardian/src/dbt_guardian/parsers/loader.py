@@ -0,0 +1,67 @@
+"""Load a dbt project's parsed artifacts, through the on-disk cache when enabled."""
+
+from pathlib import Path
+from typing import FrozenSet, Optional, Tuple
+
+from ..utils.profiling import stage
+from .cache import ArtifactCache
+from .catalog import CatalogParser, DbtCatalog
+from .manifest import DbtManifest, ManifestParser
+
+
+def load_artifacts(
+    project_path: Path,
+    stream: bool = False,
+    cache: bool = True,
+    cache_dir: Optional[Path] = None,
+    fields: Optional[FrozenSet[str]] = None,
+    json_backend: Optional[str] = None,
+) -> Tuple[DbtManifest, Optional[DbtCatalog]]:
+    """Parse target/manifest.json and (if present) target/catalog.json.
+
+    With ``cache`` enabled, parsed artifacts are reused from the on-disk cache
+    while the files are unchanged. ``fields`` projects manifest nodes (see
+    ``ManifestParser.parse``); each projection is cached separately.
+
+    Args:
+        project_path: dbt project root
+        stream: Decode manifest.json node by node to bound memory
+        cache: Reuse parsed artifacts from the on-disk cache
+        cache_dir: Cache directory (default: ``target/.dbt_guardian_cache``)
+        fields: Node fields to keep, or None for all
+        json_backend: JSON decoder for artifacts (see ``utils.json_backend``)
+
+    Returns:
+        The parsed manifest and catalog (None when catalog.json does not exist)
+
+    Raises:
+        FileNotFoundError: If target/manifest.json does not exist
+    """
+    manifest_path = project_path / "target" / "manifest.json"
+    catalog_path = project_path / "target" / "catalog.json"
+
+    manifest_parser = ManifestParser(json_backend=json_backend)
+    catalog_parser = CatalogParser(json_backend=json_backend)
+
+    def parse_manifest(path: Path) -> DbtManifest:
+        return manifest_parser.parse(path, stream=stream, fields=fields)
+
+    variant = "fields=" + ",".join(sorted(fields)) if fields is not None else ""
+
+    artifact_cache = ArtifactCache.for_project(project_path, cache_dir) if cache else None
+
+    with stage("manifest.load"):
+        if artifact_cache:
+            manifest = artifact_cache.get_or_parse(manifest_path, parse_manifest, variant)
+        else:
+            manifest = parse_manifest(manifest_path)
+
+    catalog = None
+    if catalog_path.exists():
+        with stage("catalog.load"):
+            if artifact_cache:
+                catalog = artifact_cache.get_or_parse(catalog_path, catalog_parser.parse)
+            else:
+                catalog = catalog_parser.parse(catalog_path)
+
+    return manifest, catalog
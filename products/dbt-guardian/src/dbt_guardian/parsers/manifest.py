@@ -4,26 +4,57 @@ The manifest contains the full dbt DAG: models, tests, dependencies, columns, SQ
 This is the primary artifact for understanding a dbt project.
 """
 
-import json
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    AbstractSet,
+    Any,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
+from ..utils.json_backend import load_json
+from ..utils.json_stream import iter_json_members
+from ..utils.profiling import stage
 
-class DbtColumn(BaseModel):
-    """A column in a dbt model."""
+
+@dataclass(slots=True)
+class DbtColumn:
+    """A column in a dbt model.
+
+    A slotted dataclass rather than a pydantic model: large projects have
+    hundreds of thousands of columns, so per-instance validation and
+    ``__dict__`` overhead dominate parsing. ``ManifestParser(strict=True)``
+    still validates each column through ``COLUMN_ADAPTER``.
+    """
 
     name: str
     description: Optional[str] = None
-    data_type: Optional[str] = Field(None, alias="type")
-    tests: List[str] = Field(default_factory=list)
-    tags: List[str] = Field(default_factory=list)
+    data_type: Optional[str] = None
+    tests: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+
+
+COLUMN_ADAPTER = TypeAdapter(DbtColumn)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class DbtModel(BaseModel):
     """A dbt model (table, view, or incremental)."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     unique_id: str
     name: str
     schema: str
@@ -35,6 +66,8 @@ class DbtModel(BaseModel):
     tags: List[str] = Field(default_factory=list)
     materialized: str = "view"
     sql: Optional[str] = Field(None, alias="compiled_sql")
+    checksum: Optional[str] = None  # dbt's hash of the model's SQL file
+    original_file_path: Optional[str] = None  # Relative to the project root
 
 
 class DbtTest(BaseModel):
@@ -48,23 +81,180 @@ class DbtTest(BaseModel):
     config: Dict[str, Any] = Field(default_factory=dict)
 
 
+class DbtSeed(BaseModel):
+    """A dbt seed (CSV file loaded into the warehouse)."""
+
+    unique_id: str
+    name: str
+    schema: str
+    database: Optional[str] = None
+    alias: Optional[str] = None
+    description: Optional[str] = None
+    columns: Dict[str, DbtColumn] = Field(default_factory=dict)
+    tags: List[str] = Field(default_factory=list)
+
+
+class DbtSnapshot(BaseModel):
+    """A dbt snapshot (slowly changing dimension capture)."""
+
+    unique_id: str
+    name: str
+    schema: str
+    database: Optional[str] = None
+    alias: Optional[str] = None
+    description: Optional[str] = None
+    columns: Dict[str, DbtColumn] = Field(default_factory=dict)
+    depends_on: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+    strategy: Optional[str] = None  # 'timestamp' or 'check'
+    unique_key: Optional[Any] = None
+
+
+class DbtSource(BaseModel):
+    """A dbt source table declared in a sources: block."""
+
+    unique_id: str
+    name: str
+    source_name: str
+    schema: str
+    database: Optional[str] = None
+    identifier: Optional[str] = None
+    description: Optional[str] = None
+    columns: Dict[str, DbtColumn] = Field(default_factory=dict)
+    tags: List[str] = Field(default_factory=list)
+    loaded_at_field: Optional[str] = None
+
+
+class DbtExposure(BaseModel):
+    """A dbt exposure (downstream dashboard, application, etc.)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    unique_id: str
+    name: str
+    exposure_type: str = Field("", alias="type")
+    description: Optional[str] = None
+    owner: Dict[str, Any] = Field(default_factory=dict)
+    maturity: Optional[str] = None
+    url: Optional[str] = None
+    depends_on: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+
+
 class DbtManifest(BaseModel):
     """Parsed dbt manifest.json."""
 
     models: Dict[str, DbtModel] = Field(default_factory=dict)
     tests: Dict[str, DbtTest] = Field(default_factory=dict)
-    sources: Dict[str, Any] = Field(default_factory=dict)
+    seeds: Dict[str, DbtSeed] = Field(default_factory=dict)
+    snapshots: Dict[str, DbtSnapshot] = Field(default_factory=dict)
+    sources: Dict[str, DbtSource] = Field(default_factory=dict)
+    exposures: Dict[str, DbtExposure] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    # (model unique_id, normalized column name) -> tests attached to that column
+    _column_tests: Dict[Tuple[str, str], List[DbtTest]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the column test index once the manifest is constructed."""
+        self.reindex_tests()
+
+    def reindex_tests(self) -> None:
+        """Rebuild the column test index from ``tests``.
+
+        Call this after mutating ``tests`` in place.
+        """
+        index: Dict[Tuple[str, str], List[DbtTest]] = {}
+        for test in self.tests.values():
+            if test.column and test.model:
+                key = (test.model, normalize_column_name(test.column))
+                index.setdefault(key, []).append(test)
+        self._column_tests = index
+
+    def tests_for_column(self, model_id: str, column_name: str) -> List[DbtTest]:
+        """Return test nodes attached to a model column.
+
+        Args:
+            model_id: Unique ID of the model (e.g., "model.project.orders")
+            column_name: Column name, matched case-insensitively
+
+        Returns:
+            Tests whose node targets this column (empty if none)
+        """
+        return self._column_tests.get((model_id, normalize_column_name(column_name)), [])
+
+
+def normalize_column_name(column_name: str) -> str:
+    """Normalize a column name for matching test nodes to model columns.
+
+    Test nodes carry ``column_name`` as written in YAML, which may be quoted or
+    differ in case from the model's column key.
+    """
+    return column_name.strip().strip('"`[]').lower()
+
 
 class ManifestParser:
-    """Parse dbt manifest.json files."""
+    """Parse dbt manifest.json files.
+
+    dbt artifacts are machine-generated, so by default parsed objects are built
+    without pydantic validation. Pass ``strict=True`` to validate every object,
+    e.g. when debugging a hand-edited or unexpected manifest.
+    """
+
+    # resource_type -> (DbtManifest field, builder method). Every node, source
+    # and exposure is routed through this table exactly once.
+    NODE_BUILDERS: Dict[str, Tuple[str, str]] = {
+        "model": ("models", "_parse_model"),
+        "test": ("tests", "_parse_test"),
+        "seed": ("seeds", "_parse_seed"),
+        "snapshot": ("snapshots", "_parse_snapshot"),
+        "source": ("sources", "_parse_source"),
+        "exposure": ("exposures", "_parse_exposure"),
+    }
+
+    # Top-level manifest sections holding buildable entries, with the
+    # resource_type assumed when an entry omits it
+    NODE_SECTIONS: Dict[str, Optional[str]] = {
+        "nodes": None,
+        "sources": "source",
+        "exposures": "exposure",
+    }
 
-    def parse(self, manifest_path: Path) -> DbtManifest:
+    # Test fields every projection keeps: DbtManifest.tests_for_column indexes
+    # tests by (model, column), and model is always kept as a required field
+    TEST_INDEX_FIELDS: FrozenSet[str] = frozenset({"column"})
+
+    def __init__(self, strict: bool = False, json_backend: Optional[str] = None) -> None:
+        """Initialize parser.
+
+        Args:
+            strict: Validate every parsed object with pydantic
+            json_backend: JSON decoder to use (see ``utils.json_backend``);
+                None uses ``DBT_GUARDIAN_JSON_BACKEND`` or the fastest installed
+        """
+        self.strict = strict
+        self.json_backend = json_backend
+
+    def parse(
+        self,
+        manifest_path: Path,
+        stream: bool = False,
+        fields: Optional[Collection[str]] = None,
+    ) -> DbtManifest:
         """Parse a manifest.json file.
 
         Args:
             manifest_path: Path to manifest.json
+            stream: Decode ``nodes``, ``sources`` and ``exposures`` one entry at a
+                time instead of loading the whole document, so peak memory scales with the
+                largest single node rather than the file size (always uses the
+                stdlib decoder)
+            fields: Optional node fields to keep (e.g. ``{"name", "columns"}``).
+                Required fields such as ``unique_id`` are always kept, as are the
+                test fields ``tests_for_column`` needs (``TEST_INDEX_FIELDS``);
+                every other field is left at its default, so large values like
+                compiled SQL are not retained and columns are not built unless
+                requested. None keeps everything.
 
         Returns:
             Parsed manifest
@@ -73,50 +263,203 @@ class ManifestParser:
             FileNotFoundError: If manifest doesn't exist
             json.JSONDecodeError: If manifest is invalid JSON
             ValueError: If manifest structure is unexpected
+            pydantic.ValidationError: In strict mode, if a node has unexpected field types
         """
         if not manifest_path.exists():
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
-        with open(manifest_path, "r") as f:
-            raw = json.load(f)
+        keep = frozenset(fields) if fields is not None else None
+        if stream:
+            return self._parse_streaming(manifest_path, keep)
+
+        with stage("manifest.decode"):
+            raw = load_json(manifest_path, self.json_backend)
 
-        return DbtManifest(
-            models=self._parse_models(raw.get("nodes", {})),
-            tests=self._parse_tests(raw.get("nodes", {})),
-            sources=raw.get("sources", {}),
-            metadata=raw.get("metadata", {}),
+        entries = (
+            (section, unique_id, node)
+            for section in self.NODE_SECTIONS
+            for unique_id, node in raw.get(section, {}).items()
         )
+        with stage("manifest.build"):
+            return self._build_manifest(entries, raw.get("metadata", {}), keep)
 
-    def _parse_models(self, nodes: Dict[str, Any]) -> Dict[str, DbtModel]:
-        """Extract models from manifest nodes."""
-        models = {}
-        for unique_id, node in nodes.items():
-            if node.get("resource_type") == "model":
-                models[unique_id] = DbtModel(
-                    unique_id=unique_id,
-                    name=node.get("name", ""),
-                    schema=node.get("schema", ""),
-                    database=node.get("database"),
-                    alias=node.get("alias"),
-                    description=node.get("description"),
-                    columns=self._parse_columns(node.get("columns", {})),
-                    depends_on=node.get("depends_on", {}).get("nodes", []),
-                    tags=node.get("tags", []),
-                    materialized=node.get("config", {}).get("materialized", "view"),
-                    sql=node.get("compiled_sql"),
-                )
-        return models
+    def _parse_streaming(
+        self, manifest_path: Path, keep: Optional[FrozenSet[str]] = None
+    ) -> DbtManifest:
+        """Build a manifest while decoding nodes, sources and exposures incrementally."""
+        metadata: Dict[str, Any] = {}
+
+        def entries(f: Any) -> Iterable[Tuple[str, str, Dict[str, Any]]]:
+            nonlocal metadata
+            # macros, parent_map, child_map, docs, ... are skipped undecoded
+            members = iter_json_members(f, expand=self.NODE_SECTIONS, decode=("metadata",))
+            for path, value in members:
+                if len(path) == 2:
+                    yield path[0], path[1], value
+                elif path[0] == "metadata":
+                    metadata = value
+
+        # Decoding and building interleave, so they are measured as one stage
+        with stage("manifest.decode_build"), open(manifest_path, "r") as f:
+            manifest = self._build_manifest(entries(f), {}, keep)
+        manifest.metadata = metadata
+        return manifest
+
+    def _build_manifest(
+        self,
+        entries: Iterable[Tuple[str, str, Dict[str, Any]]],
+        metadata: Dict[str, Any],
+        keep: Optional[FrozenSet[str]] = None,
+    ) -> DbtManifest:
+        """Route each (section, unique_id, node) entry to its builder in one pass."""
+        built: Dict[str, Dict[str, Any]] = {field: {} for field, _ in self.NODE_BUILDERS.values()}
+        for section, unique_id, node in entries:
+            resource_type = node.get("resource_type") or self.NODE_SECTIONS.get(section)
+            builder = self.NODE_BUILDERS.get(resource_type or "")
+            if builder is None:
+                continue  # analyses, operations, unit tests, ...
+            field, method = builder
+            built[field][unique_id] = getattr(self, method)(unique_id, node, keep)
+
+        return self._build(DbtManifest, **built, metadata=metadata)
+
+    def _build(
+        self, model_cls: Type[ModelT], keep: Optional[AbstractSet[str]] = None, **fields: Any
+    ) -> ModelT:
+        """Instantiate a parsed model, validating it only in strict mode.
+
+        With ``keep``, fields outside the projection (and not required by
+        ``model_cls``) are dropped so they take their defaults.
+        """
+        if keep is not None:
+            required = _required_fields(model_cls)
+            fields = {
+                name: value
+                for name, value in fields.items()
+                if name in keep or name in required
+            }
+        if self.strict:
+            return model_cls(**fields)
+        return model_cls.model_construct(**fields)
+
+    def _parse_model(
+        self, unique_id: str, node: Dict[str, Any], keep: Optional[FrozenSet[str]] = None
+    ) -> DbtModel:
+        """Build a model from a single manifest node."""
+        return self._build(
+            DbtModel,
+            keep,
+            unique_id=unique_id,
+            name=node.get("name", ""),
+            schema=node.get("schema", ""),
+            database=node.get("database"),
+            alias=node.get("alias"),
+            description=node.get("description"),
+            columns=self._parse_node_columns(node, keep),
+            depends_on=node.get("depends_on", {}).get("nodes", []),
+            tags=node.get("tags", []),
+            materialized=node.get("config", {}).get("materialized", "view"),
+            sql=node.get("compiled_sql"),
+            checksum=node.get("checksum", {}).get("checksum"),
+            original_file_path=node.get("original_file_path"),
+        )
+
+    def _parse_seed(
+        self, unique_id: str, node: Dict[str, Any], keep: Optional[FrozenSet[str]] = None
+    ) -> DbtSeed:
+        """Build a seed from a single manifest node."""
+        return self._build(
+            DbtSeed,
+            keep,
+            unique_id=unique_id,
+            name=node.get("name", ""),
+            schema=node.get("schema", ""),
+            database=node.get("database"),
+            alias=node.get("alias"),
+            description=node.get("description"),
+            columns=self._parse_node_columns(node, keep),
+            tags=node.get("tags", []),
+        )
+
+    def _parse_snapshot(
+        self, unique_id: str, node: Dict[str, Any], keep: Optional[FrozenSet[str]] = None
+    ) -> DbtSnapshot:
+        """Build a snapshot from a single manifest node."""
+        config = node.get("config", {})
+        return self._build(
+            DbtSnapshot,
+            keep,
+            unique_id=unique_id,
+            name=node.get("name", ""),
+            schema=node.get("schema", ""),
+            database=node.get("database"),
+            alias=node.get("alias"),
+            description=node.get("description"),
+            columns=self._parse_node_columns(node, keep),
+            depends_on=node.get("depends_on", {}).get("nodes", []),
+            tags=node.get("tags", []),
+            strategy=config.get("strategy"),
+            unique_key=config.get("unique_key"),
+        )
+
+    def _parse_source(
+        self, unique_id: str, node: Dict[str, Any], keep: Optional[FrozenSet[str]] = None
+    ) -> DbtSource:
+        """Build a source table from a manifest sources entry."""
+        return self._build(
+            DbtSource,
+            keep,
+            unique_id=unique_id,
+            name=node.get("name", ""),
+            source_name=node.get("source_name", ""),
+            schema=node.get("schema", ""),
+            database=node.get("database"),
+            identifier=node.get("identifier"),
+            description=node.get("description"),
+            columns=self._parse_node_columns(node, keep),
+            tags=node.get("tags", []),
+            loaded_at_field=node.get("loaded_at_field"),
+        )
+
+    def _parse_exposure(
+        self, unique_id: str, node: Dict[str, Any], keep: Optional[FrozenSet[str]] = None
+    ) -> DbtExposure:
+        """Build an exposure from a manifest exposures entry."""
+        return self._build(
+            DbtExposure,
+            keep,
+            unique_id=unique_id,
+            name=node.get("name", ""),
+            exposure_type=node.get("type", ""),
+            description=node.get("description"),
+            owner=node.get("owner", {}),
+            maturity=node.get("maturity"),
+            url=node.get("url"),
+            depends_on=node.get("depends_on", {}).get("nodes", []),
+            tags=node.get("tags", []),
+        )
+
+    def _parse_node_columns(
+        self, node: Dict[str, Any], keep: Optional[FrozenSet[str]]
+    ) -> Dict[str, DbtColumn]:
+        """Build a node's columns, unless the projection leaves them out."""
+        if keep is not None and "columns" not in keep:
+            return {}
+        return self._parse_columns(node.get("columns", {}))
 
     def _parse_columns(self, columns: Dict[str, Any]) -> Dict[str, DbtColumn]:
         """Extract columns from model definition."""
         parsed = {}
         for col_name, col_data in columns.items():
-            parsed[col_name] = DbtColumn(
-                name=col_name,
-                description=col_data.get("description"),
-                data_type=col_data.get("data_type") or col_data.get("type"),
-                tests=self._extract_column_tests(col_data),
-                tags=col_data.get("tags", []),
+            fields = {
+                "name": col_name,
+                "description": col_data.get("description"),
+                "data_type": col_data.get("data_type") or col_data.get("type"),
+                "tests": self._extract_column_tests(col_data),
+                "tags": col_data.get("tags", []),
+            }
+            parsed[col_name] = (
+                COLUMN_ADAPTER.validate_python(fields) if self.strict else DbtColumn(**fields)
             )
         return parsed
 
@@ -131,21 +474,20 @@ class ManifestParser:
                 tests.extend(test.keys())
         return tests
 
-    def _parse_tests(self, nodes: Dict[str, Any]) -> Dict[str, DbtTest]:
-        """Extract tests from manifest nodes."""
-        tests = {}
-        for unique_id, node in nodes.items():
-            if node.get("resource_type") == "test":
-                test_type = self._infer_test_type(node)
-                tests[unique_id] = DbtTest(
-                    unique_id=unique_id,
-                    name=node.get("name", ""),
-                    test_type=test_type,
-                    model=self._extract_test_model(node),
-                    column=node.get("column_name"),
-                    config=node.get("config", {}),
-                )
-        return tests
+    def _parse_test(
+        self, unique_id: str, node: Dict[str, Any], keep: Optional[FrozenSet[str]] = None
+    ) -> DbtTest:
+        """Build a test from a single manifest node."""
+        return self._build(
+            DbtTest,
+            keep | self.TEST_INDEX_FIELDS if keep is not None else None,
+            unique_id=unique_id,
+            name=node.get("name", ""),
+            test_type=self._infer_test_type(node),
+            model=self._extract_test_model(node),
+            column=node.get("column_name"),
+            config=node.get("config", {}),
+        )
 
     def _infer_test_type(self, test_node: Dict[str, Any]) -> str:
         """Infer test type from test node."""
@@ -168,8 +510,22 @@ class ManifestParser:
 
     def _extract_test_model(self, test_node: Dict[str, Any]) -> str:
         """Extract the model name this test applies to."""
+        # dbt >= 1.5 records the node a generic test is attached to explicitly;
+        # depends_on also lists e.g. the parent model of a relationships test
+        attached_node = test_node.get("attached_node")
+        if attached_node:
+            return str(attached_node)
+
         depends_on = test_node.get("depends_on", {}).get("nodes", [])
         # First dependency is typically the model
         if depends_on:
             return depends_on[0]
         return ""
+
+
+@lru_cache(maxsize=None)
+def _required_fields(model_cls: Type[BaseModel]) -> FrozenSet[str]:
+    """Names of fields without defaults, which a projection always keeps."""
+    return frozenset(
+        name for name, field_info in model_cls.model_fields.items() if field_info.is_required()
+    )
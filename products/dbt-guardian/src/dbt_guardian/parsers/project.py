@@ -3,12 +3,16 @@
 Project files contain configuration and test definitions.
 """
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-import yaml
 from pydantic import BaseModel, Field
 
+from ..utils import yaml_io
+
 
 class DbtProjectConfig(BaseModel):
     """Parsed dbt_project.yml."""
@@ -47,9 +51,27 @@ class SchemaFile(BaseModel):
     sources: List[Dict[str, Any]] = Field(default_factory=list)
 
 
+# Directories never searched for schema files: build output, installed
+# packages and dbt logs (hidden directories such as .git are skipped too)
+SKIP_DIRS = frozenset({"target", "dbt_packages", "logs"})
+
+YAML_SUFFIXES = (".yml", ".yaml")
+
+# A top-level ``models:`` key; dbt reads model properties from any YAML file
+_MODELS_KEY = re.compile(rb"^models[ \t]*:", re.MULTILINE)
+
+
 class ProjectParser:
     """Parse dbt project configuration files."""
 
+    def __init__(self, yaml_backend: Optional[str] = None) -> None:
+        """Create a parser.
+
+        Args:
+            yaml_backend: YAML loader to use (see ``utils.yaml_io``)
+        """
+        self.yaml_backend = yaml_backend
+
     def parse_project(self, project_path: Path) -> DbtProjectConfig:
         """Parse dbt_project.yml.
 
@@ -67,7 +89,7 @@ class ProjectParser:
             raise FileNotFoundError(f"Project file not found: {project_path}")
 
         with open(project_path, "r") as f:
-            raw = yaml.safe_load(f)
+            raw = yaml_io.safe_load(f, self.yaml_backend) or {}
 
         return DbtProjectConfig(
             name=raw.get("name", ""),
@@ -97,7 +119,10 @@ class ProjectParser:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
         with open(schema_path, "r") as f:
-            raw = yaml.safe_load(f)
+            raw = yaml_io.safe_load(f, self.yaml_backend)
+
+        if not isinstance(raw, dict):
+            return SchemaFile()  # Empty or comment-only file
 
         return SchemaFile(
             models=self._parse_models(raw.get("models", [])),
@@ -135,16 +160,104 @@ class ProjectParser:
                     )
         return parsed
 
-    def find_schema_files(self, project_root: Path) -> List[Path]:
-        """Find all schema.yml files in a dbt project.
+    def model_paths(self, project_root: Path) -> List[str]:
+        """Return ``model-paths`` from dbt_project.yml, or dbt's default.
+
+        Args:
+            project_root: Root directory of dbt project
+
+        Returns:
+            Model directories relative to the root
+        """
+        project_file = project_root / "dbt_project.yml"
+        if not project_file.exists():
+            return ["models"]
+        return self.parse_project(project_file).model_paths
+
+    def find_yaml_files(
+        self, project_root: Path, model_paths: Optional[List[str]] = None
+    ) -> List[Path]:
+        """Find every YAML file under a project's model paths in one walk.
+
+        Args:
+            project_root: Root directory of dbt project
+            model_paths: Directories to search, relative to the root
+                (default: ``model-paths`` from dbt_project.yml)
+
+        Returns:
+            Sorted YAML file paths
+        """
+        if model_paths is None:
+            model_paths = self.model_paths(project_root)
+
+        found = set()
+        for model_path in model_paths:
+            for dirpath, dirnames, filenames in os.walk(project_root / model_path):
+                # Prune in place so os.walk does not descend
+                dirnames[:] = [
+                    d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")
+                ]
+                found.update(
+                    Path(dirpath, name) for name in filenames if name.endswith(YAML_SUFFIXES)
+                )
+        return sorted(found)
+
+    def find_schema_files(
+        self, project_root: Path, model_paths: Optional[List[str]] = None
+    ) -> List[Path]:
+        """Find the YAML files that define models (a top-level ``models:`` key).
+
+        Args:
+            project_root: Root directory of dbt project
+            model_paths: Directories to search, relative to the root
+                (default: ``model-paths`` from dbt_project.yml)
+
+        Returns:
+            Sorted schema file paths
+        """
+        return [
+            path
+            for path in self.find_yaml_files(project_root, model_paths)
+            if _MODELS_KEY.search(path.read_bytes())
+        ]
+
+    def parse_schema_files(
+        self, schema_paths: Iterable[Path], jobs: Optional[int] = None
+    ) -> Dict[Path, SchemaFile]:
+        """Parse schema files concurrently.
+
+        Args:
+            schema_paths: Schema files to parse
+            jobs: Worker processes (default: CPU count); 1 parses in this process
+
+        Returns:
+            Parsed files keyed by path, in the order given
+
+        Raises:
+            yaml.YAMLError: If any file is invalid YAML
+        """
+        paths = list(schema_paths)
+        workers = min(jobs or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return {path: self.parse_schema(path) for path in paths}
+
+        # YAML parsing is CPU-bound pure Python, so threads would serialize on the GIL
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return dict(
+                zip(paths, executor.map(self.parse_schema, paths, chunksize=chunksize), strict=True)
+            )
+
+    def load_schema_files(
+        self, project_root: Path, jobs: Optional[int] = None
+    ) -> Dict[Path, SchemaFile]:
+        """Find and parse every schema file in a project.
 
         Args:
             project_root: Root directory of dbt project
+            jobs: Worker processes for parsing (default: CPU count)
 
         Returns:
-            List of schema.yml file paths
+            Parsed files keyed by path, sorted by path
         """
-        schema_files = []
-        for pattern in ["schema.yml", "schema.yaml", "**/schema.yml", "**/schema.yaml"]:
-            schema_files.extend(project_root.glob(pattern))
-        return list(set(schema_files))  # Deduplicate
+        return self.parse_schema_files(self.find_schema_files(project_root), jobs)
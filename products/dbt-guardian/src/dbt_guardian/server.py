@@ -0,0 +1,234 @@
+"""Long-running server that keeps analyzed dbt projects warm.
+
+``dbt-guardian serve`` listens on a Unix socket (protocol in ``client``). Each
+project's coverage report is kept in memory together with the incremental
+analysis state. A request re-parses only the artifacts (manifest.json,
+catalog.json) that changed on disk, and then re-analyzes only the models whose
+fingerprints changed, so repeated requests return in milliseconds.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import __version__
+from .analyzers import (
+    CoverageReport,
+    CoverageState,
+    IncrementalCoverageAnalyzer,
+    TestCoverageAnalyzer,
+)
+from .generators import SchemaYamlGenerator
+from .parsers import CatalogParser, ManifestParser
+from .parsers.catalog import DbtCatalog
+from .parsers.manifest import DbtManifest
+
+# (size, mtime_ns) per artifact; None when the file does not exist
+FileSignature = Optional[Tuple[int, int]]
+ArtifactSignature = Tuple[FileSignature, FileSignature]
+
+
+@dataclass
+class ProjectState:
+    """In-memory analysis of one project."""
+
+    signature: ArtifactSignature
+    manifest: DbtManifest  # Projected to TestCoverageAnalyzer.MANIFEST_FIELDS
+    catalog: Optional[DbtCatalog]
+    report: CoverageReport
+    coverage: CoverageState  # Per-model results for incremental re-analysis
+    loads: int  # Times the artifacts have been parsed
+
+
+class ProjectStore:
+    """Coverage reports per project, refreshed when artifacts change."""
+
+    def __init__(self, json_backend: Optional[str] = None) -> None:
+        """Create an empty store.
+
+        Args:
+            json_backend: JSON decoder for artifacts (see ``utils.json_backend``)
+        """
+        self.json_backend = json_backend
+        self._projects: Dict[Path, ProjectState] = {}
+        self._analyzer = IncrementalCoverageAnalyzer()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def get(self, project_path: Path) -> ProjectState:
+        """Return a project's current state, reloading it if artifacts changed.
+
+        Args:
+            project_path: dbt project root
+
+        Returns:
+            State reflecting the artifacts currently on disk
+
+        Raises:
+            FileNotFoundError: If target/manifest.json does not exist
+        """
+        project_path = project_path.resolve()
+        with self._lock:
+            signature = self._signature(project_path)
+            if signature[0] is None:
+                raise FileNotFoundError(
+                    f"manifest.json not found in {project_path / 'target'}. "
+                    "Run 'dbt compile' or 'dbt run' first."
+                )
+            state = self._projects.get(project_path)
+            if state is None or state.signature != signature:
+                state = self._load(project_path, signature, state)
+                self._projects[project_path] = state
+            return state
+
+    def _load(
+        self, project_path: Path, signature: ArtifactSignature, previous: Optional[ProjectState]
+    ) -> ProjectState:
+        """Re-parse the artifacts that changed and analyze the models that changed."""
+        target = project_path / "target"
+        if previous is not None and previous.signature[0] == signature[0]:
+            manifest = previous.manifest
+        else:
+            manifest = ManifestParser(json_backend=self.json_backend).parse(
+                target / "manifest.json", fields=TestCoverageAnalyzer.MANIFEST_FIELDS
+            )
+        catalog = None
+        if previous is not None and previous.signature[1] == signature[1]:
+            catalog = previous.catalog
+        elif signature[1] is not None:
+            catalog = CatalogParser(json_backend=self.json_backend).parse(target / "catalog.json")
+
+        result = self._analyzer.analyze(manifest, catalog, previous.coverage if previous else None)
+        return ProjectState(
+            signature=signature,
+            manifest=manifest,
+            catalog=catalog,
+            report=result.report,
+            coverage=result.state,
+            loads=previous.loads + 1 if previous else 1,
+        )
+
+    @staticmethod
+    def _signature(project_path: Path) -> ArtifactSignature:
+        """Cheap change detection: size and mtime of manifest and catalog."""
+
+        def stat(path: Path) -> FileSignature:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                return None
+            return st.st_size, st.st_mtime_ns
+
+        target = project_path / "target"
+        return stat(target / "manifest.json"), stat(target / "catalog.json")
+
+
+class GuardianServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve analysis requests for any number of projects over a Unix socket."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, store: Optional[ProjectStore] = None) -> None:
+        """Bind the socket.
+
+        Args:
+            socket_path: Path of the Unix socket to create
+            store: Project store (default: a new, empty one)
+
+        Raises:
+            RuntimeError: If another server is already listening on ``socket_path``
+        """
+        self.socket_path = socket_path
+        self.store = store or ProjectStore()
+        self._commands: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": self._ping,
+            "analyze": self._analyze,
+            "generate-tests": self._generate_tests,
+            "shutdown": self._shutdown,
+        }
+        _claim_socket_path(socket_path)
+        super().__init__(str(socket_path), _RequestHandler)
+        os.chmod(socket_path, 0o600)  # Only the owner may send requests
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def dispatch(self, request: Dict[str, Any]) -> Any:
+        """Run one request and return its result.
+
+        Raises:
+            ValueError: If the command is unknown
+        """
+        command = request.get("command")
+        handler = self._commands.get(command) if isinstance(command, str) else None
+        if handler is None:
+            raise ValueError(
+                f"Unknown command {command!r} (expected one of: {', '.join(self._commands)})"
+            )
+        return handler(request)
+
+    def _ping(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {"version": __version__, "pid": os.getpid(), "projects": len(self.store)}
+
+    def _analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        state = self.store.get(Path(request["project_path"]))
+        return state.report.to_dict(int(request.get("priority", 3)))
+
+    def _generate_tests(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        project_path = Path(request["project_path"])
+        priority = int(request.get("priority", 3))
+        output = Path(request.get("output") or project_path / "schema_suggestions.yml")
+
+        report = self.store.get(project_path).report
+        SchemaYamlGenerator().write_file(report, output, priority)
+        return {
+            "output": str(output),
+            "coverage_percentage": report.coverage_percentage,
+            "suggestions": sum(1 for g in report.gaps if g.priority <= priority),
+        }
+
+    def _shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # shutdown() waits for serve_forever() to return, so it cannot run on
+        # the thread handling this request
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {"stopping": True}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON requests until the client disconnects."""
+
+    server: GuardianServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                response = {"ok": True, "result": self.server.dispatch(request)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e) or type(e).__name__}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    """Remove a stale socket file, refusing if a live server still owns it."""
+    if not socket_path.exists():
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()  # Left behind by a server that exited uncleanly
+            return
+    raise RuntimeError(f"A dbt-guardian server is already listening on {socket_path}")
@@ -0,0 +1,40 @@
+"""Atomic file writes: write a temp file in the target directory, then rename.
+
+Readers (dbt, editors, a concurrent dbt Guardian run) see either the previous
+file or the complete new one, never a partial write.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Callable, Optional
+
+
+def write_atomic(
+    path: Path,
+    render: Callable[[IO[Any]], object],
+    binary: bool = False,
+    mode: Optional[int] = None,
+) -> None:
+    """Write the output of ``render`` to ``path`` atomically.
+
+    Args:
+        path: Destination (parent directories are created)
+        render: Called with the open temp file; writes the content
+        binary: Open the temp file in binary instead of text mode
+        mode: Permission bits for the file (default: 0600, as created by mkstemp)
+
+    Raises:
+        OSError: If the file cannot be written; the temp file is removed
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb" if binary else "w") as f:
+            render(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,178 @@
+"""Pluggable JSON decoding for dbt artifacts.
+
+Decoding manifest.json is the largest single cost of a run, so artifacts are
+read as bytes and handed to the fastest installed decoder: orjson, then
+msgspec, then the stdlib ``json`` module. A specific backend can be forced with
+the ``DBT_GUARDIAN_JSON_BACKEND`` environment variable or by name (e.g.
+``ManifestParser(json_backend="stdlib")``).
+
+Backends that accept any buffer (orjson, msgspec) decode straight from a
+read-only memory map of the file, so a multi-hundred-MB manifest is never
+copied into a Python ``bytes`` or ``str`` first. Files that cannot be mapped
+(empty files, filesystems without mmap support) and the stdlib backend, which
+needs ``bytes``, fall back to a plain read.
+
+Every backend reports malformed input as ``json.JSONDecodeError``.
+"""
+
+import importlib
+import json
+import mmap
+import os
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+Buffer = Union[bytes, memoryview]
+
+BACKEND_ENV_VAR = "DBT_GUARDIAN_JSON_BACKEND"
+AUTO = "auto"
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """A named bytes -> Python object decoder."""
+
+    name: str
+    loads: Callable[[Buffer], Any]
+    zero_copy: bool  # loads() accepts a memoryview, so files can be memory-mapped
+
+
+def _orjson() -> Callable[[Buffer], Any]:
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+    return importlib.import_module("orjson").loads  # type: ignore[no-any-return]
+
+
+def _msgspec() -> Callable[[Buffer], Any]:
+    msgspec = importlib.import_module("msgspec")
+    decode = msgspec.json.decode
+
+    def loads(data: Buffer) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    return loads
+
+
+def _stdlib() -> Callable[[Buffer], Any]:
+    return json.loads  # type: ignore[return-value]  # bytes only, no memoryview
+
+
+# Candidates in order of preference for "auto"
+_FACTORIES: Dict[str, Callable[[], Callable[[Buffer], Any]]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "stdlib": _stdlib,
+}
+
+BACKEND_NAMES: Tuple[str, ...] = (AUTO, *_FACTORIES)
+
+_ZERO_COPY = {"orjson", "msgspec"}
+
+_resolved: Dict[str, JsonBackend] = {}
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """Resolve a JSON backend.
+
+    Args:
+        name: Backend name (see ``BACKEND_NAMES``). None reads
+            ``DBT_GUARDIAN_JSON_BACKEND``, defaulting to ``auto``.
+
+    Returns:
+        The requested backend, or for ``auto`` the fastest one installed
+
+    Raises:
+        ValueError: If the name is unknown or the requested backend is not installed
+    """
+    name = (name or os.environ.get(BACKEND_ENV_VAR) or AUTO).strip().lower()
+    backend = _resolved.get(name)
+    if backend is not None:
+        return backend
+
+    if name == AUTO:
+        for candidate in _FACTORIES:
+            try:
+                backend = get_backend(candidate)
+            except ValueError:
+                continue
+            break
+    elif name in _FACTORIES:
+        try:
+            backend = JsonBackend(name, _FACTORIES[name](), zero_copy=name in _ZERO_COPY)
+        except ImportError as e:
+            raise ValueError(f"JSON backend '{name}' is not installed") from e
+    else:
+        raise ValueError(
+            f"Unknown JSON backend '{name}' (expected one of: {', '.join(BACKEND_NAMES)})"
+        )
+
+    assert backend is not None  # stdlib is always importable
+    _resolved[name] = backend
+    return backend
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Names of the concrete backends that are installed."""
+    names = []
+    for name in _FACTORIES:
+        try:
+            get_backend(name)
+        except ValueError:
+            continue
+        names.append(name)
+    return tuple(names)
+
+
+@contextmanager
+def read_buffer(path: Path, use_mmap: bool = True) -> Iterator[Buffer]:
+    """Expose a file's contents as a read-only buffer.
+
+    Args:
+        path: File to read
+        use_mmap: Try a memory map (a view of the page cache, no copy) before
+            falling back to reading the file into ``bytes``
+
+    Yields:
+        A memoryview over the mapped file, or the file's bytes. The view is
+        only valid inside the ``with`` block.
+    """
+    with open(path, "rb") as f:
+        mapped = None
+        if use_mmap:
+            # OSError/ValueError: an empty file, or a filesystem that cannot be mapped
+            with suppress(OSError, ValueError):
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mapped is None:
+            yield f.read()
+            return
+
+        with mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()  # the map cannot close while a view is exported
+
+
+def load_json(path: Path, backend: Optional[str] = None) -> Any:
+    """Read ``path`` and decode it with the selected backend.
+
+    Args:
+        path: JSON file to read
+        backend: Backend name (default: environment variable, then ``auto``)
+
+    Returns:
+        The decoded document
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the backend cannot be resolved
+    """
+    json_backend = get_backend(backend)
+    with read_buffer(path, use_mmap=json_backend.zero_copy) as data:
+        return json_backend.loads(data)
@@ -0,0 +1,216 @@
+"""Incremental reader for large JSON objects.
+
+dbt artifacts are a single top-level object whose bulk lives in a few sections
+(``nodes``, ``sources``). This reader walks the top-level object and yields the
+members of selected sections one at a time, so only the chunk buffer and the
+value currently being decoded are held in memory. Sections the caller does not
+need (``macros``, ``child_map``, ...) are skipped by scanning brackets and
+strings chunk by chunk, without ever decoding or buffering them whole.
+"""
+
+import json
+import re
+from typing import Any, Collection, Iterator, NoReturn, Optional, TextIO, Tuple
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+_WHITESPACE = " \t\n\r"
+
+# What changes the nesting state outside and inside a string
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JsonObjectStream:
+    """Walk the members of a top-level JSON object without loading it whole."""
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_members(
+        self, expand: Collection[str] = (), decode: Optional[Collection[str]] = None
+    ) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """Yield ``(path, value)`` pairs for the top-level object.
+
+        Args:
+            expand: Top-level keys whose object values are yielded member by
+                member instead of as a single value
+            decode: Other top-level keys to yield whole; the values of the rest
+                are skipped without being decoded (None yields every key).
+                Skipped values are only checked for balanced brackets.
+
+        Yields:
+            ``((key,), value)`` for ordinary members and
+            ``((key, member_key), member_value)`` for expanded sections
+
+        Raises:
+            json.JSONDecodeError: If the document is not a valid JSON object
+        """
+        self._expect("{")
+        for key in self._iter_keys():
+            if key in expand and self._peek() == "{":
+                self._pos += 1
+                for member_key in self._iter_keys():
+                    yield (key, member_key), self._decode_value()
+            elif decode is None or key in decode:
+                yield (key,), self._decode_value()
+            else:
+                self._skip_value()
+
+        self._skip_whitespace()
+        if self._pos < len(self._buf):
+            self._error("Extra data")
+
+    def _iter_keys(self) -> Iterator[str]:
+        """Yield object keys, leaving the reader positioned at each value.
+
+        The caller must consume the value before advancing the iterator.
+        """
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            if self._peek() != '"':
+                self._error("Expecting property name enclosed in double quotes")
+            key = self._decode_value()
+            self._expect(":")
+            self._skip_whitespace()
+            yield key
+
+            separator = self._peek()
+            if separator not in ",}":
+                self._error("Expecting ',' delimiter")
+            self._pos += 1
+            if separator == "}":
+                return
+
+    def _decode_value(self) -> Any:
+        """Decode the JSON value at the current position, reading more as needed."""
+        self._skip_whitespace()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number may continue past the end of the buffer
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+
+            # Grow geometrically so a large value is re-scanned O(1) times amortized
+            self._fill(read_size)
+            read_size *= 2
+
+    def _skip_value(self) -> None:
+        """Consume the value at the current position without decoding it.
+
+        Only bracket depth and string state are tracked, and consumed input is
+        dropped at every refill, so the buffer stays one chunk long however
+        large the value is.
+        """
+        if self._peek() not in '{["':
+            self._decode_value()  # A scalar is small
+            return
+
+        depth = 0
+        in_string = False
+        escaped = False  # A backslash ended the previous chunk
+        while True:
+            buf, pos = self._buf, self._pos
+            if escaped and pos < len(buf):
+                pos += 1
+                escaped = False
+            if pos >= len(buf):
+                if self._eof:
+                    self._error("Unexpected end of data")
+                self._pos = pos
+                self._fill(self._chunk_size)
+                continue
+
+            pattern = _STRING_SPECIAL if in_string else _STRUCTURAL
+            match = pattern.search(buf, pos)
+            if match is None:
+                self._pos = len(buf)
+                continue
+            char = match.group()
+            pos = match.end()
+            if char == "\\":
+                if pos < len(buf):
+                    pos += 1
+                else:
+                    escaped = True
+            elif char == '"':
+                in_string = not in_string
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+            self._pos = pos
+            if depth == 0 and not in_string:
+                return
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        self._skip_whitespace()
+        if self._pos >= len(self._buf):
+            self._error("Unexpected end of data")
+        return self._buf[self._pos]
+
+    def _expect(self, char: str) -> None:
+        """Consume ``char`` (after optional whitespace) or raise."""
+        if self._peek() != char:
+            self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _skip_whitespace(self) -> None:
+        """Advance past whitespace, refilling the buffer when it runs out."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf) or self._eof:
+                return
+            self._fill(self._chunk_size)
+
+    def _fill(self, size: int) -> None:
+        """Drop consumed input and append up to ``size`` characters."""
+        chunk = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+
+    def _error(self, message: str) -> NoReturn:
+        raise json.JSONDecodeError(message, self._buf, self._pos)
+
+
+def iter_json_members(
+    fp: TextIO,
+    expand: Collection[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    decode: Optional[Collection[str]] = None,
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Stream the members of the JSON object in ``fp``.
+
+    Args:
+        fp: Text file positioned at the start of a JSON object
+        expand: Top-level keys to expand member by member
+        chunk_size: Number of characters to read at a time
+        decode: Other top-level keys to yield whole (None for all); the rest
+            are skipped undecoded
+
+    Returns:
+        Iterator of ``(path, value)`` pairs (see ``JsonObjectStream.iter_members``)
+    """
+    return JsonObjectStream(fp, chunk_size).iter_members(expand, decode)
@@ -0,0 +1,148 @@
+"""Per-stage timing and memory instrumentation.
+
+Library code marks pipeline stages with ``stage("manifest.decode")``. Stages are
+free when no profiler is active; inside ``profiling(profiler)`` each stage
+records wall time, CPU time, peak RSS and the change in live object count.
+
+Example:
+    profiler = Profiler()
+    with profiling(profiler):
+        manifest = ManifestParser().parse(path)
+    profiler.write_chrome_trace(Path("trace.json"))
+"""
+
+import gc
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_active_profiler: ContextVar[Optional["Profiler"]] = ContextVar(
+    "dbt_guardian_profiler", default=None
+)
+
+
+@dataclass
+class StageRecord:
+    """Measurements for one completed stage."""
+
+    name: str
+    depth: int  # Nesting level (0 = top-level stage)
+    start_seconds: float  # Offset from profiler creation
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: int  # Process high-water mark when the stage ended
+    object_delta: Optional[int]  # Change in gc-tracked objects (None if not counted)
+
+
+class Profiler:
+    """Collect stage records for one run."""
+
+    def __init__(self, count_objects: bool = True) -> None:
+        """Create a profiler.
+
+        Args:
+            count_objects: Record the change in gc-tracked objects per stage.
+                Counting walks the heap, so it adds time on large projects.
+        """
+        self.count_objects = count_objects
+        self.records: List[StageRecord] = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the enclosed block as stage ``name``."""
+        objects_before = len(gc.get_objects()) if self.count_objects else None
+        depth = self._depth
+        self._depth += 1
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_end = time.perf_counter()
+            cpu_end = time.process_time()
+            self._depth = depth
+            object_delta = None
+            if objects_before is not None:
+                object_delta = len(gc.get_objects()) - objects_before
+            self.records.append(
+                StageRecord(
+                    name=name,
+                    depth=depth,
+                    start_seconds=wall_start - self._origin,
+                    wall_seconds=wall_end - wall_start,
+                    cpu_seconds=cpu_end - cpu_start,
+                    peak_rss_bytes=peak_rss_bytes(),
+                    object_delta=object_delta,
+                )
+            )
+
+    def ordered_records(self) -> List[StageRecord]:
+        """Return records in start order (parents before their children)."""
+        return sorted(self.records, key=lambda r: (r.start_seconds, r.depth))
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Export records in Chrome trace-event format (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = [
+            {
+                "name": record.name,
+                "cat": "dbt_guardian",
+                "ph": "X",
+                "ts": record.start_seconds * 1e6,
+                "dur": record.wall_seconds * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {
+                    "cpu_ms": round(record.cpu_seconds * 1e3, 3),
+                    "peak_rss_bytes": record.peak_rss_bytes,
+                    "object_delta": record.object_delta,
+                },
+            }
+            for record in self.ordered_records()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, output_path: Path) -> None:
+        """Write the Chrome trace-event JSON to ``output_path``."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+@contextmanager
+def profiling(profiler: Profiler) -> Iterator[Profiler]:
+    """Make ``profiler`` record every ``stage`` entered in this context."""
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profiler.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mark a pipeline stage; a no-op unless a profiler is active."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
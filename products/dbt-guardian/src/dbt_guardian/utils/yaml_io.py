@@ -0,0 +1,161 @@
+"""Shared YAML loading and dumping, through libyaml when it is available.
+
+PyYAML's C bindings (``CSafeLoader``/``CSafeDumper``) are several times faster
+than its pure-Python classes but are only present when PyYAML was built against
+libyaml. ``auto`` uses them when present and otherwise falls back to the
+pure-Python classes. A specific backend can be forced with the
+``DBT_GUARDIAN_YAML_BACKEND`` environment variable or by name.
+
+Both emitters produce identical bytes for ordinary text. They differ only on
+scalars that must be escaped: control characters, line/paragraph separators,
+the BOM and characters outside the Basic Multilingual Plane. libyaml escapes
+and folds those differently. They also disagree on which mapping keys fit
+the plain ``key:`` form rather than the explicit ``? key`` form: the
+pure-Python emitter rejects empty keys and counts characters plus the implicit
+``!!str`` tag against its 128 limit, libyaml counts UTF-8 bytes. ``dump``
+therefore hands any document containing such a string, or a key that either
+emitter would write in the explicit form, to the pure-Python emitter, so
+output never depends on the backend.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Optional, Tuple, Type, Union
+
+import yaml
+
+BACKEND_ENV_VAR = "DBT_GUARDIAN_YAML_BACKEND"
+AUTO = "auto"
+BACKEND_NAMES: Tuple[str, ...] = (AUTO, "libyaml", "python")
+
+# Formatting of every YAML file dbt Guardian writes
+DUMP_OPTIONS: Dict[str, Any] = {
+    "default_flow_style": False,
+    "sort_keys": False,
+    "allow_unicode": True,
+    "width": 100,
+}
+
+# Characters the two emitters escape differently
+_EMITTER_SENSITIVE = re.compile("[\x00-\x1f\x7f-\x9f\u2028\u2029\ufeff\U00010000-\U0010ffff]")
+
+# Longest key either emitter writes as a plain "key:" (longer ones get "? key")
+_SIMPLE_KEY_MAX_CHARS = 127 - len("!!str")  # pure Python: characters plus the tag
+_SIMPLE_KEY_MAX_BYTES = 128  # libyaml: UTF-8 bytes
+
+Stream = Union[str, bytes, IO[Any]]
+
+
+@dataclass(frozen=True)
+class YamlBackend:
+    """A named safe loader/dumper pair."""
+
+    name: str
+    loader: Type[Any]
+    dumper: Type[Any]
+
+
+_PYTHON = YamlBackend("python", yaml.SafeLoader, yaml.SafeDumper)
+_LIBYAML = (
+    YamlBackend("libyaml", yaml.CSafeLoader, yaml.CSafeDumper)
+    if getattr(yaml, "__with_libyaml__", False)
+    else None
+)
+
+
+def get_backend(name: Optional[str] = None) -> YamlBackend:
+    """Resolve a YAML backend.
+
+    Args:
+        name: Backend name (see ``BACKEND_NAMES``). None reads
+            ``DBT_GUARDIAN_YAML_BACKEND``, defaulting to ``auto``.
+
+    Returns:
+        The requested backend, or for ``auto`` libyaml if installed
+
+    Raises:
+        ValueError: If the name is unknown or libyaml is requested but not installed
+    """
+    name = (name or os.environ.get(BACKEND_ENV_VAR) or AUTO).strip().lower()
+    if name == AUTO:
+        return _LIBYAML or _PYTHON
+    if name == "python":
+        return _PYTHON
+    if name == "libyaml":
+        if _LIBYAML is None:
+            raise ValueError("YAML backend 'libyaml' is not installed (PyYAML lacks C bindings)")
+        return _LIBYAML
+    raise ValueError(
+        f"Unknown YAML backend '{name}' (expected one of: {', '.join(BACKEND_NAMES)})"
+    )
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Names of the concrete backends that are installed."""
+    return ("libyaml", "python") if _LIBYAML else ("python",)
+
+
+def safe_load(stream: Stream, backend: Optional[str] = None) -> Any:
+    """Parse one YAML document with the safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file
+        backend: Backend name (default: see ``get_backend``)
+
+    Returns:
+        The parsed document (None for an empty one)
+
+    Raises:
+        yaml.YAMLError: If the YAML is invalid
+    """
+    return yaml.load(stream, Loader=get_backend(backend).loader)
+
+
+def dump(data: Any, stream: Optional[IO[str]] = None, backend: Optional[str] = None) -> Any:
+    """Serialize ``data`` with ``DUMP_OPTIONS`` and the safe dumper.
+
+    Args:
+        data: Plain data (dicts, lists, strings, numbers, booleans, None)
+        stream: Text stream to write to; None returns the YAML as a string
+        backend: Backend name (default: see ``get_backend``)
+
+    Returns:
+        The YAML string, or None when written to ``stream``
+    """
+    dumper = get_backend(backend).dumper
+    if dumper is not _PYTHON.dumper and _has_sensitive_text(data):
+        dumper = _PYTHON.dumper
+    return yaml.dump(data, stream, Dumper=dumper, **DUMP_OPTIONS)
+
+
+def _has_sensitive_text(data: Any) -> bool:
+    """Whether any string or key in ``data`` would be emitted differently by libyaml."""
+    pending = [data]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            if _EMITTER_SENSITIVE.search(item):
+                return True
+        elif isinstance(item, dict):
+            if not all(_is_simple_key(key) for key in item):
+                return True
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+    return False
+
+
+def _is_simple_key(key: Any) -> bool:
+    """Whether both emitters write ``key`` in the plain ``key:`` form.
+
+    Line breaks, which also force the explicit form, are caught by
+    ``_EMITTER_SENSITIVE``.
+    """
+    if not isinstance(key, str):
+        return True
+    return (
+        0 < len(key) <= _SIMPLE_KEY_MAX_CHARS
+        and len(key.encode("utf-8", "surrogatepass")) <= _SIMPLE_KEY_MAX_BYTES
+    )
@@ -0,0 +1,97 @@
+"""Poll a dbt project's artifacts and schema files for changes.
+
+``dbt compile`` rewrites target/manifest.json (and ``dbt docs generate``
+catalog.json) in several writes, so changes are debounced: a change is only
+reported once the watched files have stopped changing for ``debounce`` seconds.
+Polling file stats is portable and cheap at the sizes involved, and needs no
+extra dependency.
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .parsers import ProjectParser
+
+# (size, mtime_ns) of each watched file
+Snapshot = Dict[Path, Tuple[int, int]]
+
+DEFAULT_INTERVAL = 0.5  # Seconds between polls
+DEFAULT_DEBOUNCE = 1.0  # Seconds the files must stay unchanged
+
+
+class ArtifactWatcher:
+    """Report debounced changes to manifest.json, catalog.json and schema YAML."""
+
+    def __init__(
+        self,
+        project_path: Path,
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        """Take the initial snapshot.
+
+        Args:
+            project_path: dbt project root
+            interval: Seconds between polls
+            debounce: Seconds files must stay unchanged before a change is reported
+        """
+        self.project_path = project_path
+        self.interval = interval
+        self.debounce = debounce
+        self._project_parser = ProjectParser()
+        self._model_paths = self._project_parser.model_paths(project_path)
+        self._snapshot = self.snapshot()
+
+    def snapshot(self) -> Snapshot:
+        """Stat every watched file that currently exists."""
+        target = self.project_path / "target"
+        paths = [target / "manifest.json", target / "catalog.json"]
+        # Every YAML file, not just those defining models yet: a file gaining a
+        # models: key must still be noticed
+        paths.extend(
+            self._project_parser.find_yaml_files(self.project_path, self._model_paths)
+        )
+
+        snapshot: Snapshot = {}
+        for path in paths:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue  # Deleted between listing and stat
+            snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def wait_for_change(self, timeout: Optional[float] = None) -> Optional[List[Path]]:
+        """Block until watched files change and then settle.
+
+        Args:
+            timeout: Give up after this many seconds without a change (None waits forever)
+
+        Returns:
+            Sorted paths that were added, removed or modified, or None on timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            current = self.snapshot()
+            if current != self._snapshot:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(self.interval)
+
+        # Wait for the burst of writes to finish
+        settled_at = time.monotonic()
+        while time.monotonic() - settled_at < self.debounce:
+            time.sleep(min(self.interval, self.debounce))
+            latest = self.snapshot()
+            if latest != current:
+                current = latest
+                settled_at = time.monotonic()
+
+        previous, self._snapshot = self._snapshot, current
+        return sorted(
+            path
+            for path in previous.keys() | current.keys()
+            if previous.get(path) != current.get(path)
+        )
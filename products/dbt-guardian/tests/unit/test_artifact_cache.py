@@ -0,0 +1,130 @@
+"""Tests for ArtifactCache."""
+
+import json
+import os
+
+import pytest
+
+from dbt_guardian.parsers import ArtifactCache, ManifestParser
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    """A minimal manifest.json on disk."""
+    path = tmp_path / "target" / "manifest.json"
+    path.parent.mkdir()
+    path.write_text(
+        json.dumps(
+            {
+                "metadata": {"dbt_version": "1.7.0"},
+                "nodes": {
+                    "model.p.orders": {
+                        "resource_type": "model",
+                        "name": "orders",
+                        "schema": "analytics",
+                        "columns": {"order_id": {"name": "order_id", "tests": ["unique"]}},
+                    }
+                },
+            }
+        )
+    )
+    return path
+
+
+class CountingParser:
+    """Wrap ManifestParser and count how often it actually parses."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return ManifestParser().parse(path)
+
+
+def test_warm_run_skips_parsing(tmp_path, manifest_path):
+    """Test that an unchanged artifact is served from the cache."""
+    cache = ArtifactCache(tmp_path / "cache")
+    parse = CountingParser()
+
+    cold = cache.get_or_parse(manifest_path, parse)
+    warm = cache.get_or_parse(manifest_path, parse)
+
+    assert parse.calls == 1
+    assert warm == cold
+    assert warm.models["model.p.orders"].columns["order_id"].tests == ["unique"]
+
+
+def test_changed_artifact_is_reparsed(tmp_path, manifest_path):
+    """Test that editing the artifact invalidates the entry."""
+    cache = ArtifactCache(tmp_path / "cache")
+    parse = CountingParser()
+    cache.get_or_parse(manifest_path, parse)
+
+    raw = json.loads(manifest_path.read_text())
+    raw["nodes"]["model.p.orders"]["name"] = "orders_v2"
+    manifest_path.write_text(json.dumps(raw))
+
+    manifest = cache.get_or_parse(manifest_path, parse)
+
+    assert parse.calls == 2
+    assert manifest.models["model.p.orders"].name == "orders_v2"
+
+
+def test_touched_artifact_reuses_entry(tmp_path, manifest_path):
+    """Test that a new mtime with identical content is still a hit."""
+    cache = ArtifactCache(tmp_path / "cache")
+    parse = CountingParser()
+    cache.get_or_parse(manifest_path, parse)
+
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.get_or_parse(manifest_path, parse)
+
+    assert parse.calls == 1
+
+
+def test_variants_are_cached_separately(tmp_path, manifest_path):
+    """Test that different parse variants do not share an entry."""
+    cache = ArtifactCache(tmp_path / "cache")
+    parse = CountingParser()
+
+    cache.get_or_parse(manifest_path, parse, variant="a")
+    cache.get_or_parse(manifest_path, parse, variant="b")
+
+    assert parse.calls == 2
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path, manifest_path):
+    """Test that an unreadable entry is discarded and re-parsed."""
+    cache = ArtifactCache(tmp_path / "cache")
+    parse = CountingParser()
+    cache.get_or_parse(manifest_path, parse)
+
+    entry = cache.cache_dir / f"{cache.key(manifest_path)}{ArtifactCache.ENTRY_SUFFIX}"
+    entry.write_bytes(b"not a pickle")
+    cache.get_or_parse(manifest_path, parse)
+
+    assert parse.calls == 2
+
+
+def test_eviction_keeps_cache_under_limit(tmp_path):
+    """Test that least recently used entries are evicted beyond max_bytes."""
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=3100)
+    for i in range(5):
+        cache.store(f"key{i}", "x" * 1000)
+        entry = cache.cache_dir / f"key{i}{ArtifactCache.ENTRY_SUFFIX}"
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+    cache.store("key5", "x" * 1000)
+
+    remaining = sorted(p.stem for p in cache.cache_dir.glob("*.pkl"))
+    assert remaining == ["key3", "key4", "key5"]
+
+
+def test_default_cache_dir_under_target(tmp_path):
+    """Test that project caches live in target/ unless overridden."""
+    assert ArtifactCache.for_project(tmp_path).cache_dir == (
+        tmp_path / "target" / ".dbt_guardian_cache"
+    )
+    assert ArtifactCache.for_project(tmp_path, tmp_path / "c").cache_dir == tmp_path / "c"
@@ -0,0 +1,113 @@
+"""Tests for multi-project batch analysis."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from dbt_guardian import analyzers
+from dbt_guardian.batch import BatchAnalyzer, expand_project_paths
+from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.cli import cli
+from dbt_guardian.parsers import CatalogParser, ManifestParser
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """Three projects under projects/, one of them with a corrupt manifest."""
+    for name, models in (("alpha", 10), ("beta", 6), ("broken", 4)):
+        root = tmp_path / "projects" / name
+        SyntheticProjectGenerator(SyntheticProjectSpec(models=models, max_columns=6)).write(root)
+    (tmp_path / "projects" / "broken" / "target" / "manifest.json").write_text("{not json")
+    (tmp_path / "projects" / "docs").mkdir()  # Not a dbt project
+    return tmp_path
+
+
+def _direct_report(project):
+    target = project / "target"
+    manifest = ManifestParser().parse(target / "manifest.json")
+    catalog = CatalogParser().parse(target / "catalog.json")
+    return analyzers.TestCoverageAnalyzer().analyze(manifest, catalog)
+
+
+def test_expand_project_paths(monorepo):
+    """Test that globs keep only dbt projects and literal paths are kept as given."""
+    projects = monorepo / "projects"
+    paths = expand_project_paths([str(projects / "*"), str(projects / "alpha"), "missing"])
+    assert paths == [projects / "alpha", projects / "beta", projects / "broken", Path("missing")]
+
+
+def test_recursive_glob(monorepo):
+    """Test that ** finds nested projects."""
+    paths = expand_project_paths([str(monorepo / "**")])
+    assert [p.name for p in paths] == ["alpha", "beta", "broken"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failures_are_isolated(monorepo, jobs):
+    """Test that a broken project is reported without affecting the others."""
+    projects = monorepo / "projects"
+    paths = [projects / "alpha", projects / "broken", projects / "beta"]
+    report = BatchAnalyzer(jobs=jobs, cache=False).analyze(paths)
+
+    assert [r.project_path for r in report.results] == paths
+    assert [r.ok for r in report.results] == [True, False, True]
+    assert report.results[1].error.startswith("JSONDecodeError")
+
+    alpha, beta = _direct_report(projects / "alpha"), _direct_report(projects / "beta")
+    assert report.results[0].report.to_dict() == alpha.to_dict()
+    assert report.total_models == alpha.total_models + beta.total_models
+    assert report.coverage_percentage == pytest.approx(
+        (alpha.tested_columns + beta.tested_columns)
+        / (alpha.total_columns + beta.total_columns)
+        * 100
+    )
+
+
+def test_missing_manifest_is_a_failure(tmp_path):
+    """Test that a project without target/manifest.json fails cleanly."""
+    (tmp_path / "dbt_project.yml").write_text("name: empty\n")
+    report = BatchAnalyzer(jobs=1).analyze([tmp_path])
+    assert report.failed[0].error.startswith("FileNotFoundError")
+    assert report.coverage_percentage == 0.0
+
+
+def test_batch_command(monorepo, tmp_path):
+    """Test the CLI's combined JSON report and exit status."""
+    output = tmp_path / "batch.json"
+    result = CliRunner().invoke(
+        cli,
+        ["batch", str(monorepo / "projects" / "*"), "-j", "2", "--no-cache", "-o", str(output)],
+    )
+    assert result.exit_code == 1  # The broken project
+    assert "Batch Coverage" in result.output
+
+    combined = json.loads(output.read_text())
+    assert combined["aggregate"]["projects"] == 3
+    assert combined["aggregate"]["failed"] == 1
+    assert combined["aggregate"]["total_models"] == 16
+    assert [p["error"] is None for p in combined["projects"]] == [True, True, False]
+
+
+def test_batch_command_shared_cache_dir(monorepo, tmp_path):
+    """Test that --cache-dir holds every project's cache and failures show as status."""
+    cache_dir = tmp_path / "cache"
+    result = CliRunner().invoke(
+        cli, ["batch", str(monorepo / "projects" / "*"), "-j", "1", "--cache-dir", str(cache_dir)]
+    )
+    assert result.exit_code == 1
+
+    assert len(list(cache_dir.glob("*.pkl"))) == 4  # Manifest and catalog of alpha and beta
+    assert not list((monorepo / "projects").glob("*/target/.dbt_guardian_cache"))
+
+    failed_row = next(line for line in result.output.splitlines() if "failed" in line)
+    cells = [cell.strip() for cell in failed_row.strip("│ ").split("│")]
+    assert cells[1:] == ["-"] * 6 + ["failed"]
+
+
+def test_batch_command_no_match(tmp_path):
+    """Test that a pattern matching no projects aborts."""
+    result = CliRunner().invoke(cli, ["batch", str(tmp_path / "*")])
+    assert result.exit_code != 0
+    assert "No dbt projects matched" in result.output
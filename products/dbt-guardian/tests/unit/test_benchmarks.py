@@ -0,0 +1,65 @@
+"""Tests for the synthetic project generator and benchmark runner."""
+
+import json
+
+from dbt_guardian.benchmarks import BenchmarkRunner, SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.benchmarks.runner import write_results
+from dbt_guardian.parsers import CatalogParser, ManifestParser
+from dbt_guardian.utils.json_backend import available_backends
+
+
+def test_generator_is_deterministic():
+    """Test that equal specs produce identical artifacts."""
+    spec = SyntheticProjectSpec(models=20, seed=7)
+
+    assert SyntheticProjectGenerator(spec).manifest() == SyntheticProjectGenerator(spec).manifest()
+    assert SyntheticProjectGenerator(spec).catalog() == SyntheticProjectGenerator(spec).catalog()
+
+
+def test_generated_artifacts_parse(tmp_path):
+    """Test that generated artifacts match the requested shape and parse cleanly."""
+    spec = SyntheticProjectSpec(models=30, min_columns=4, max_columns=8, test_density=0.5)
+    manifest_path, catalog_path = SyntheticProjectGenerator(spec).write(tmp_path)
+
+    manifest = ManifestParser().parse(manifest_path)
+    catalog = CatalogParser().parse(catalog_path)
+
+    assert len(manifest.models) == 30
+    assert len(manifest.sources) == 3
+    assert manifest.tests
+    for model_id, model in manifest.models.items():
+        assert 4 <= len(model.columns) <= 8
+        assert set(catalog.tables[model_id].columns) == set(model.columns)
+        # Dependencies only point upstream, so the DAG is acyclic
+        index = int(model.name[1:])
+        for parent in model.depends_on:
+            assert parent.startswith("source.") or int(parent.rsplit(".m", 1)[1]) < index
+
+
+def test_runner_reports_every_stage(tmp_path):
+    """Test that the runner times each stage and writes JSON results."""
+    results = BenchmarkRunner(repeat=1).run([SyntheticProjectSpec(models=10)])
+    output = tmp_path / "results.json"
+    write_results(results, output)
+
+    written = json.loads(output.read_text())
+    (size,) = written["results"]
+    assert size["models"] == 10
+    assert [s["name"] for s in size["stages"]] == [
+        *(f"manifest.decode.{backend}" for backend in available_backends()),
+        "manifest.parse",
+        "manifest.parse_stream",
+        "catalog.parse",
+        "graph",
+        "analyze",
+        "generate",
+    ]
+    assert all(s["wall_seconds"] >= 0 and s["peak_alloc_bytes"] > 0 for s in size["stages"])
+
+
+def test_merge_scales_linearly():
+    """Test that merge time per gap stays flat as models get 16x wider."""
+    narrow, wide = BenchmarkRunner(repeat=3).run_merge_scaling([50, 800])
+    assert wide.gaps == 16 * narrow.gaps
+    # Rebuilding the column index per gap made this ratio about 16
+    assert wide.microseconds_per_gap < 4 * narrow.microseconds_per_gap
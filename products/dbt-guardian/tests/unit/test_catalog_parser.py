@@ -0,0 +1,72 @@
+"""Tests for CatalogParser."""
+
+import json
+import pickle
+
+import pytest
+
+from dbt_guardian.parsers.catalog import CatalogParser, LazyCatalogTables
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    """A catalog.json with two models and a source."""
+
+    def entry(name, columns):
+        return {
+            "metadata": {"schema": "analytics", "name": name, "database": "warehouse"},
+            "columns": {
+                col: {"type": col_type, "index": i + 1, "name": col}
+                for i, (col, col_type) in enumerate(columns.items())
+            },
+            "stats": {},
+        }
+
+    path = tmp_path / "catalog.json"
+    path.write_text(
+        json.dumps(
+            {
+                "metadata": {"dbt_version": "1.7.0"},
+                "nodes": {
+                    "model.p.customers": entry("customers", {"id": "INTEGER"}),
+                    "model.p.orders": entry("orders", {"id": "INTEGER", "note": "TEXT"}),
+                },
+                "sources": {"source.p.raw.events": entry("events", {"id": "BIGINT"})},
+            }
+        )
+    )
+    return path
+
+
+def test_tables_are_built_on_access(catalog_path):
+    """Test that tables are only built when looked up."""
+    catalog = CatalogParser().parse(catalog_path)
+
+    assert isinstance(catalog.tables, LazyCatalogTables)
+    assert len(catalog.tables) == 3
+    assert "model.p.orders" in catalog.tables
+    assert catalog.tables.materialized == 0
+
+    orders = catalog.tables.get("model.p.orders")
+    assert orders.columns["note"].type == "TEXT"
+    assert catalog.tables.get("model.p.missing") is None
+    assert catalog.tables.materialized == 1
+    assert catalog.tables["model.p.orders"] is orders
+
+
+def test_lazy_tables_match_strict_parse(catalog_path):
+    """Test that lazy tables equal the eagerly validated ones."""
+    lazy = CatalogParser().parse(catalog_path)
+    strict = CatalogParser(strict=True).parse(catalog_path)
+
+    assert isinstance(strict.tables, dict)
+    assert dict(lazy.tables) == strict.tables
+    assert lazy == strict
+
+
+def test_lazy_tables_pickle_unbuilt(catalog_path):
+    """Test that cached catalogs stay lazy after a pickle round trip."""
+    catalog = pickle.loads(pickle.dumps(CatalogParser().parse(catalog_path)))
+
+    assert catalog.tables.materialized == 0
+    assert catalog.tables["source.p.raw.events"].columns["id"].type == "BIGINT"
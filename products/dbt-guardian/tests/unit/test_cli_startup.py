@@ -0,0 +1,74 @@
+"""Import-time budget for the CLI.
+
+Hooks and editors run ``dbt-guardian`` many times a minute, so importing the
+CLI must not pull in rich, pydantic, yaml or the parsing/analysis code.
+"""
+
+import subprocess
+import sys
+
+# Modules only subcommands may import
+HEAVY_MODULES = (
+    "rich",
+    "pydantic",
+    "yaml",
+    "dbt_guardian.parsers.manifest",
+    "dbt_guardian.parsers.catalog",
+    "dbt_guardian.analyzers",
+    "dbt_guardian.generators",
+    "dbt_guardian.server",
+    "dbt_guardian.batch",
+)
+
+# Cumulative import time of dbt_guardian.cli (about 65 ms locally, 260 ms with
+# eager imports); generous so slow CI machines do not flake
+IMPORT_BUDGET_US = 150_000
+
+
+def _imported_modules(code: str) -> dict:
+    """Run ``code`` under -X importtime and return {module: cumulative microseconds}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        modules[name] = int(cumulative)
+    return modules
+
+
+def _heavy(modules: dict) -> list:
+    return sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+
+
+def test_cli_import_skips_heavy_modules():
+    """Test that importing the CLI leaves heavy dependencies unloaded."""
+    assert _heavy(_imported_modules("import dbt_guardian.cli")) == []
+
+
+def test_help_skips_heavy_modules():
+    """Test that --help renders without importing heavy dependencies."""
+    code = (
+        "from dbt_guardian.cli import cli\n"
+        "try:\n"
+        "    cli(['analyze', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+    assert _heavy(_imported_modules(code)) == []
+
+
+def test_cli_import_time_budget():
+    """Test that importing the CLI stays within the startup budget."""
+    # Best of three to ignore one-off disk or scheduler stalls
+    best = min(_imported_modules("import dbt_guardian.cli")["dbt_guardian.cli"] for _ in range(3))
+    assert best < IMPORT_BUDGET_US, f"dbt_guardian.cli took {best / 1000:.0f} ms to import"
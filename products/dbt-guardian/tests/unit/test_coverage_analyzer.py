@@ -3,7 +3,7 @@
 import pytest
 
 from dbt_guardian.analyzers import ColumnGap, TestCoverageAnalyzer, TestType
-from dbt_guardian.parsers.manifest import DbtColumn, DbtManifest, DbtModel
+from dbt_guardian.parsers.manifest import DbtColumn, DbtManifest, DbtModel, DbtTest
 
 
 @pytest.fixture
@@ -232,3 +232,138 @@ def test_analyze_populates_inferred_parent_table(sample_manifest):
     user_id_gap = next((g for g in report.gaps if g.column_name == "user_id"), None)
     assert user_id_gap is not None
     assert user_id_gap.inferred_parent_table == "users"
+
+
+def test_analyze_counts_test_nodes_as_coverage():
+    """Test that separate test nodes attached to a column count as existing tests."""
+    analyzer = TestCoverageAnalyzer()
+
+    manifest = DbtManifest(
+        models={
+            "model.project.orders": DbtModel(
+                unique_id="model.project.orders",
+                name="orders",
+                schema="public",
+                columns={
+                    "order_id": DbtColumn(name="order_id"),
+                    "user_id": DbtColumn(name="user_id", tests=["not_null"]),
+                },
+            )
+        },
+        tests={
+            f"test.project.{test_type}_orders_order_id": DbtTest(
+                unique_id=f"test.project.{test_type}_orders_order_id",
+                name=f"{test_type}_orders_order_id",
+                test_type=test_type,
+                model="model.project.orders",
+                column="order_id",
+            )
+            for test_type in ("unique", "not_null")
+        }
+        | {
+            "test.project.relationships_orders_user_id": DbtTest(
+                unique_id="test.project.relationships_orders_user_id",
+                name="relationships_orders_user_id",
+                test_type="relationships",
+                model="model.project.orders",
+                column="USER_ID",
+            )
+        },
+    )
+
+    report = analyzer.analyze(manifest)
+
+    assert report.tested_columns == 2
+    # order_id is fully covered by test nodes; user_id by inline + node tests
+    assert report.gaps == []
+
+
+def test_parallel_analysis_matches_serial():
+    """Test that sharding models across processes yields an identical report."""
+    from dbt_guardian.parsers.catalog import CatalogColumn, CatalogTable, DbtCatalog
+
+    models = {}
+    tests = {}
+    tables = {}
+    for i in range(25):
+        model_id = f"model.project.m{i}"
+        models[model_id] = DbtModel(
+            unique_id=model_id,
+            # Duplicate names across models exercise sort tie-breaking
+            name=f"m{i % 7}",
+            schema="public",
+            columns={
+                name: DbtColumn(name=name)
+                for name in ("id", f"m{i % 7}_id", "user_id", "status", "created_at", "note")
+            },
+        )
+        tests[f"test.project.unique_m{i}_id"] = DbtTest(
+            unique_id=f"test.project.unique_m{i}_id",
+            name=f"unique_m{i}_id",
+            test_type="unique",
+            model=model_id,
+            column="id",
+        )
+        if i % 2:
+            tables[model_id] = CatalogTable(
+                unique_id=model_id,
+                name=f"m{i}",
+                schema="public",
+                columns={"note": CatalogColumn(name="note", type="text", index=1)},
+            )
+    manifest = DbtManifest(models=models, tests=tests)
+    catalog = DbtCatalog(tables=tables)
+
+    analyzer = TestCoverageAnalyzer()
+    serial = analyzer.analyze(manifest, catalog)
+    parallel = analyzer.analyze(manifest, catalog, jobs=3)
+
+    assert parallel == serial
+    assert serial.tested_columns == 25
+
+
+@pytest.mark.parametrize(
+    "col_name,model_name,category,priority",
+    [
+        ("id", "orders", "primary_key", 1),
+        ("order_id", "orders", "primary_key", 1),
+        ("user_id", "orders", "foreign_key", 2),
+        ("created_at", "orders", "timestamp", 2),
+        ("shipped_timestamp", "orders", "timestamp", 4),
+        ("Order_Status", "orders", "status", 3),
+        ("api_key", "orders", "primary_key", 5),
+        ("email", "orders", "other", 5),
+    ],
+)
+def test_classify_column(col_name, model_name, category, priority):
+    """Test that the column classifier assigns category and priority."""
+    traits = TestCoverageAnalyzer().classify_column(col_name, model_name)
+
+    assert traits.category.value == category
+    assert traits.priority == priority
+
+
+def test_classify_column_is_memoized():
+    """Test that classification is computed once per (column, model)."""
+    analyzer = TestCoverageAnalyzer()
+
+    first = analyzer.classify_column("user_id", "orders")
+    assert analyzer.classify_column("user_id", "orders") is first
+    assert analyzer.classify_column("user_id", "users") is not first
+
+
+def test_analyze_projected_manifest_matches_full(tmp_path):
+    """Test that MANIFEST_FIELDS keeps everything analysis reads."""
+    from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+    from dbt_guardian.parsers import ManifestParser
+
+    manifest_path, _ = SyntheticProjectGenerator(SyntheticProjectSpec(models=40)).write(tmp_path)
+    parser = ManifestParser()
+    analyzer = TestCoverageAnalyzer()
+
+    full = analyzer.analyze(parser.parse(manifest_path))
+    projected = analyzer.analyze(
+        parser.parse(manifest_path, fields=TestCoverageAnalyzer.MANIFEST_FIELDS)
+    )
+
+    assert projected == full
@@ -0,0 +1,148 @@
+"""Tests for the CSR dependency graph."""
+
+import random
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.cli import cli
+from dbt_guardian.graph import DependencyGraph
+from dbt_guardian.parsers import ManifestParser
+
+
+@pytest.fixture
+def graph():
+    """a -> b -> d, a -> c -> d, d -> e; x is unrelated."""
+    return DependencyGraph(
+        {"a": [], "b": ["a"], "c": ["a", "a"], "d": ["b", "c"], "e": ["d"], "x": ["src"]}
+    )
+
+
+def _random_parents(nodes, seed=0):
+    rng = random.Random(seed)
+    return {
+        f"n{i}": [f"n{rng.randrange(i)}" for _ in range(rng.randint(1, 4))] if i else []
+        for i in range(nodes)
+    }
+
+
+def _reachable(edges, start):
+    seen, stack = set(), list(edges[start])
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(edges[node])
+    return seen
+
+
+def test_adjacency(graph):
+    """Test parents, children and fan-in/out, with duplicate edges dropped."""
+    assert len(graph) == 7
+    assert graph.edge_count == 6
+    assert graph.parents("d") == ["b", "c"]
+    assert graph.children("a") == ["b", "c"]
+    assert graph.fan_in("c") == 1
+    assert graph.fan_out("a") == 2
+    assert graph.fan_out_counts() == {"a": 2, "b": 1, "c": 1, "d": 1, "e": 0, "x": 0, "src": 1}
+
+
+def test_unknown_parents_become_nodes(graph):
+    """Test that parents without an entry of their own are interned."""
+    assert "src" in graph
+    assert graph.parents("src") == []
+    assert graph.children("src") == ["x"]
+
+
+def test_traversal(graph):
+    """Test ancestors and descendants, nearest first."""
+    assert graph.ancestors("e") == ["d", "b", "c", "a"]
+    assert graph.descendants("a") == ["b", "c", "d", "e"]
+    assert sorted(graph.descendants(["b", "src"])) == ["d", "e", "x"]
+    assert graph.ancestors("a") == []
+    with pytest.raises(KeyError, match="Unknown node: nope"):
+        graph.descendants("nope")
+
+
+def test_topological_order(graph):
+    """Test that every node comes after its parents, ties in insertion order."""
+    assert graph.topological_order() == ["a", "src", "b", "c", "x", "d", "e"]
+
+
+def test_cycle_is_reported():
+    """Test that a cycle makes topological ordering fail."""
+    graph = DependencyGraph({"a": ["c"], "b": ["a"], "c": ["b"], "d": []})
+    with pytest.raises(ValueError, match="cycle among 3 nodes"):
+        graph.topological_order()
+
+
+def test_matches_brute_force():
+    """Test traversals against a dict-of-sets search on a random DAG."""
+    parents = _random_parents(300, seed=3)
+    graph = DependencyGraph(parents)
+    children = {node: set() for node in parents}
+    for node, node_parents in parents.items():
+        for parent in node_parents:
+            children[parent].add(node)
+
+    position = {node: i for i, node in enumerate(graph.topological_order())}
+    assert all(position[p] < position[n] for n, ps in parents.items() for p in ps)
+    for node in ("n0", "n17", "n150", "n299"):
+        assert set(graph.ancestors(node)) == _reachable(parents, node)
+        assert set(graph.descendants(node)) == _reachable(children, node)
+        assert graph.fan_out(node) == len(children[node])
+
+
+def test_from_manifest(tmp_path):
+    """Test building the graph from a projected manifest, without tests."""
+    spec = SyntheticProjectSpec(models=30, test_density=0.5)
+    manifest_path, _ = SyntheticProjectGenerator(spec).write(tmp_path)
+    manifest = ManifestParser().parse(manifest_path, fields=DependencyGraph.MANIFEST_FIELDS)
+    graph = DependencyGraph.from_manifest(manifest)
+
+    assert len(graph) == len(manifest.models) + len(manifest.sources)
+    assert not any(unique_id in graph for unique_id in manifest.tests)
+    for unique_id, model in manifest.models.items():
+        assert graph.parents(unique_id) == list(dict.fromkeys(model.depends_on))
+    assert len(graph.topological_order()) == len(graph)
+
+
+def _best_seconds(parents, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        graph = DependencyGraph(parents)
+        graph.topological_order()
+        graph.descendants("n0")
+        graph.fan_out_counts()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_graph_scales_linearly():
+    """Test that build, sort and traversal time grows linearly with graph size."""
+    small, large = _best_seconds(_random_parents(2_000)), _best_seconds(_random_parents(16_000))
+    # 8x the nodes and edges; a quadratic step would make this ratio about 64.
+    # Absolute timings live in the benchmark's "graph" stage.
+    assert large < 20 * small
+
+
+def test_lineage_command(tmp_path):
+    """Test the lineage summary and per-model listing."""
+    SyntheticProjectGenerator(SyntheticProjectSpec(models=20)).write(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["lineage", str(tmp_path), "--no-cache", "--top", "3"])
+    assert result.exit_code == 0, result.output
+    assert "Dependency graph: 22 nodes" in result.output
+
+    result = runner.invoke(cli, ["lineage", str(tmp_path), "m1", "--direction", "upstream"])
+    assert result.exit_code == 0, result.output
+    assert "Upstream of model.synthetic.m1:" in result.output
+    assert "Downstream" not in result.output
+
+    result = runner.invoke(cli, ["lineage", str(tmp_path), "nope"])
+    assert result.exit_code == 2
+    assert "not found" in result.output
@@ -0,0 +1,168 @@
+"""Tests for machine-readable coverage output."""
+
+import csv
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from dbt_guardian import analyzers, export
+from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.cli import cli
+from dbt_guardian.parsers import CatalogParser, ManifestParser
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A synthetic project with manifest and catalog."""
+    SyntheticProjectGenerator(SyntheticProjectSpec(models=25, max_columns=8)).write(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def artifacts(project):
+    target = project / "target"
+    return (
+        ManifestParser().parse(target / "manifest.json"),
+        CatalogParser().parse(target / "catalog.json"),
+    )
+
+
+def _key(record):
+    return record["model_name"], record["column_name"]
+
+
+def test_stream_matches_report(artifacts):
+    """Test that streamed gaps and totals match a full analysis."""
+    analyzer = analyzers.TestCoverageAnalyzer()
+    report = analyzer.analyze(*artifacts)
+    coverage = analyzer.stream(*artifacts)
+
+    streamed = [export.gap_record(gap) for gap in coverage]
+    expected = [export.gap_record(gap) for gap in report.gaps]
+    assert sorted(streamed, key=_key) == sorted(expected, key=_key)
+    assert coverage.summary() == report.summary()
+
+
+def test_json(artifacts):
+    """Test that json output parses, with the summary after the gaps."""
+    coverage = analyzers.TestCoverageAnalyzer().stream(*artifacts)
+    out = io.StringIO()
+    count = export.write_gaps(coverage, "json", out, coverage.summary)
+
+    data = json.loads(out.getvalue())
+    assert list(data) == ["gaps", "summary"]
+    assert len(data["gaps"]) == count == data["summary"]["total_gaps"]
+
+
+def test_json_empty():
+    """Test that json output without gaps is still valid."""
+    out = io.StringIO()
+    assert export.write_gaps([], "json", out) == 0
+    assert json.loads(out.getvalue()) == {"gaps": []}
+
+
+def test_ndjson_and_csv_agree(artifacts):
+    """Test that ndjson and csv carry the same records."""
+    gaps = analyzers.TestCoverageAnalyzer().analyze(*artifacts).gaps
+    ndjson_out, csv_out = io.StringIO(), io.StringIO()
+    export.write_gaps(gaps, "ndjson", ndjson_out)
+    export.write_gaps(gaps, "csv", csv_out)
+
+    records = [json.loads(line) for line in ndjson_out.getvalue().splitlines()]
+    rows = list(csv.DictReader(io.StringIO(csv_out.getvalue())))
+    assert len(records) == len(rows) == len(gaps)
+    for record, row in zip(records, rows, strict=True):
+        assert list(row) == list(export.GAP_FIELDS)
+        assert row["suggested_tests"] == ";".join(record["suggested_tests"])
+        assert int(row["priority"]) == record["priority"]
+
+
+def test_columnar_batches(artifacts, monkeypatch):
+    """Test that columnar output splits into batches of column arrays."""
+    monkeypatch.setattr(export, "COLUMNAR_BATCH_ROWS", 7)
+    gaps = analyzers.TestCoverageAnalyzer().analyze(*artifacts).gaps
+    out = io.StringIO()
+    export.write_gaps(gaps, "columnar", out)
+
+    batches = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [b["rows"] for b in batches[:-1]] == [7] * (len(batches) - 1)
+    assert sum(b["rows"] for b in batches) == len(gaps)
+    names = [name for b in batches for name in b["columns"]["column_name"]]
+    assert names == [gap.column_name for gap in gaps]
+
+
+def test_writes_as_gaps_arrive(artifacts):
+    """Test that each record is written before the next gap is produced."""
+    gaps = analyzers.TestCoverageAnalyzer().analyze(*artifacts).gaps[:5]
+    out = io.StringIO()
+
+    def produce():
+        for i, gap in enumerate(gaps):
+            assert out.getvalue().count("\n") == i
+            yield gap
+
+    assert export.write_gaps(produce(), "ndjson", out) == len(gaps)
+
+
+def test_unknown_format():
+    """Test that an unknown format is rejected."""
+    with pytest.raises(ValueError, match="Unknown format"):
+        export.write_gaps([], "xml", io.StringIO())
+
+
+@pytest.mark.parametrize("extra", [[], ["--jobs", "2"], ["--incremental"]])
+def test_analyze_format(project, artifacts, extra):
+    """Test that analyze --format writes only records, filtered by priority."""
+    result = CliRunner().invoke(
+        cli, ["analyze", str(project), "--format", "json", "--priority", "2", *extra]
+    )
+    assert result.exit_code == 0, result.output
+
+    data = json.loads(result.output)
+    report = analyzers.TestCoverageAnalyzer().analyze(*artifacts)
+    expected = [export.gap_record(g) for g in report.gaps if g.priority <= 2]
+    assert sorted(data["gaps"], key=_key) == sorted(expected, key=_key)
+    assert data["summary"] == report.summary()
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv"])
+def test_analyze_format_identical_across_modes(project, tmp_path, fmt):
+    """Test that -j 2 and --incremental write the same bytes as -j 1."""
+    runner = CliRunner()
+    outputs = []
+    for extra in (["-j", "1"], ["-j", "2"], ["--incremental"], ["--incremental"]):
+        result = runner.invoke(
+            cli,
+            [
+                "analyze",
+                str(project),
+                "--format",
+                fmt,
+                "--state",
+                str(tmp_path / "state.json"),
+                *extra,
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        outputs.append(result.output)
+    # The second incremental run reuses every stored model
+    assert outputs[1:] == [outputs[0]] * 3
+
+
+def test_analyze_format_output_file(project, tmp_path):
+    """Test that --output writes the records to a file."""
+    output = tmp_path / "gaps.csv"
+    result = CliRunner().invoke(
+        cli, ["analyze", str(project), "--format", "csv", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    assert output.read_text().startswith(",".join(export.GAP_FIELDS) + "\n")
+
+
+def test_analyze_format_rejects_watch(project):
+    """Test that --watch cannot be combined with a machine-readable format."""
+    result = CliRunner().invoke(cli, ["analyze", str(project), "--format", "csv", "--watch"])
+    assert result.exit_code == 2
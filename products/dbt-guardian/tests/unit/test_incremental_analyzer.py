@@ -0,0 +1,124 @@
+"""Unit tests for IncrementalCoverageAnalyzer."""
+
+import pytest
+
+from dbt_guardian.analyzers import (
+    CoverageState,
+    IncrementalCoverageAnalyzer,
+    TestCoverageAnalyzer,
+)
+from dbt_guardian.parsers.catalog import CatalogColumn, CatalogTable, DbtCatalog
+from dbt_guardian.parsers.manifest import DbtColumn, DbtManifest, DbtModel, DbtTest
+
+
+def make_manifest(order_columns=("order_id", "user_id", "status"), checksum="abc"):
+    """Build a two-model manifest; order columns and checksum are adjustable."""
+    return DbtManifest(
+        models={
+            "model.project.users": DbtModel(
+                unique_id="model.project.users",
+                name="users",
+                schema="public",
+                checksum="u1",
+                columns={
+                    "id": DbtColumn(name="id", tests=["unique"]),
+                    "created_at": DbtColumn(name="created_at"),
+                },
+            ),
+            "model.project.orders": DbtModel(
+                unique_id="model.project.orders",
+                name="orders",
+                schema="public",
+                checksum=checksum,
+                columns={name: DbtColumn(name=name) for name in order_columns},
+            ),
+        }
+    )
+
+
+def test_first_run_analyzes_everything():
+    """Test that without state every model is analyzed and matches a full run."""
+    manifest = make_manifest()
+    result = IncrementalCoverageAnalyzer().analyze(manifest)
+
+    assert sorted(result.analyzed_models) == ["model.project.orders", "model.project.users"]
+    assert result.reused_models == 0
+    assert result.report == TestCoverageAnalyzer().analyze(manifest)
+
+
+def test_unchanged_models_are_reused(tmp_path):
+    """Test that a round-tripped state lets unchanged models skip analysis."""
+    analyzer = IncrementalCoverageAnalyzer()
+    state_path = tmp_path / "state.json"
+    analyzer.analyze(make_manifest()).state.save(state_path)
+
+    manifest = make_manifest(order_columns=("order_id", "user_id", "status", "updated_at"))
+    result = analyzer.analyze(manifest, previous=CoverageState.load(state_path))
+
+    assert result.analyzed_models == ["model.project.orders"]
+    assert result.reused_models == 1
+    assert result.report == TestCoverageAnalyzer().analyze(manifest)
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["checksum", "test_node", "catalog_type"],
+)
+def test_changed_inputs_trigger_reanalysis(change):
+    """Test that SQL, test node and catalog changes all invalidate a model."""
+    analyzer = IncrementalCoverageAnalyzer()
+    previous = analyzer.analyze(make_manifest()).state
+
+    manifest = make_manifest(checksum="changed" if change == "checksum" else "abc")
+    catalog = None
+    if change == "test_node":
+        manifest = DbtManifest(
+            models=manifest.models,
+            tests={
+                "test.project.not_null_orders_status": DbtTest(
+                    unique_id="test.project.not_null_orders_status",
+                    name="not_null_orders_status",
+                    test_type="not_null",
+                    model="model.project.orders",
+                    column="status",
+                )
+            },
+        )
+    elif change == "catalog_type":
+        catalog = DbtCatalog(
+            tables={
+                "model.project.orders": CatalogTable(
+                    unique_id="model.project.orders",
+                    name="orders",
+                    schema="public",
+                    columns={"status": CatalogColumn(name="status", type="text", index=1)},
+                )
+            }
+        )
+
+    result = analyzer.analyze(manifest, catalog, previous)
+
+    assert result.analyzed_models == ["model.project.orders"]
+    assert result.report == TestCoverageAnalyzer().analyze(manifest, catalog)
+
+
+def test_removed_models_are_dropped_from_state():
+    """Test that models no longer in the manifest leave the state."""
+    analyzer = IncrementalCoverageAnalyzer()
+    previous = analyzer.analyze(make_manifest()).state
+
+    manifest = make_manifest()
+    del manifest.models["model.project.orders"]
+    result = analyzer.analyze(manifest, previous=previous)
+
+    assert result.removed_models == 1
+    assert list(result.state.models) == ["model.project.users"]
+
+
+def test_load_missing_or_corrupt_state(tmp_path):
+    """Test that unreadable state is treated as absent."""
+    assert CoverageState.load(tmp_path / "missing.json") is None
+
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    assert CoverageState.load(corrupt) is None
@@ -0,0 +1,100 @@
+"""Tests for JSON backend selection."""
+
+import json
+
+import pytest
+
+from dbt_guardian.parsers import ManifestParser
+from dbt_guardian.utils.json_backend import (
+    BACKEND_ENV_VAR,
+    available_backends,
+    get_backend,
+    load_json,
+    read_buffer,
+)
+
+
+@pytest.fixture
+def document(tmp_path):
+    """A small JSON file with nested values and non-ASCII text."""
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps({"nodes": {"a": [1, 2.5, None, True, "ünïcode"]}}))
+    return path
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_decode_identically(document, backend):
+    """Test that every installed backend decodes to the same objects."""
+    assert load_json(document, backend) == load_json(document, "stdlib")
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_raise_json_decode_error(tmp_path, backend):
+    """Test that every backend reports malformed input as JSONDecodeError."""
+    path = tmp_path / "bad.json"
+    path.write_text('{"nodes": {"a": }}')
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json(path, backend)
+
+
+def test_auto_prefers_fastest_installed():
+    """Test that auto resolves to the first installed backend."""
+    assert "stdlib" in available_backends()
+    assert get_backend("auto").name == available_backends()[0]
+
+
+def test_backend_from_environment(monkeypatch, document):
+    """Test that the environment variable selects the backend."""
+    monkeypatch.setenv(BACKEND_ENV_VAR, "stdlib")
+    assert get_backend().name == "stdlib"
+
+    monkeypatch.setenv(BACKEND_ENV_VAR, "nope")
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        ManifestParser().parse(document)
+
+
+def test_missing_backend_is_reported(monkeypatch):
+    """Test that forcing an uninstalled backend fails clearly."""
+    import dbt_guardian.utils.json_backend as json_backend
+
+    def missing():
+        raise ImportError("not installed")
+
+    monkeypatch.setitem(json_backend._FACTORIES, "msgspec", missing)
+    monkeypatch.setattr(json_backend, "_resolved", {})
+    with pytest.raises(ValueError, match="not installed"):
+        get_backend("msgspec")
+
+
+def test_read_buffer_maps_file(document):
+    """Test that files are exposed as a memory-mapped view."""
+    with read_buffer(document) as data:
+        assert isinstance(data, memoryview)
+        assert bytes(data) == document.read_bytes()
+
+
+def test_read_buffer_falls_back_to_bytes(tmp_path, monkeypatch, document):
+    """Test the plain-read fallback for empty and unmappable files."""
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    with read_buffer(empty) as data:
+        assert data == b""
+
+    def unsupported(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr("dbt_guardian.utils.json_backend.mmap.mmap", unsupported)
+    with read_buffer(document) as data:
+        assert data == document.read_bytes()
+    assert load_json(document) == json.loads(document.read_text())
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_empty_file_is_invalid_json(tmp_path, backend):
+    """Test that an empty artifact is reported as invalid JSON."""
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json(empty, backend)
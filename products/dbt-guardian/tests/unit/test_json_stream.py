@@ -0,0 +1,108 @@
+"""Tests for the incremental JSON object reader."""
+
+import io
+import json
+
+import pytest
+
+from dbt_guardian.utils.json_stream import JsonObjectStream, iter_json_members
+
+
+@pytest.fixture
+def document():
+    """A manifest-shaped document with scalars, nested values and unicode."""
+    return {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": {
+            "model.p.a": {"name": "a", "columns": {"id": {"tests": ["unique"]}}},
+            "model.p.b": {"name": "bé", "size": 123456789, "ratio": -1.5e-3},
+        },
+        "sources": {},
+        "count": 42,
+        "flags": [True, False, None],
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 20])
+def test_iter_members_expands_sections(document, chunk_size):
+    """Test that expanded sections are yielded member by member at any chunk size."""
+    text = json.dumps(document, indent=2)
+    members = list(
+        iter_json_members(io.StringIO(text), expand=("nodes", "sources"), chunk_size=chunk_size)
+    )
+
+    assert members == [
+        (("metadata",), document["metadata"]),
+        (("nodes", "model.p.a"), document["nodes"]["model.p.a"]),
+        (("nodes", "model.p.b"), document["nodes"]["model.p.b"]),
+        (("count",), 42),
+        (("flags",), [True, False, None]),
+    ]
+
+
+def test_iter_members_without_expand(document):
+    """Test that unexpanded members are yielded whole."""
+    members = dict(iter_json_members(io.StringIO(json.dumps(document)), chunk_size=4))
+
+    assert members[("nodes",)] == document["nodes"]
+    assert members[("sources",)] == {}
+
+
+def test_iter_members_empty_object():
+    """Test that an empty object yields nothing."""
+    assert list(iter_json_members(io.StringIO("  { } "), expand=("nodes",))) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "[]", '{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}', '{"a": 1} x', '{"nodes": {"x": }}'],
+)
+def test_iter_members_invalid_json(text):
+    """Test that malformed documents raise JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_members(io.StringIO(text), expand=("nodes",), chunk_size=2))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64])
+def test_iter_members_skips_undecoded_sections(document, chunk_size):
+    """Test that keys outside ``decode`` are skipped, including tricky strings."""
+    document["macros"] = {"m": {"sql": 'a "quoted" {{ x }} ] } \\ [', "deps": [[{}], []]}}
+    document["docs"] = "}]\\\"{["
+    text = json.dumps(document)
+    members = list(
+        iter_json_members(
+            io.StringIO(text), expand=("nodes",), chunk_size=chunk_size, decode=("metadata",)
+        )
+    )
+
+    assert [path for path, _ in members] == [
+        ("metadata",),
+        ("nodes", "model.p.a"),
+        ("nodes", "model.p.b"),
+    ]
+
+
+def test_skipped_sections_do_not_grow_the_buffer(document):
+    """Test that a large unneeded section is scanned without buffering it whole."""
+    document["macros"] = {f"macro.p.m{i}": {"macro_sql": "x" * 200} for i in range(5000)}
+    document["child_map"] = {f"model.p.m{i}": [f"model.p.m{i + 1}"] * 20 for i in range(5000)}
+    stream = JsonObjectStream(io.StringIO(json.dumps(document)), chunk_size=4096)
+    largest = 0
+    fill = stream._fill
+
+    def tracked_fill(size):
+        nonlocal largest
+        fill(size)
+        largest = max(largest, len(stream._buf))
+
+    stream._fill = tracked_fill
+    members = list(stream.iter_members(expand=("nodes",), decode=("metadata",)))
+
+    assert len(members) == 3
+    assert largest <= 2 * 4096
+
+
+def test_skipped_section_must_be_complete():
+    """Test that a truncated skipped section is still reported."""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_members(io.StringIO('{"macros": {"a": [1, 2'), decode=(), chunk_size=3))
@@ -5,6 +5,7 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
+from pydantic import ValidationError
 
 from dbt_guardian.parsers.manifest import ManifestParser, DbtManifest
 
@@ -55,6 +56,51 @@ def sample_manifest():
     }
 
 
+@pytest.fixture
+def full_manifest(sample_manifest):
+    """Sample manifest with every resource type the parser understands."""
+    sample_manifest["nodes"].update(
+        {
+            "seed.my_project.country_codes": {
+                "resource_type": "seed",
+                "name": "country_codes",
+                "schema": "seeds",
+                "columns": {"code": {"name": "code", "data_type": "text"}},
+            },
+            "snapshot.my_project.customers_snapshot": {
+                "resource_type": "snapshot",
+                "name": "customers_snapshot",
+                "schema": "snapshots",
+                "depends_on": {"nodes": ["model.my_project.customers"]},
+                "config": {"strategy": "timestamp", "unique_key": "customer_id"},
+            },
+            "analysis.my_project.scratch": {
+                "resource_type": "analysis",
+                "name": "scratch",
+            },
+        }
+    )
+    sample_manifest["sources"] = {
+        "source.my_project.raw.customers": {
+            "resource_type": "source",
+            "name": "customers",
+            "source_name": "raw",
+            "schema": "raw",
+            "identifier": "customers_v2",
+            "loaded_at_field": "_loaded_at",
+        }
+    }
+    sample_manifest["exposures"] = {
+        "exposure.my_project.weekly_kpis": {
+            "name": "weekly_kpis",
+            "type": "dashboard",
+            "owner": {"name": "Analytics"},
+            "depends_on": {"nodes": ["model.my_project.customers"]},
+        }
+    }
+    return sample_manifest
+
+
 def test_parse_manifest_success(sample_manifest):
     """Test successful manifest parsing."""
     # Write sample manifest to temp file
@@ -123,3 +169,181 @@ def test_parse_empty_manifest():
         assert len(manifest.tests) == 0
     finally:
         temp_path.unlink()
+
+
+def test_parse_manifest_streaming_matches_full_parse(sample_manifest):
+    """Test that streaming parse builds the same manifest as a full load."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(sample_manifest, f, indent=2)
+        temp_path = Path(f.name)
+
+    try:
+        parser = ManifestParser()
+        assert parser.parse(temp_path, stream=True) == parser.parse(temp_path)
+    finally:
+        temp_path.unlink()
+
+
+def test_parse_manifest_streaming_invalid_json():
+    """Test that streaming parse reports invalid JSON."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        f.write('{"nodes": {"model.a": {"name": }}}')
+        temp_path = Path(f.name)
+
+    try:
+        parser = ManifestParser()
+        with pytest.raises(json.JSONDecodeError):
+            parser.parse(temp_path, stream=True)
+    finally:
+        temp_path.unlink()
+
+
+def test_parse_manifest_typed_resources(full_manifest):
+    """Test that seeds, snapshots, sources and exposures become typed objects."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(full_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        parser = ManifestParser()
+        manifest = parser.parse(temp_path)
+
+        assert list(manifest.models) == ["model.my_project.customers"]
+        assert list(manifest.tests) == ["test.my_project.unique_customers_customer_id"]
+
+        seed = manifest.seeds["seed.my_project.country_codes"]
+        assert seed.columns["code"].data_type == "text"
+
+        snapshot = manifest.snapshots["snapshot.my_project.customers_snapshot"]
+        assert snapshot.strategy == "timestamp"
+        assert snapshot.unique_key == "customer_id"
+        assert snapshot.depends_on == ["model.my_project.customers"]
+
+        source = manifest.sources["source.my_project.raw.customers"]
+        assert source.source_name == "raw"
+        assert source.identifier == "customers_v2"
+
+        # Exposures omit resource_type in some dbt versions; the section implies it
+        exposure = manifest.exposures["exposure.my_project.weekly_kpis"]
+        assert exposure.exposure_type == "dashboard"
+        assert exposure.depends_on == ["model.my_project.customers"]
+
+        assert parser.parse(temp_path, stream=True) == manifest
+    finally:
+        temp_path.unlink()
+
+
+def test_tests_for_column_index(sample_manifest):
+    """Test that test nodes are indexed by (model, column) at parse time."""
+    sample_manifest["nodes"]["test.my_project.relationships_orders_customer_id"] = {
+        "resource_type": "test",
+        "name": "relationships_orders_customer_id",
+        "column_name": '"Customer_ID"',
+        "test_metadata": {"name": "relationships"},
+        "attached_node": "model.my_project.customers",
+        "depends_on": {"nodes": ["model.my_project.accounts", "model.my_project.customers"]},
+    }
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(sample_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        manifest = ManifestParser().parse(temp_path)
+
+        tests = manifest.tests_for_column("model.my_project.customers", "customer_id")
+        assert sorted(t.test_type for t in tests) == ["relationships", "unique"]
+        assert manifest.tests_for_column("model.my_project.customers", "email") == []
+        assert manifest.tests_for_column("model.my_project.accounts", "customer_id") == []
+    finally:
+        temp_path.unlink()
+
+
+def test_parse_manifest_strict_matches_fast_path(full_manifest):
+    """Test that strict validation builds the same manifest as the fast path."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(full_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        fast = ManifestParser().parse(temp_path)
+        assert ManifestParser(strict=True).parse(temp_path) == fast
+
+        column = fast.models["model.my_project.customers"].columns["customer_id"]
+        assert not hasattr(column, "__dict__")
+    finally:
+        temp_path.unlink()
+
+
+def test_parse_manifest_strict_rejects_bad_types(sample_manifest):
+    """Test that strict mode reports nodes with unexpected field types."""
+    sample_manifest["nodes"]["model.my_project.customers"]["columns"]["customer_id"][
+        "data_type"
+    ] = 42
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(sample_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        ManifestParser().parse(temp_path)  # trusted fast path skips validation
+        with pytest.raises(ValidationError):
+            ManifestParser(strict=True).parse(temp_path)
+    finally:
+        temp_path.unlink()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_parse_manifest_projection(sample_manifest, stream):
+    """Test that a field projection keeps only requested and required fields."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(sample_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        parser = ManifestParser()
+        manifest = parser.parse(temp_path, stream=stream, fields={"columns"})
+        model = manifest.models["model.my_project.customers"]
+        assert model.unique_id == "model.my_project.customers"
+        assert model.name == "customers"  # required fields are always kept
+        assert set(model.columns) == {"customer_id", "email"}
+        assert model.sql is None
+        assert model.depends_on == []
+        assert model.description is None
+
+        names_only = parser.parse(temp_path, stream=stream, fields=set())
+        assert names_only.models["model.my_project.customers"].columns == {}
+        # Tests keep the fields the column test index is built from
+        test = names_only.tests["test.my_project.unique_customers_customer_id"]
+        assert test.column == "customer_id"
+        assert test.config == {}
+    finally:
+        temp_path.unlink()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_projected_manifest_finds_column_tests(sample_manifest, stream):
+    """Test that tests_for_column works with the documented projection."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(sample_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        manifest = ManifestParser().parse(temp_path, stream=stream, fields={"name", "columns"})
+        tests = manifest.tests_for_column("model.my_project.customers", "customer_id")
+        assert [t.unique_id for t in tests] == ["test.my_project.unique_customers_customer_id"]
+    finally:
+        temp_path.unlink()
+
+
+def test_parse_manifest_projection_strict(full_manifest):
+    """Test that projected manifests still pass strict validation."""
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(full_manifest, f)
+        temp_path = Path(f.name)
+
+    try:
+        fields = {"columns"}
+        assert ManifestParser(strict=True).parse(temp_path, fields=fields) == (
+            ManifestParser().parse(temp_path, fields=fields)
+        )
+    finally:
+        temp_path.unlink()
@@ -0,0 +1,106 @@
+"""Tests for per-stage profiling."""
+
+import gc
+import json
+
+from click.testing import CliRunner
+
+from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.cli import cli
+from dbt_guardian.parsers import CatalogParser, ManifestParser
+from dbt_guardian.utils.profiling import Profiler, profiling, stage
+
+
+def test_stage_is_noop_without_profiler():
+    """Test that stages outside a profiling context record nothing."""
+    profiler = Profiler()
+
+    with stage("outside"):
+        pass
+
+    assert profiler.records == []
+
+
+def test_nested_stages_are_recorded():
+    """Test that nested stages record depth, timings and object counts."""
+    profiler = Profiler()
+
+    # A collection mid-stage would shrink gc.get_objects() and the delta with it
+    gc.disable()
+    try:
+        with profiling(profiler), stage("outer"), stage("inner"):
+            keep = [[] for _ in range(1000)]
+    finally:
+        gc.enable()
+
+    records = profiler.ordered_records()
+    assert [(r.name, r.depth) for r in records] == [("outer", 0), ("inner", 1)]
+    outer, inner = records
+    assert outer.wall_seconds >= inner.wall_seconds >= 0
+    assert inner.cpu_seconds >= 0
+    assert inner.peak_rss_bytes > 0
+    assert inner.object_delta > 0
+    assert len(keep) == 1000
+
+
+def test_object_counting_can_be_disabled():
+    """Test that object deltas are skipped when counting is off."""
+    profiler = Profiler(count_objects=False)
+
+    with profiling(profiler), stage("work"):
+        pass
+
+    assert profiler.records[0].object_delta is None
+
+
+def test_parsers_report_decode_and_build(tmp_path):
+    """Test that parsing records separate decode and build stages."""
+    spec = SyntheticProjectSpec(models=10, max_columns=6)
+    manifest_path, catalog_path = SyntheticProjectGenerator(spec).write(tmp_path)
+    profiler = Profiler(count_objects=False)
+
+    with profiling(profiler):
+        ManifestParser().parse(manifest_path)
+        ManifestParser().parse(manifest_path, stream=True)
+        CatalogParser().parse(catalog_path)
+
+    assert [r.name for r in profiler.ordered_records()] == [
+        "manifest.decode",
+        "manifest.build",
+        "manifest.decode_build",
+        "catalog.decode",
+        "catalog.build",
+    ]
+
+
+def test_chrome_trace_export(tmp_path):
+    """Test that the trace is valid Chrome trace-event JSON."""
+    profiler = Profiler()
+    with profiling(profiler), stage("work"):
+        pass
+
+    trace_path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(trace_path)
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert len(events) == 1
+    assert events[0]["name"] == "work"
+    assert events[0]["ph"] == "X"
+    assert events[0]["dur"] >= 0
+    assert "peak_rss_bytes" in events[0]["args"]
+
+
+def test_cli_profile_option(tmp_path):
+    """Test that --profile prints the breakdown and --profile-trace writes a trace."""
+    spec = SyntheticProjectSpec(models=10, max_columns=6)
+    SyntheticProjectGenerator(spec).write(tmp_path)
+    trace_path = tmp_path / "trace.json"
+
+    result = CliRunner().invoke(
+        cli, ["analyze", str(tmp_path), "--no-cache", "--profile-trace", str(trace_path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Profile" in result.output
+    names = {e["name"] for e in json.loads(trace_path.read_text())["traceEvents"]}
+    assert {"manifest.load", "manifest.decode", "catalog.load", "analyze", "render"} <= names
@@ -0,0 +1,106 @@
+"""Tests for dbt_project.yml and schema file parsing."""
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from dbt_guardian.cli import cli
+from dbt_guardian.parsers import ProjectParser
+
+MODELS_YAML = """version: 2
+models:
+  - name: {name}
+    columns:
+      - name: id
+        tests: [unique, {{not_null: {{severity: warn}}}}]
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A project with schema files in custom model paths and in skipped directories."""
+    (tmp_path / "dbt_project.yml").write_text(
+        "name: shop\nmodel-paths: [models, marts]\n"
+    )
+    files = {
+        "models/schema.yml": MODELS_YAML.format(name="orders"),
+        "models/staging/_stg_models.yml": MODELS_YAML.format(name="stg_orders"),
+        "models/staging/sources.yml": "version: 2\nsources:\n  - name: raw\n",
+        "models/staging/empty.yml": "",
+        "models/notes.yaml": "# models: mentioned in a comment only\n",
+        "marts/finance/finance.yaml": MODELS_YAML.format(name="revenue"),
+        "models/target/schema.yml": MODELS_YAML.format(name="compiled"),
+        "models/dbt_packages/pkg/schema.yml": MODELS_YAML.format(name="pkg"),
+        "models/logs/schema.yml": MODELS_YAML.format(name="log"),
+        "models/.hidden/schema.yml": MODELS_YAML.format(name="hidden"),
+        "analyses/schema.yml": MODELS_YAML.format(name="not_a_model_path"),
+    }
+    for relative, content in files.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def test_find_yaml_files_walks_model_paths_only(project):
+    """Test that discovery respects model-paths and skips build/package/log dirs."""
+    found = ProjectParser().find_yaml_files(project)
+    assert [p.relative_to(project).as_posix() for p in found] == [
+        "marts/finance/finance.yaml",
+        "models/notes.yaml",
+        "models/schema.yml",
+        "models/staging/_stg_models.yml",
+        "models/staging/empty.yml",
+        "models/staging/sources.yml",
+    ]
+
+
+def test_find_schema_files_keeps_files_defining_models(project):
+    """Test that any YAML file with a top-level models key counts, whatever its name."""
+    found = ProjectParser().find_schema_files(project)
+    assert [p.relative_to(project).as_posix() for p in found] == [
+        "marts/finance/finance.yaml",
+        "models/schema.yml",
+        "models/staging/_stg_models.yml",
+    ]
+
+
+def test_find_schema_files_without_project_file(project):
+    """Test that a missing dbt_project.yml falls back to models/."""
+    (project / "dbt_project.yml").unlink()
+    found = ProjectParser().find_schema_files(project)
+    assert all(p.relative_to(project).parts[0] == "models" for p in found)
+    assert len(found) == 2
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_load_schema_files(project, jobs):
+    """Test that schema files parse (serially or in workers) keyed by path."""
+    parsed = ProjectParser().load_schema_files(project, jobs=jobs)
+
+    assert list(parsed) == ProjectParser().find_schema_files(project)
+    schema = parsed[project / "models" / "staging" / "_stg_models.yml"]
+    (model,) = schema.models
+    assert model.name == "stg_orders"
+    assert model.columns[0]["name"] == "id"
+
+
+def test_parse_schema_empty_file(project):
+    """Test that an empty file parses to an empty schema instead of crashing."""
+    schema = ProjectParser().parse_schema(project / "models" / "staging" / "empty.yml")
+    assert schema.models == [] and schema.sources == []
+
+
+def test_parse_schema_files_invalid_yaml(project):
+    """Test that invalid YAML in a worker surfaces as a YAML error."""
+    broken = project / "models" / "broken.yml"
+    broken.write_text("models: [unclosed\n")
+    with pytest.raises(yaml.YAMLError):
+        ProjectParser().parse_schema_files([broken, project / "models" / "schema.yml"], jobs=2)
+
+
+def test_info_reports_schema_files(project):
+    """Test that info counts schema files."""
+    result = CliRunner().invoke(cli, ["info", str(project)])
+    assert result.exit_code == 0, result.output
+    assert "Schema files: 3" in result.output
@@ -1,5 +1,7 @@
 """Unit tests for SchemaYamlGenerator."""
 
+import io
+
 import pytest
 import yaml
 
@@ -294,3 +296,114 @@ def test_generate_uses_inferred_parent_table(sample_report):
     # Should use inferred parent table "users", not "TODO_parent_model"
     assert relationship_test["to"] == "ref('users')"
     assert relationship_test["field"] == "id"
+
+
+def test_merge_gaps_keeps_order_and_skips_duplicates(sample_report):
+    """Test that merging interleaved gaps keeps first-gap order without duplicate tests."""
+    schema = {
+        "version": 2,
+        "models": [
+            {"name": "orders", "columns": None},
+            {"name": "users", "columns": [{"name": "email", "tests": ["not_null"]}]},
+        ],
+    }
+    # Same suggestion twice for an existing column and a new one
+    gaps = sample_report.gaps + sample_report.gaps[1:3]
+
+    merged = SchemaYamlGenerator().merge_gaps(schema, gaps)
+
+    orders, users = merged["models"]
+    assert [c["name"] for c in users["columns"]] == ["email", "id"]
+    assert users["columns"][0]["tests"] == ["not_null"]
+    assert users["columns"][1]["tests"] == ["not_null", "unique"]
+    assert [c["name"] for c in orders["columns"]] == ["status", "user_id"]
+    assert [t if isinstance(t, str) else next(iter(t)) for t in orders["columns"][0]["tests"]] == [
+        "not_null",
+        "accepted_values",
+    ]
+
+
+def _dump_whole(report, priority_threshold=5):
+    """Reference output: the document built as one tree and dumped at once."""
+    generator = SchemaYamlGenerator()
+    models = {}
+    for gap in report.gaps:
+        if gap.priority <= priority_threshold:
+            models.setdefault(gap.model_name, []).append(gap)
+    schema = {
+        "version": 2,
+        "models": [
+            {
+                "name": name,
+                "columns": [
+                    {
+                        "name": gap.column_name,
+                        "description": f"[AUTO] {gap.rationale}",
+                        "tests": generator._generate_tests_for_column(gap),
+                    }
+                    for gap in sorted(gaps, key=lambda g: g.column_name)
+                ],
+            }
+            for name, gaps in sorted(models.items())
+        ],
+    }
+    body = yaml.dump(
+        schema, default_flow_style=False, sort_keys=False, allow_unicode=True, width=100
+    )
+    return generator._generate_header(report, priority_threshold) + "\n" + body
+
+
+@pytest.mark.parametrize("priority_threshold", [0, 2, 5])
+def test_streamed_output_matches_single_dump(sample_report, tmp_path, priority_threshold):
+    """Test that streaming model blocks produces the bytes of one yaml.dump."""
+    sample_report.gaps.append(
+        ColumnGap(
+            model_name="wéird: model",
+            column_name='col "quoted"',
+            column_type=None,
+            existing_tests=[],
+            suggested_tests=[TestType.NOT_NULL],
+            priority=1,
+            rationale="A long rationale: with a colon # and a hash " * 4,
+        )
+    )
+    expected = _dump_whole(sample_report, priority_threshold)
+    output_path = tmp_path / "nested" / "schema.yml"
+
+    SchemaYamlGenerator().write_file(sample_report, output_path, priority_threshold)
+
+    assert output_path.read_text() == expected
+    assert SchemaYamlGenerator().generate(sample_report, None, priority_threshold) == expected
+
+
+def test_write_streams_one_model_at_a_time():
+    """Test that write emits each model's block separately instead of one document."""
+    gaps = [
+        ColumnGap(
+            model_name=f"model_{i // 20:03d}",
+            column_name=f"col_{i:04d}_id",
+            column_type="integer",
+            existing_tests=[],
+            suggested_tests=[TestType.NOT_NULL, TestType.RELATIONSHIPS],
+            priority=2,
+            rationale="Foreign key should reference parent table",
+            inferred_parent_table=f"table_{i}",
+        )
+        for i in range(400)
+    ]
+    report = CoverageReport(20, 400, 0, 0.0, gaps)
+
+    class RecordingStream(io.StringIO):
+        sizes = []
+
+        def write(self, text):
+            self.sizes.append(len(text))
+            return super().write(text)
+
+    out = RecordingStream()
+    SchemaYamlGenerator().write(report, out)
+
+    assert out.getvalue() == _dump_whole(report)
+    # Header, version, "models:" and one block per model
+    assert len(out.sizes) == 3 + 20
+    assert max(out.sizes) < len(out.getvalue()) / 10
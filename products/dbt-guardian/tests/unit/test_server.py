@@ -0,0 +1,131 @@
+"""Tests for the analysis server and its client."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dbt_guardian import analyzers
+from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.client import ServerError, main, send_request
+from dbt_guardian.parsers import CatalogParser, ManifestParser
+from dbt_guardian.server import GuardianServer
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A synthetic project with manifest and catalog."""
+    SyntheticProjectGenerator(SyntheticProjectSpec(models=15, max_columns=8)).write(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def server():
+    """A server running in a background thread on a short socket path."""
+    # Unix socket paths are limited to ~100 bytes, so avoid deep pytest tmp dirs
+    socket_dir = Path(tempfile.mkdtemp(prefix="dg-"))
+    server = GuardianServer(socket_dir / "s.sock")
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    socket_dir.rmdir()
+
+
+def test_analyze_matches_direct_analysis(server, project):
+    """Test that the server returns the same report as a local analysis."""
+    manifest = ManifestParser().parse(project / "target" / "manifest.json")
+    catalog = CatalogParser().parse(project / "target" / "catalog.json")
+    expected = analyzers.TestCoverageAnalyzer().analyze(manifest, catalog).to_dict(priority=3)
+
+    request = {"command": "analyze", "project_path": str(project), "priority": 3}
+    assert send_request(request, server.socket_path) == expected
+
+
+def test_reloads_only_when_artifacts_change(server, project):
+    """Test that unchanged artifacts are served from memory."""
+    request = {"command": "analyze", "project_path": str(project)}
+    send_request(request, server.socket_path)
+    send_request(request, server.socket_path)
+    assert server.store.get(project).loads == 1
+
+    manifest_path = project / "target" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    model = manifest["nodes"]["model.synthetic.m0"]
+    model["columns"]["brand_new_id"] = {"name": "brand_new_id"}
+    manifest_path.write_text(json.dumps(manifest))
+    os.utime(manifest_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+    result = send_request(request, server.socket_path)
+    assert server.store.get(project).loads == 2
+    assert any(gap["column_name"] == "brand_new_id" for gap in result["gaps"])
+
+
+def test_reparses_only_the_changed_artifact(server, project):
+    """Test that a catalog change reuses the parsed manifest, and vice versa."""
+    first = server.store.get(project)
+
+    catalog_path = project / "target" / "catalog.json"
+    stamp = time.time_ns() + 10**9
+    os.utime(catalog_path, ns=(stamp, stamp))
+    second = server.store.get(project)
+    assert second.loads == 2
+    assert second.manifest is first.manifest
+    assert second.catalog is not first.catalog
+
+    os.utime(project / "target" / "manifest.json", ns=(stamp, stamp))
+    third = server.store.get(project)
+    assert third.manifest is not second.manifest
+    assert third.catalog is second.catalog
+
+
+def test_generate_tests_writes_output(server, project, tmp_path):
+    """Test that generate-tests writes YAML and reports the suggestion count."""
+    output = tmp_path / "out" / "schema.yml"
+    result = send_request(
+        {
+            "command": "generate-tests",
+            "project_path": str(project),
+            "output": str(output),
+            "priority": 5,
+        },
+        server.socket_path,
+    )
+
+    assert result["output"] == str(output)
+    assert result["suggestions"] > 0
+    assert output.read_text().startswith("#")
+
+
+def test_errors_are_reported(server, tmp_path):
+    """Test that request failures come back as ServerError."""
+    with pytest.raises(ServerError, match="manifest.json not found"):
+        send_request({"command": "analyze", "project_path": str(tmp_path)}, server.socket_path)
+    with pytest.raises(ServerError, match="Unknown command"):
+        send_request({"command": "explode"}, server.socket_path)
+
+
+def test_second_server_refuses_live_socket(server):
+    """Test that a live socket is not stolen by another server."""
+    with pytest.raises(RuntimeError, match="already listening"):
+        GuardianServer(server.socket_path)
+
+
+def test_client_without_server(tmp_path, capsys):
+    """Test that the client reports a missing server."""
+    assert main(["--socket", str(tmp_path / "missing.sock"), "ping"]) == 1
+    assert "No dbt-guardian server" in capsys.readouterr().err
+
+
+def test_client_analyze_output(server, project, capsys):
+    """Test the client's plain-text analyze summary."""
+    assert main(["--socket", str(server.socket_path), "analyze", str(project)]) == 0
+    output = capsys.readouterr().out
+    assert "Models:             15" in output
+    assert "Coverage:" in output
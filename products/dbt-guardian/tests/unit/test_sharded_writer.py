@@ -0,0 +1,139 @@
+"""Tests for per-directory sharded schema suggestions."""
+
+import json
+import stat
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from dbt_guardian import analyzers
+from dbt_guardian.benchmarks import SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.cli import cli
+from dbt_guardian.generators import SchemaYamlGenerator, ShardedSchemaWriter
+from dbt_guardian.parsers import CatalogParser, ManifestParser
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A synthetic project whose models live in models/layer_0 .. layer_4."""
+    SyntheticProjectGenerator(SyntheticProjectSpec(models=30, max_columns=8)).write(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def analyzed(project):
+    target = project / "target"
+    manifest = ManifestParser().parse(target / "manifest.json")
+    catalog = CatalogParser().parse(target / "catalog.json")
+    return manifest, analyzers.TestCoverageAnalyzer().analyze(manifest, catalog)
+
+
+def _suggested_columns(path):
+    schema = yaml.safe_load(path.read_text())
+    return {(m["name"], c["name"]) for m in schema["models"] for c in m["columns"]}
+
+
+def test_manifest_parser_reads_original_file_path(analyzed):
+    """Test that models carry their original_file_path."""
+    manifest, _ = analyzed
+    assert manifest.models["model.synthetic.m7"].original_file_path == "models/layer_2/m7.sql"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_shards_cover_every_gap_once(project, analyzed, jobs):
+    """Test that shards split the single-file output by model directory."""
+    manifest, report = analyzed
+    files = ShardedSchemaWriter(jobs=jobs).write(report, manifest, project, priority_threshold=3)
+
+    assert [f.path for f in files] == [
+        f"models/layer_{i}/schema_suggestions.yml" for i in range(5)
+    ]
+    sharded = set()
+    for shard_file in files:
+        columns = _suggested_columns(project / shard_file.path)
+        layer = shard_file.path.split("/")[1]
+        for model_name, _ in columns:
+            assert manifest.models[f"model.synthetic.{model_name}"].original_file_path.startswith(
+                f"models/{layer}/"
+            )
+        assert sharded.isdisjoint(columns)
+        sharded |= columns
+
+    single = yaml.safe_load(SchemaYamlGenerator().generate(report, priority_threshold=3))
+    assert sharded == {(m["name"], c["name"]) for m in single["models"] for c in m["columns"]}
+
+    shard_manifest = json.loads((project / "target" / "dbt_guardian_shards.json").read_text())
+    assert [f["path"] for f in shard_manifest["files"]] == [f.path for f in files]
+    assert sum(f["gaps"] for f in shard_manifest["files"]) == sum(
+        1 for g in report.gaps if g.priority <= 3
+    )
+
+    mode = stat.S_IMODE((project / files[0].path).stat().st_mode)
+    assert mode == 0o644
+    assert not list(project.rglob(".tmp-*"))
+
+
+def test_stale_shards_are_removed(project, analyzed):
+    """Test that a rerun deletes shards that no longer have suggestions."""
+    manifest, report = analyzed
+    writer = ShardedSchemaWriter()
+    first = writer.write(report, manifest, project)
+    unrelated = project / "models" / "layer_0" / "schema.yml"
+    unrelated.write_text("version: 2\n")
+
+    kept = [g for g in report.gaps if g.model_name in first[0].models]
+    report.gaps = kept
+    second = writer.write(report, manifest, project)
+
+    assert [f.path for f in second] == [first[0].path]
+    assert not (project / first[1].path).exists()
+    assert unrelated.exists()
+
+
+def test_models_without_path_go_to_root(analyzed, tmp_path):
+    """Test that gaps of models lacking original_file_path land at the root."""
+    manifest, report = analyzed
+    for model in manifest.models.values():
+        model.original_file_path = None
+    files = ShardedSchemaWriter().write(report, manifest, tmp_path)
+    assert [f.path for f in files] == ["schema_suggestions.yml"]
+
+
+def test_root_model_wins_over_package_model(analyzed):
+    """Test that a package model of the same name never moves a root model's shard."""
+    manifest, report = analyzed
+    root = manifest.models["model.synthetic.m7"]
+    package = root.model_copy(
+        update={
+            "unique_id": "model.some_package.m7",
+            "original_file_path": "dbt_packages/some_package/models/m7.sql",
+        }
+    )
+    for models in (
+        {package.unique_id: package, **manifest.models},
+        {**manifest.models, package.unique_id: package},
+    ):
+        manifest.models = models
+        shards = ShardedSchemaWriter().shard(report, manifest, priority_threshold=10)
+        m7_shards = [
+            path for path, gaps in shards.items() if any(g.model_name == "m7" for g in gaps)
+        ]
+        assert m7_shards == ["models/layer_2/schema_suggestions.yml"]
+
+
+def test_generate_tests_shard(project):
+    """Test the generate-tests --shard option."""
+    result = CliRunner().invoke(cli, ["generate-tests", str(project), "--shard", "-j", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Generated 5 suggestion files" in result.output
+    assert (project / "models" / "layer_3" / "schema_suggestions.yml").exists()
+    assert not (project / "schema_suggestions.yml").exists()
+
+
+def test_generate_tests_shard_rejects_output(project, tmp_path):
+    """Test that --shard cannot be combined with --output."""
+    result = CliRunner().invoke(
+        cli, ["generate-tests", str(project), "--shard", "-o", str(tmp_path / "x.yml")]
+    )
+    assert result.exit_code == 2
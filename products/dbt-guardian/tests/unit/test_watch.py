@@ -0,0 +1,80 @@
+"""Tests for ArtifactWatcher."""
+
+import os
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from dbt_guardian.cli import cli
+from dbt_guardian.watch import ArtifactWatcher
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A project with a manifest and one schema file."""
+    (tmp_path / "target").mkdir()
+    (tmp_path / "target" / "manifest.json").write_text("{}")
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "schema.yml").write_text("version: 2\n")
+    return tmp_path
+
+
+def _touch(path, content):
+    path.write_text(content)
+    # Force a distinct mtime even on filesystems with coarse timestamps
+    stamp = time.time_ns() + 10**9
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_no_change_times_out(project):
+    """Test that an idle project reports nothing."""
+    watcher = ArtifactWatcher(project, interval=0.01, debounce=0.02)
+
+    assert watcher.wait_for_change(timeout=0.05) is None
+
+
+def test_reports_changed_added_and_removed_files(project):
+    """Test that modified, new and deleted files are all reported."""
+    watcher = ArtifactWatcher(project, interval=0.01, debounce=0.02)
+
+    _touch(project / "target" / "manifest.json", '{"nodes": {}}')
+    (project / "target" / "catalog.json").write_text("{}")
+    (project / "models" / "schema.yml").unlink()
+
+    assert watcher.wait_for_change(timeout=1) == sorted(
+        [
+            project / "models" / "schema.yml",
+            project / "target" / "catalog.json",
+            project / "target" / "manifest.json",
+        ]
+    )
+    assert watcher.wait_for_change(timeout=0.05) is None
+
+
+def test_debounces_bursts(project):
+    """Test that a burst of writes is reported once, after it settles."""
+    watcher = ArtifactWatcher(project, interval=0.01, debounce=0.2)
+    manifest = project / "target" / "manifest.json"
+
+    def burst():
+        for i in range(5):
+            _touch(manifest, "{}" + " " * i)
+            time.sleep(0.03)
+
+    writer = threading.Thread(target=burst)
+    writer.start()
+    assert watcher.wait_for_change(timeout=1) == [manifest]
+    writer.join()
+    assert watcher.wait_for_change(timeout=0.05) is None
+
+
+@pytest.mark.parametrize(
+    "option", [["--stream"], ["--no-cache"], ["-j", "2"], ["--profile"], ["--incremental"]]
+)
+def test_analyze_watch_rejects_ignored_options(project, option):
+    """Test that options --watch would silently ignore are refused."""
+    result = CliRunner().invoke(cli, ["analyze", str(project), "--watch", *option])
+    assert result.exit_code == 2
+    assert "--watch cannot be combined with" in result.output
@@ -0,0 +1,134 @@
+"""Tests for YAML backend selection and backend-independent output."""
+
+import pytest
+import yaml
+
+from dbt_guardian import analyzers
+from dbt_guardian.benchmarks import BenchmarkRunner, SyntheticProjectGenerator, SyntheticProjectSpec
+from dbt_guardian.generators import SchemaYamlGenerator
+from dbt_guardian.parsers import CatalogParser, ManifestParser, ProjectParser
+from dbt_guardian.utils import yaml_io
+from dbt_guardian.utils.yaml_io import BACKEND_ENV_VAR, available_backends, get_backend
+
+libyaml = pytest.mark.skipif(
+    "libyaml" not in available_backends(), reason="PyYAML built without libyaml"
+)
+
+# Strings each emitter escapes or folds its own way
+AWKWARD_TEXT = [
+    "tab\there",
+    "bell\x07",
+    "nel\x85line",
+    "line\u2028separator",
+    "\ufeffbom",
+    "emoji \U0001f389",
+    "trailing newline\n",
+    "multi\nline\n\ntext",
+    "x" * 150 + " " + "y" * 30,
+]
+
+
+@pytest.fixture
+def report(tmp_path):
+    SyntheticProjectGenerator(SyntheticProjectSpec(models=20, max_columns=8)).write(tmp_path)
+    target = tmp_path / "target"
+    return analyzers.TestCoverageAnalyzer().analyze(
+        ManifestParser().parse(target / "manifest.json"),
+        CatalogParser().parse(target / "catalog.json"),
+    )
+
+
+def test_auto_prefers_libyaml():
+    """Test that auto resolves to libyaml when it is installed."""
+    assert get_backend("auto").name == available_backends()[0]
+    assert get_backend("python").dumper is yaml.SafeDumper
+
+
+def test_backend_from_environment(monkeypatch, tmp_path):
+    """Test that the environment variable selects the backend."""
+    monkeypatch.setenv(BACKEND_ENV_VAR, "python")
+    assert get_backend().name == "python"
+
+    schema = tmp_path / "schema.yml"
+    schema.write_text("version: 2\n")
+    monkeypatch.setenv(BACKEND_ENV_VAR, "nope")
+    with pytest.raises(ValueError, match="Unknown YAML backend"):
+        ProjectParser().parse_schema(schema)
+
+
+def test_missing_libyaml(monkeypatch):
+    """Test that auto falls back and forcing libyaml fails clearly without it."""
+    monkeypatch.setattr(yaml_io, "_LIBYAML", None)
+    assert available_backends() == ("python",)
+    assert get_backend("auto").name == "python"
+    with pytest.raises(ValueError, match="not installed"):
+        get_backend("libyaml")
+
+
+@libyaml
+@pytest.mark.parametrize("text", AWKWARD_TEXT)
+def test_dump_identical_for_awkward_text(text):
+    """Test that both backends emit the same bytes for escaped scalars."""
+    data = {"models": [{"name": "m", "description": text, "columns": [{"name": text}]}]}
+    dumped = yaml_io.dump(data, backend="libyaml")
+    assert dumped == yaml_io.dump(data, backend="python")
+    assert yaml_io.safe_load(dumped, "libyaml") == yaml_io.safe_load(dumped, "python")
+
+
+@libyaml
+@pytest.mark.parametrize("char", ["a", "'", "\u00e9", "\u20ac"])  # 1, 1 (quoted), 2, 3 bytes
+def test_dump_identical_for_long_and_empty_keys(char):
+    """Test that both backends emit and round-trip keys around the plain-key limits."""
+    for length in range(0, 140):
+        key = char * length
+        data = {"models": [{"name": "m", "meta": {key: 1}}], key: ""}
+        dumped = yaml_io.dump(data, backend="libyaml")
+        assert dumped == yaml_io.dump(data, backend="python"), f"{length} x {char!r}"
+        assert yaml_io.safe_load(dumped, "libyaml") == data
+        assert yaml_io.safe_load(dumped, "python") == data
+
+
+@libyaml
+def test_schema_corpus_round_trips_identically(tmp_path):
+    """Test that both backends load the same documents and dump the same bytes."""
+    spec = SyntheticProjectSpec(models=15, test_density=0.6)
+    for path in SyntheticProjectGenerator(spec).write_schema_files(tmp_path):
+        text = path.read_text()
+        document = yaml_io.safe_load(text, "python")
+        assert yaml_io.safe_load(text, "libyaml") == document
+        assert yaml_io.dump(document, backend="libyaml") == text
+        assert ProjectParser("libyaml").parse_schema(path) == ProjectParser(
+            "python"
+        ).parse_schema(path)
+
+
+@libyaml
+def test_generator_output_identical(report, tmp_path):
+    """Test that generated and merged schema.yml are the same with either backend."""
+    outputs = {
+        backend: SchemaYamlGenerator(backend).generate(report, priority_threshold=5)
+        for backend in available_backends()
+    }
+    assert outputs["libyaml"] == outputs["python"]
+
+    existing = tmp_path / "schema.yml"
+    existing.write_text(
+        yaml_io.dump(
+            {"version": 2, "models": [{"name": "m1", "description": AWKWARD_TEXT[3]}]}
+        )
+    )
+    merged = {
+        backend: SchemaYamlGenerator(backend).generate_incremental(report, existing)
+        for backend in available_backends()
+    }
+    assert merged["libyaml"] == merged["python"]
+
+
+def test_benchmark_reports_each_backend():
+    """Test that the YAML benchmark loads and dumps with every installed backend."""
+    result = BenchmarkRunner(repeat=1, measure_memory=False).run_yaml_backends(files=5)
+    assert result.files == 5
+    assert result.total_bytes > 0
+    assert [stage.name for stage in result.stages] == [
+        f"yaml.{op}.{backend}" for backend in available_backends() for op in ("load", "dump")
+    ]